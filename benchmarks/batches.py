@@ -0,0 +1,87 @@
+"""Time the batch and parallel paths over a synthetic corpus.
+
+Run from the repository root:
+
+    PYTHONPATH=. python benchmarks/batches.py
+    PYTHONPATH=. python benchmarks/batches.py --corpus corpus.txt --workers 1,4
+
+The corpus is read from a file written by corpus.py, or generated with the
+default CorpusSpec and --count identifiers, so every run converts the same
+strings. Each benchmark converts the whole corpus with convert_many(), and
+with convert_lines() as the command line interface does, once per number
+of workers.
+"""
+import argparse
+import sys
+import timeit
+from functools import partial
+
+from caseconverter import configure_cache, convert_many
+from caseconverter.stream import convert_lines
+
+from conversions import split_names
+from corpus import CorpusSpec, generate, read
+
+
+def benchmarks(corpus, case, workers):
+    """Yield the name and function of every benchmark.
+
+    :return: A generator of (name, function) tuples.
+    """
+    lines = [s + "\n" for s in corpus]
+
+    def stream(n):
+        def run():
+            return list(convert_lines(lines, case, n))
+
+        return run
+
+    for n in workers:
+        yield "convert_many/{}".format(n), partial(convert_many, corpus, case, n)
+        yield "convert_lines/{}".format(n), stream(n)
+
+
+def parse_args(argv):
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--corpus", metavar="PATH", help="A corpus to convert.")
+    parser.add_argument(
+        "--count",
+        type=int,
+        default=100000,
+        help="Identifiers generated without --corpus.",
+    )
+    parser.add_argument("--case", default="snake", help="The case to convert to.")
+    parser.add_argument(
+        "--workers",
+        type=lambda s: [int(n) for n in split_names(s)],
+        default=[1, 2, 4],
+        help="Numbers of worker processes.",
+    )
+    parser.add_argument("--repeat", type=int, default=3, help="Timed runs.")
+    return parser.parse_args(argv)
+
+
+def main(argv=None):
+    args = parse_args(argv)
+
+    # Cached results would time dict lookups rather than conversions.
+    configure_cache(0)
+
+    if args.corpus:
+        corpus = read(args.corpus)
+    else:
+        corpus = generate(CorpusSpec(args.count))
+
+    for name, func in benchmarks(corpus, args.case, args.workers):
+        best = min(timeit.repeat(func, number=1, repeat=args.repeat))
+        print(
+            "{:<20} {:>10.1f} ms {:>12.0f} strings/s".format(
+                name, best * 1000, len(corpus) / best
+            )
+        )
+
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
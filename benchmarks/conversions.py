@@ -0,0 +1,227 @@
+"""Time every case function over every input shape and engine.
+
+Run from the repository root:
+
+    PYTHONPATH=. python benchmarks/conversions.py
+    PYTHONPATH=. python benchmarks/conversions.py --save benchmarks/baseline.json
+    PYTHONPATH=. python benchmarks/conversions.py --compare benchmarks/baseline.json
+
+Each benchmark converts the strings of one shape with one case function and
+engine. Results are reported as strings converted per second and
+nanoseconds per input character, the best of several repeats. With
+--compare the script exits with status 1 when a benchmark is slower than
+its baseline by more than --threshold.
+"""
+import argparse
+import json
+import platform
+import sys
+import time
+from functools import partial
+
+from caseconverter import (
+    alternatingcase,
+    camelcase,
+    cobolcase,
+    flatcase,
+    kebabcase,
+    macrocase,
+    pascalcase,
+    snakecase,
+    titlecase,
+    configure_cache,
+)
+from caseconverter.engine import ENGINES
+
+from corpus import read
+from inputs import CONVERTED, SHAPES, converted
+
+# The shape of the strings read with --corpus.
+CORPUS = "corpus"
+
+FUNCTIONS = {
+    "alternating": alternatingcase,
+    "camel": camelcase,
+    "cobol": cobolcase,
+    "flat": flatcase,
+    "kebab": kebabcase,
+    "macro": macrocase,
+    "pascal": pascalcase,
+    "snake": snakecase,
+    "title": titlecase,
+}
+
+# A benchmark is worse than its baseline when its ns/char, or peak memory,
+# grows by more than this fraction.
+DEFAULT_THRESHOLD = 0.25
+
+
+def measure(convert, strings, repeat, min_time):
+    """Time converting a list of strings.
+
+    The strings are converted as many times as it takes to run for at least
+    min_time, and the best of repeat such runs is kept.
+
+    :param convert: A case function.
+    :param strings: The strings to convert.
+    :param repeat: Number of timed runs.
+    :param min_time: Minimum duration of a run, in seconds.
+    :return: Strings converted per second and nanoseconds per character.
+    :rtype: dict
+    """
+    chars = sum(len(s) for s in strings)
+
+    def run(number):
+        start = time.perf_counter()
+        for _ in range(number):
+            for s in strings:
+                convert(s)
+        return time.perf_counter() - start
+
+    number = 1
+    while run(number) < min_time:
+        number *= 2
+
+    best = min(run(number) for _ in range(repeat)) / number
+
+    return {
+        "ops_per_sec": round(len(strings) / best),
+        "ns_per_char": round(best * 1e9 / chars, 2),
+    }
+
+
+def benchmarks(cases, shapes, engines, inputs=SHAPES):
+    """Yield the name, function and strings of every selected benchmark.
+
+    :param inputs: The strings of every shape but CONVERTED.
+    :return: A generator of (name, convert, strings) tuples, the name being
+        case/shape/engine.
+    """
+    for case in cases:
+        function = FUNCTIONS[case]
+        for engine in engines:
+            convert = partial(function, engine=engine)
+            for shape in shapes:
+                if shape == CONVERTED:
+                    strings = converted(function)
+                else:
+                    strings = inputs[shape]
+
+                yield "{}/{}/{}".format(case, shape, engine), convert, strings
+
+
+def compare(results, baseline, threshold, metric="ns_per_char"):
+    """Find the benchmarks worse than their baseline.
+
+    Benchmarks missing from either side are ignored.
+
+    :param results: The "results" of this run.
+    :param baseline: The "results" of the baseline run.
+    :param threshold: See DEFAULT_THRESHOLD.
+    :param metric: The result compared, lower being better.
+    :return: (name, baseline metric, metric) tuples.
+    :rtype: list
+    """
+    regressions = []
+
+    for name, result in results.items():
+        before = baseline.get(name)
+        if before is None:
+            continue
+
+        if result[metric] > before[metric] * (1 + threshold):
+            regressions.append((name, before[metric], result[metric]))
+
+    return regressions
+
+
+def split_names(names):
+    return names.split(",")
+
+
+def parse_args(argv):
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument(
+        "--case", type=split_names, default=list(FUNCTIONS), help="Cases to time."
+    )
+    parser.add_argument(
+        "--shape",
+        type=split_names,
+        default=list(SHAPES) + [CONVERTED],
+        help="Input shapes to time.",
+    )
+    parser.add_argument(
+        "--engine", type=split_names, default=list(ENGINES), help="Engines to time."
+    )
+    parser.add_argument(
+        "--corpus",
+        metavar="PATH",
+        help="Also time the strings of a corpus written by corpus.py.",
+    )
+    parser.add_argument("--repeat", type=int, default=5, help="Timed runs.")
+    parser.add_argument(
+        "--min-time", type=float, default=0.02, help="Minimum seconds per run."
+    )
+    parser.add_argument("--save", metavar="PATH", help="Write results as JSON.")
+    parser.add_argument(
+        "--compare", metavar="PATH", help="Fail on regressions against a baseline."
+    )
+    parser.add_argument(
+        "--threshold",
+        type=float,
+        default=DEFAULT_THRESHOLD,
+        help="Allowed slowdown, as a fraction of the baseline.",
+    )
+    return parser.parse_args(argv)
+
+
+def main(argv=None):
+    args = parse_args(argv)
+
+    # Cached results would time dict lookups rather than conversions.
+    configure_cache(0)
+
+    inputs = SHAPES
+    if args.corpus:
+        inputs = dict(SHAPES, **{CORPUS: read(args.corpus)})
+        args.shape.append(CORPUS)
+
+    results = {}
+    selected = benchmarks(args.case, args.shape, args.engine, inputs)
+    for name, convert, strings in selected:
+        result = results[name] = measure(convert, strings, args.repeat, args.min_time)
+        print(
+            "{:<36} {:>12,} strings/s {:>9.1f} ns/char".format(
+                name, result["ops_per_sec"], result["ns_per_char"]
+            )
+        )
+
+    if args.save:
+        with open(args.save, "w") as f:
+            json.dump(
+                {"python": platform.python_version(), "results": results},
+                f,
+                indent=2,
+                sort_keys=True,
+            )
+
+    if args.compare:
+        with open(args.compare) as f:
+            baseline = json.load(f)
+
+        regressions = compare(results, baseline["results"], args.threshold)
+        for name, before, after in regressions:
+            print(
+                "REGRESSION {}: {:.1f} => {:.1f} ns/char ({:+.0%})".format(
+                    name, before, after, after / before - 1
+                )
+            )
+
+        if regressions:
+            return 1
+
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -0,0 +1,320 @@
+"""Generate reproducible corpora of synthetic identifiers.
+
+Run from the repository root:
+
+    PYTHONPATH=. python benchmarks/corpus.py corpus.txt --count 100000 --seed 1
+
+Identifiers are made of common words, acronyms and non-ASCII words written
+in a mix of cases, with digits placed at the start, inside or at the end of
+an identifier and a share of repeated identifiers. The same CorpusSpec
+always produces the same corpus: randomness only comes from
+random.Random.random(), which is reproducible across platforms and Python
+versions for a given seed.
+
+Corpora are written one identifier per line, so they can be read back with
+read(), fed to the command line interface or to convert_lines().
+"""
+import argparse
+import random
+import sys
+from collections import namedtuple
+
+WORDS = [
+    "account",
+    "address",
+    "amount",
+    "balance",
+    "cache",
+    "client",
+    "config",
+    "count",
+    "created",
+    "customer",
+    "date",
+    "default",
+    "email",
+    "error",
+    "event",
+    "file",
+    "first",
+    "get",
+    "handler",
+    "index",
+    "invoice",
+    "is",
+    "item",
+    "key",
+    "last",
+    "limit",
+    "list",
+    "max",
+    "message",
+    "name",
+    "number",
+    "order",
+    "page",
+    "parse",
+    "phone",
+    "request",
+    "response",
+    "retry",
+    "server",
+    "set",
+    "size",
+    "status",
+    "timeout",
+    "total",
+    "type",
+    "updated",
+    "user",
+    "value",
+]
+
+ACRONYMS = ["API", "HTTP", "ID", "IP", "JSON", "SQL", "TCP", "URL", "UUID", "XML"]
+
+UNICODE_WORDS = [
+    "café",
+    "données",
+    "école",
+    "größe",
+    "naïve",
+    "straße",
+    "über",
+    "данные",
+    "привет",
+    "名前",
+]
+
+# Cases identifiers are written in, with their weights.
+STYLES = (("snake", 4), ("camel", 3), ("pascal", 1), ("kebab", 1), ("macro", 1))
+
+# Number of words per identifier, with their weights.
+LENGTHS = ((1, 2), (2, 4), (3, 3), (4, 2), (6, 1))
+
+# Where digits are placed, as in "0helloWorld", "hell9oWorld" and
+# "helloWorld0".
+DIGIT_PLACES = ("start", "inside", "end")
+
+CorpusSpec = namedtuple(
+    "CorpusSpec",
+    [
+        "count",
+        "seed",
+        "styles",
+        "lengths",
+        "acronyms",
+        "digits",
+        "unicode",
+        "duplicates",
+    ],
+    defaults=(10000, 0, STYLES, LENGTHS, 0.1, 0.1, 0.05, 0.3),
+)
+CorpusSpec.__doc__ = """Description of a corpus.
+
+:param count: Number of identifiers. Defaults to 10000.
+:param seed: Seed of the random generator. Defaults to 0.
+:param styles: (case, weight) pairs, see STYLES.
+:param lengths: (words, weight) pairs, see LENGTHS.
+:param acronyms: Share of words that are acronyms. Defaults to 0.1.
+:param digits: Share of identifiers with a digit. Defaults to 0.1.
+:param unicode: Share of words that are not ASCII. Defaults to 0.05.
+:param duplicates: Share of identifiers repeating an earlier identifier.
+    Defaults to 0.3.
+"""
+
+
+def pick(rng, items):
+    """Choose an item.
+
+    :type rng: random.Random
+    :type items: list
+    """
+    return items[int(rng.random() * len(items))]
+
+
+def pick_weighted(rng, pairs):
+    """Choose the first of an (item, weight) pair.
+
+    :type rng: random.Random
+    :type pairs: tuple
+    """
+    x = rng.random() * sum(weight for _, weight in pairs)
+
+    for item, weight in pairs:
+        x -= weight
+        if x < 0:
+            return item
+
+    return pairs[-1][0]
+
+
+def words(rng, spec):
+    """Choose the words of an identifier.
+
+    :type rng: random.Random
+    :type spec: CorpusSpec
+    :rtype: list
+    """
+    chosen = []
+
+    for _ in range(pick_weighted(rng, spec.lengths)):
+        x = rng.random()
+        if x < spec.acronyms:
+            chosen.append(pick(rng, ACRONYMS))
+        elif x < spec.acronyms + spec.unicode:
+            chosen.append(pick(rng, UNICODE_WORDS))
+        else:
+            chosen.append(pick(rng, WORDS))
+
+    return chosen
+
+
+def render(style, words):
+    """Write words in a case.
+
+    Acronyms keep their case in camel and pascal case.
+
+    :param style: A case of STYLES.
+    :type style: str
+    :type words: list
+    :rtype: str
+    """
+    if style == "snake":
+        return "_".join(word.lower() for word in words)
+
+    if style == "kebab":
+        return "-".join(word.lower() for word in words)
+
+    if style == "macro":
+        return "_".join(word.upper() for word in words)
+
+    capitalized = [word if word.isupper() else word.capitalize() for word in words]
+    if style == "camel" and not words[0].isupper():
+        capitalized[0] = words[0].lower()
+
+    return "".join(capitalized)
+
+
+def add_digit(rng, s):
+    """Place a digit in a string.
+
+    :type rng: random.Random
+    :type s: str
+    :rtype: str
+    """
+    digit = pick(rng, "0123456789")
+    place = pick(rng, DIGIT_PLACES)
+
+    if place == "start":
+        return digit + s
+
+    if place == "end":
+        return s + digit
+
+    i = 1 + int(rng.random() * (len(s) - 1)) if len(s) > 1 else len(s)
+    return s[:i] + digit + s[i:]
+
+
+def generate(spec=CorpusSpec()):
+    """Generate the identifiers of a corpus.
+
+    :type spec: CorpusSpec
+    :rtype: list
+    """
+    rng = random.Random(spec.seed)
+    corpus = []
+
+    for _ in range(spec.count):
+        if corpus and rng.random() < spec.duplicates:
+            corpus.append(pick(rng, corpus))
+            continue
+
+        s = render(pick_weighted(rng, spec.styles), words(rng, spec))
+        if rng.random() < spec.digits:
+            s = add_digit(rng, s)
+
+        corpus.append(s)
+
+    return corpus
+
+
+def write(path, corpus):
+    """Write a corpus, one identifier per line.
+
+    :type path: str
+    :type corpus: list
+    """
+    with open(path, "w", encoding="utf-8", newline="\n") as f:
+        for s in corpus:
+            f.write(s)
+            f.write("\n")
+
+
+def read(path):
+    """Read a corpus written by write().
+
+    :type path: str
+    :rtype: list
+    """
+    with open(path, encoding="utf-8", newline="\n") as f:
+        return f.read().splitlines()
+
+
+def weights(s):
+    """Parse "name=weight,..." into (name, weight) pairs.
+
+    Names that are integers, such as lengths, are converted to int.
+
+    :rtype: tuple
+    """
+    pairs = []
+
+    for part in s.split(","):
+        name, _, weight = part.partition("=")
+        pairs.append((int(name) if name.isdigit() else name, float(weight or 1)))
+
+    return tuple(pairs)
+
+
+def parse_args(argv):
+    defaults = CorpusSpec()
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("output", help="The file to write.")
+    parser.add_argument("--count", type=int, default=defaults.count)
+    parser.add_argument("--seed", type=int, default=defaults.seed)
+    parser.add_argument(
+        "--styles",
+        type=weights,
+        default=defaults.styles,
+        help="Cases and weights, e.g. snake=4,camel=1.",
+    )
+    parser.add_argument(
+        "--lengths",
+        type=weights,
+        default=defaults.lengths,
+        help="Words per identifier and weights, e.g. 1=1,3=2.",
+    )
+    for share in ("acronyms", "digits", "unicode", "duplicates"):
+        parser.add_argument("--" + share, type=float, default=getattr(defaults, share))
+    return parser.parse_args(argv)
+
+
+def main(argv=None):
+    args = parse_args(argv)
+    spec = CorpusSpec(
+        args.count,
+        args.seed,
+        args.styles,
+        args.lengths,
+        args.acronyms,
+        args.digits,
+        args.unicode,
+        args.duplicates,
+    )
+
+    write(args.output, generate(spec))
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
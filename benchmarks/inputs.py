@@ -0,0 +1,71 @@
+"""Input shapes shared by the benchmarks.
+
+Each shape is a list of strings converted as one batch, so a shape is timed
+over strings of similar form rather than a single string.
+"""
+
+SHORT = [
+    "userId",
+    "created_at",
+    "Name",
+    "x",
+    "fooBar",
+    "account-id",
+    "isActive",
+    "ORDER_TOTAL",
+    "ShippingAddress",
+    "phone number",
+]
+
+SENTENCES = [
+    "The quick brown fox jumps over the lazy dog and keeps running far away",
+    "getHTTPResponseCode returns the status of the lastRequest sent by the client",
+    "Lorem ipsum dolor sit amet consectetur adipiscing elit sed do eiusmod tempor",
+    "a_very_long_snake_case_identifier_that_goes_on_and_on_for_quite_a_while_now",
+    "someDeeplyNestedConfigurationValueThatWasGeneratedByAnOverlyVerboseFramework",
+]
+
+UPPER = [
+    "HELLO_WORLD",
+    "USER ID",
+    "MAX-RETRY-COUNT",
+    "HTTP",
+    "DEFAULT_CONNECTION_TIMEOUT_SECONDS",
+]
+
+PUNCTUATION = [
+    "Hello, world!",
+    "what's up? (nothing much...)",
+    "key.name/with:many;separators",
+    r"the quick !b@rown fo%x jumped over the laZy Do'G",
+    "[user].[id] = #42 & @name",
+]
+
+UNICODE = [
+    "écoleFrançaise",
+    "straßeNamen",
+    "ÜberGrößeWert",
+    "привет мир",
+    "日本語のテキストTest",
+]
+
+SHAPES = {
+    "short": SHORT,
+    "sentence": SENTENCES,
+    "upper": UPPER,
+    "punctuation": PUNCTUATION,
+    "unicode": UNICODE,
+}
+
+# Strings already in the case they are converted to, produced per case by
+# converting every other shape.
+CONVERTED = "converted"
+
+
+def converted(convert):
+    """Convert every string of every shape.
+
+    :param convert: A case function.
+    :rtype: list
+    """
+    return [convert(s) for strings in SHAPES.values() for s in strings]
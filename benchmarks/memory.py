@@ -0,0 +1,240 @@
+"""Measure the memory used by converters, conversions and batches.
+
+Run from the repository root:
+
+    PYTHONPATH=. python benchmarks/memory.py
+    PYTHONPATH=. python benchmarks/memory.py --save benchmarks/memory.json
+    PYTHONPATH=. python benchmarks/memory.py --compare benchmarks/memory.json
+
+Every benchmark runs once under tracemalloc, after a warm up run so caches
+filled on first use are not counted. It reports the peak memory allocated
+while it runs and the memory blocks, and bytes, still allocated when it
+returns, its result included:
+
+    construct/CASE/ENGINE   constructing a converter.
+    convert/CASE/ENGINE     the largest of converting each string of every
+                            input shape on its own.
+    batch/CASE/ENGINE       convert_many() over every input shape, repeated,
+                            or over the strings of --corpus.
+    large/CASE/ENGINE       converting one large string at once.
+    large/CASE/chunked      convert_large(), discarding the output.
+    large/CASE/file         convert_file() from and to files on disk.
+
+The chunked and file benchmarks should stay bounded by the window size
+whatever --size is. With --compare the script exits with status 1 when a
+peak grows by more than --threshold.
+"""
+import argparse
+import gc
+import json
+import os
+import platform
+import sys
+import tempfile
+import tracemalloc
+from functools import partial
+
+from caseconverter import CASES, configure_cache, convert_many
+from caseconverter.chunked import convert_file, convert_large
+from caseconverter.engine import ENGINES
+
+from conversions import DEFAULT_THRESHOLD, FUNCTIONS, compare, split_names
+from corpus import read
+from inputs import SENTENCES, SHAPES
+
+# Characters in the large string.
+DEFAULT_SIZE = 1 << 18
+
+# Copies of every input shape in a batch.
+BATCH_COPIES = 100
+
+
+def trace(func):
+    """Run a function under tracemalloc.
+
+    :return: The peak bytes allocated, and the blocks and bytes still
+        allocated when the function returns.
+    :rtype: dict
+    """
+    gc.collect()
+    tracemalloc.start()
+    try:
+        result = func()
+        retained, peak = tracemalloc.get_traced_memory()
+        snapshot = tracemalloc.take_snapshot()
+    finally:
+        tracemalloc.stop()
+
+    return {
+        "peak_bytes": peak,
+        "retained_blocks": sum(stat.count for stat in snapshot.statistics("filename")),
+        "retained_bytes": retained,
+    }
+
+
+def measure(func):
+    """Warm up and trace a function.
+
+    :rtype: dict
+    """
+    func()
+    return trace(func)
+
+
+def largest(results):
+    """Combine results, keeping the largest of each value.
+
+    :rtype: dict
+    """
+    return {key: max(result[key] for result in results) for key in results[0]}
+
+
+def large_string(size):
+    """Build a string of mixed sentences.
+
+    :type size: int
+    :rtype: str
+    """
+    text = " ".join(SENTENCES)
+    return (text * (size // len(text) + 1))[:size]
+
+
+def benchmarks(cases, engines, size, path, batch=None):
+    """Yield the name and function of every selected benchmark.
+
+    :param path: A file holding the large string.
+    :param batch: The strings converted by batch benchmarks. Defaults to
+        BATCH_COPIES copies of every input shape.
+    :return: A generator of (name, function) tuples.
+    """
+    strings = [s for shape in SHAPES.values() for s in shape]
+    if batch is None:
+        batch = strings * BATCH_COPIES
+    large = large_string(size)
+
+    def each(function, engine):
+        def run():
+            return [trace(partial(function, s, engine=engine)) for s in strings]
+
+        return run
+
+    def discard(case):
+        def run():
+            for _ in convert_large(large, case):
+                pass
+
+        return run
+
+    def write_file(case):
+        def run():
+            with open(path) as source, open(os.devnull, "w") as target:
+                convert_file(source, target, case)
+
+        return run
+
+    for case in cases:
+        cls = CASES[case]
+        function = FUNCTIONS[case]
+
+        for engine in engines:
+            name = "{}/{}".format(case, engine)
+
+            yield "construct/" + name, partial(cls, engine=engine)
+            yield "convert/" + name, each(function, engine)
+            yield "batch/" + name, partial(convert_many, batch, case, engine=engine)
+            yield "large/" + name, partial(function, large, engine=engine)
+
+        yield "large/{}/chunked".format(case), discard(case)
+        yield "large/{}/file".format(case), write_file(case)
+
+
+def parse_args(argv):
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument(
+        "--case", type=split_names, default=list(FUNCTIONS), help="Cases to trace."
+    )
+    parser.add_argument(
+        "--engine", type=split_names, default=list(ENGINES), help="Engines to trace."
+    )
+    parser.add_argument(
+        "--size", type=int, default=DEFAULT_SIZE, help="Characters in large strings."
+    )
+    parser.add_argument(
+        "--corpus", metavar="PATH", help="Batch the strings of a corpus instead."
+    )
+    parser.add_argument("--save", metavar="PATH", help="Write results as JSON.")
+    parser.add_argument(
+        "--compare", metavar="PATH", help="Fail on regressions against a baseline."
+    )
+    parser.add_argument(
+        "--threshold",
+        type=float,
+        default=DEFAULT_THRESHOLD,
+        help="Allowed growth, as a fraction of the baseline.",
+    )
+    return parser.parse_args(argv)
+
+
+def main(argv=None):
+    args = parse_args(argv)
+
+    # Cached results would be counted as retained memory.
+    configure_cache(0)
+
+    results = {}
+    with tempfile.TemporaryDirectory() as directory:
+        path = os.path.join(directory, "large.txt")
+        with open(path, "w") as f:
+            f.write(large_string(args.size))
+
+        batch = read(args.corpus) if args.corpus else None
+        selected = benchmarks(args.case, args.engine, args.size, path, batch)
+        for name, func in selected:
+            if name.startswith("convert/"):
+                # Each string is traced on its own, after a warm up run.
+                func()
+                result = largest(func())
+            else:
+                result = measure(func)
+
+            results[name] = result
+            print(
+                "{:<32} {:>12,} B peak {:>8,} blocks {:>12,} B retained".format(
+                    name,
+                    result["peak_bytes"],
+                    result["retained_blocks"],
+                    result["retained_bytes"],
+                )
+            )
+
+    if args.save:
+        with open(args.save, "w") as f:
+            json.dump(
+                {"python": platform.python_version(), "results": results},
+                f,
+                indent=2,
+                sort_keys=True,
+            )
+
+    if args.compare:
+        with open(args.compare) as f:
+            baseline = json.load(f)
+
+        regressions = compare(
+            results, baseline["results"], args.threshold, "peak_bytes"
+        )
+        for name, before, after in regressions:
+            print(
+                "REGRESSION {}: {:,} => {:,} B peak ({:+.0%})".format(
+                    name, before, after, after / before - 1
+                )
+            )
+
+        if regressions:
+            return 1
+
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
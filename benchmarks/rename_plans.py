@@ -0,0 +1,51 @@
+"""Compare key rename plans with converting every key of every record.
+
+Run from the repository root:
+
+    PYTHONPATH=. python benchmarks/rename_plans.py
+"""
+import timeit
+
+from caseconverter import KeyRenamer, convert_keys, snakecase
+
+FIELDS = [
+    "userId",
+    "accountId",
+    "createdAt",
+    "updatedAt",
+    "firstName",
+    "lastName",
+    "emailAddress",
+    "phoneNumber",
+    "orderTotal",
+    "shippingAddress",
+]
+RECORDS = [{field: i for field in FIELDS} for i in range(10000)]
+
+
+def naive():
+    return [{snakecase(k): v for k, v in record.items()} for record in RECORDS]
+
+
+def per_call_cache():
+    return [convert_keys(record, "snake", recursive=False) for record in RECORDS]
+
+
+def rename_plan():
+    return list(KeyRenamer("snake").rename_many(RECORDS))
+
+
+def main():
+    assert naive() == per_call_cache() == rename_plan()
+
+    for func in (naive, per_call_cache, rename_plan):
+        best = min(timeit.repeat(func, number=1, repeat=5))
+        print(
+            "{:<16} {:>10.1f} ms {:>12.0f} records/s".format(
+                func.__name__, best * 1000, len(RECORDS) / best
+            )
+        )
+
+
+if __name__ == "__main__":
+    main()
@@ -1,4 +1,4 @@
-from .caseconverter import CaseConverter, DELIMITERS
+from .caseconverter import CaseConverter, DELIMITERS, get_converter
 from .alternating import Alternating, alternatingcase
 from .camel import Camel, camelcase
 from .cobol import Cobol, cobolcase
@@ -8,3 +8,11 @@ from .macro import Macro, macrocase
 from .pascal import Pascal, pascalcase
 from .snake import Snake, snakecase
 from .title import Title, titlecase
+from .specs import CaseSpec, SpecConverter
+from .cases import CASES, case_converter, split_words, iter_word_spans
+from .cases import convert_all, detect_case
+from .cache import configure_cache, cache_info, cache_clear
+from .batch import convert_many
+from .keys import KeyRenamer, convert_keys
+from .views import CaseMappingView, CaseSequenceView
+from .jsonkeys import object_pairs_hook, CaseConvertingEncoder
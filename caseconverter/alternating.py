@@ -1,32 +1,69 @@
-from .caseconverter import CaseConverter
+from threading import local
+
+from .caseconverter import CaseConverter, get_converter
+from .cache import memoize
 from .boundaries import BoundaryHandler
 
 class Alternating(CaseConverter):
 
+    def __init__(self, *args, **kwargs):
+        # Converters are shared between threads, so the letter count of the
+        # buffer engine is kept per thread.
+        self._state = local()
+        super(Alternating, self).__init__(*args, **kwargs)
+
     def define_boundaries(self):
         self.add_boundary_handler(self.BoundaryOverride())
 
+    def init(self, input_buffer, output_buffer):
+        self._state.toggle_character = False
+
     def prepare_string(self, s):
-        self._toggle_character = False
         return s.lower()
 
     def mutate(self, c):
         if not c.isalpha():
             return c
 
-        if self._toggle_character:
-            self._toggle_character = False
+        if self._state.toggle_character:
+            self._state.toggle_character = False
             return c.upper()
         
-        self._toggle_character = True
+        self._state.toggle_character = True
         return c
-    
+
+    def rules(self):
+        return []
+
+    def mutate_string(self, s):
+        chars = list(s)
+        for i in [i for i, c in enumerate(chars) if c.isalpha()][1::2]:
+            chars[i] = chars[i].upper()
+
+        return "".join(chars)
+
+    def chunk_mutator(self):
+        odd = False
+
+        def mutate_string(s):
+            nonlocal odd
+            # After an odd number of letters the first letter is upper cased.
+            if odd:
+                converted = self.mutate_string("a" + s)[1:]
+            else:
+                converted = self.mutate_string(s)
+
+            odd ^= sum(map(str.isalpha, s)) % 2 == 1
+            return converted
+
+        return mutate_string
 
     class BoundaryOverride(BoundaryHandler):
         def is_boundary(self, pc, c):
             return False
     
 
+@memoize
 def alternatingcase(s, **kwargs):
     """Convert a string to alternating case, or its better known name: mocking Spongebob case.
 
@@ -35,4 +72,4 @@ def alternatingcase(s, **kwargs):
         Hello World => hElLo WoRlD
 
     """
-    return Alternating(s, **kwargs).convert()
+    return get_converter(Alternating, **kwargs).convert(s)
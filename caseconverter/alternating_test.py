@@ -1,4 +1,7 @@
+from concurrent.futures import ThreadPoolExecutor
+
 import pytest
+
 from . import *
 
 
@@ -34,3 +37,15 @@ from . import *
 )
 def test_alternating_with_default_args(input, output):
     assert alternatingcase(input) == output
+
+
+def test_threads_share_a_converter():
+    strings = ["a" * n for n in range(1, 201)]
+    expected = [alternatingcase(s, engine="buffer") for s in strings]
+
+    with ThreadPoolExecutor(8) as executor:
+        for _ in range(8):
+            results = executor.map(
+                lambda s: alternatingcase(s, engine="buffer"), strings
+            )
+            assert list(results) == expected
@@ -0,0 +1,63 @@
+"""Facts about an input string, gathered once per conversion.
+
+Several stages of a conversion need to know the same things about a string:
+whether it is ASCII, whether it is upper case, whether it has delimiters.
+A Profile records them once, when the string is preprocessed, and every
+later stage reads the Profile instead of scanning the string again.
+"""
+
+
+class Profile(object):
+    """A preprocessed string and what is known about it.
+
+    :param string: A string returned by CaseConverter.preprocess().
+    :type string: str
+    :param delimiters: The converter delimiters. Preprocessing replaces every
+        delimiter with the first one.
+    :type delimiters: str
+    :param source: The raw string, if string was preprocessed from it by
+        stripping and collapsing delimiters.
+    :type source: str
+    """
+
+    __slots__ = ("string", "ascii", "upper", "delimited", "_source", "_delimiters")
+
+    def __init__(self, string, delimiters, source=None):
+        self.string = string
+        self.ascii = string.isascii()
+        self.upper = string.isupper()
+        self.delimited = delimiters[0] in string
+        self._source = source
+        self._delimiters = delimiters
+
+    @property
+    def start(self):
+        """The position of the stripped string within the raw string.
+
+        Only needed to map positions back to the raw string, so it is not
+        computed up front.
+
+        :return: The position, or None if the raw string is unknown.
+        :rtype: int
+        """
+        if self._source is None:
+            return None
+
+        return len(self._source) - len(self._source.lstrip(self._delimiters))
+
+    @property
+    def end(self):
+        """The end of the stripped string within the raw string.
+
+        :return: The position, or None if the raw string is unknown.
+        :rtype: int
+        """
+        if self._source is None:
+            return None
+
+        return max(self.start, len(self._source.rstrip(self._delimiters)))
+
+    def __repr__(self):
+        return "Profile({!r}, ascii={}, upper={}, delimited={})".format(
+            self.string, self.ascii, self.upper, self.delimited
+        )
@@ -0,0 +1,45 @@
+import pytest
+from . import *
+from .analysis import Profile
+
+
+@pytest.mark.parametrize(
+    "input, string, ascii, upper, delimited, start, end",
+    [
+        ("", "", True, False, False, 0, 0),
+        ("  -_ ", "", True, False, False, 5, 5),
+        ("Hello, world!", "Hello world", True, False, True, 0, 13),
+        ("  HELLO--WORLD_", "HELLO WORLD", True, True, True, 2, 14),
+        ("__helloWorld", "helloWorld", True, False, False, 2, 12),
+        ("héllo wörld ", "héllo wörld", False, False, True, 0, 11),
+    ],
+)
+def test_profile(input, string, ascii, upper, delimited, start, end):
+    profile = Snake().profile(input)
+
+    assert profile.string == string == Snake().preprocess(input)
+    assert (profile.ascii, profile.upper, profile.delimited) == (
+        ascii,
+        upper,
+        delimited,
+    )
+    assert (profile.start, profile.end) == (start, end)
+    assert input[start:end].strip(" -_") == input.strip(" -_")
+
+
+def test_profile_without_source():
+    profile = Profile("hello_world", "_")
+
+    assert profile.delimited
+    assert profile.start is profile.end is None
+
+
+@pytest.mark.parametrize("converter", [Camel, Macro, Pascal, Snake, Title])
+@pytest.mark.parametrize("input", ["HELLO WORLD", "hello", "HELLO", "héllo", "aBc"])
+def test_convert_raw_with_profile(converter, input):
+    c = converter()
+    profile = c.profile(input)
+
+    assert c.convert_raw(profile.string, None, profile) == c.convert_raw(
+        profile.string
+    )
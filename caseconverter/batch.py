@@ -0,0 +1,99 @@
+from concurrent.futures import ProcessPoolExecutor
+from itertools import chain, repeat
+
+from .cases import case_converter
+
+# Number of distinct strings sent to a worker process at a time.
+DEFAULT_CHUNKSIZE = 10000
+
+
+def convert_many(
+    strings,
+    case="snake",
+    workers=1,
+    chunksize=DEFAULT_CHUNKSIZE,
+    executor=None,
+    **kwargs,
+):
+    """Convert many strings to the same case.
+
+    A single converter is used for the whole batch and every distinct
+    string is converted once, so batches with many repeated strings are
+    cheap.
+
+    With more than one worker, or an executor, the distinct strings are
+    split into chunks converted in other processes. Chunks are made smaller
+    than `chunksize` when needed to give every worker a chunk. Converters
+    are sent to worker processes as their configuration only.
+
+    Example
+
+        convert_many(["Hello World", "helloWorld"], "snake")
+            => ["hello_world", "hello_world"]
+
+    :param strings: An iterable of strings, or of bytes-like objects
+        holding UTF-8.
+    :param case: A case name, see CASES. Defaults to "snake".
+    :type case: str
+    :param workers: Number of worker processes. Defaults to 1, converting
+        in the calling process.
+    :type workers: int
+    :param chunksize: Maximum number of distinct strings per worker task.
+    :type chunksize: int
+    :param executor: A concurrent.futures.Executor to reuse instead of
+        starting a ProcessPoolExecutor with `workers` processes.
+    :param kwargs: Configuration passed to the converter constructor.
+    :return: The converted strings in input order.
+    :rtype: list
+    """
+    if chunksize < 1:
+        raise ValueError("chunksize must be at least 1: {}".format(chunksize))
+
+    converter = case_converter(case, **kwargs)
+
+    strings = list(strings)
+    try:
+        unique = list(dict.fromkeys(strings))
+    except (TypeError, ValueError):
+        # bytearray and writable memoryviews are not hashable and convert
+        # like bytes.
+        strings = [
+            bytes(s) if isinstance(s, (bytearray, memoryview)) else s for s in strings
+        ]
+        unique = list(dict.fromkeys(strings))
+
+    if workers > 1 and unique:
+        chunksize = min(chunksize, -(-len(unique) // workers))
+
+    if executor is None and (workers <= 1 or len(unique) <= 1):
+        converted = map(converter.convert, unique)
+    else:
+        chunks = [unique[i : i + chunksize] for i in range(0, len(unique), chunksize)]
+        converted = chain.from_iterable(
+            convert_chunks(converter, chunks, workers, executor)
+        )
+
+    converted = dict(zip(unique, converted))
+
+    return list(map(converted.__getitem__, strings))
+
+
+def convert_chunks(converter, chunks, workers, executor=None):
+    """Convert chunks of strings in worker processes.
+
+    :return: The converted chunks in order.
+    :rtype: list
+    """
+    if executor is not None:
+        return list(executor.map(convert_chunk, repeat(converter), chunks))
+
+    with ProcessPoolExecutor(max_workers=workers) as executor:
+        return list(executor.map(convert_chunk, repeat(converter), chunks))
+
+
+def convert_chunk(converter, strings):
+    """Convert a chunk of strings, run by worker processes.
+
+    :rtype: list
+    """
+    return list(map(converter.convert, strings))
@@ -0,0 +1,91 @@
+import pickle
+from concurrent.futures import ProcessPoolExecutor
+
+import pytest
+from . import *
+from . import batch
+
+
+@pytest.mark.parametrize(
+    "strings, case, kwargs, output",
+    [
+        (["Hello World", "helloWorld"], "snake", {}, ["hello_world", "hello_world"]),
+        (iter(["a b", "c d", "a b"]), "camel", {}, ["aB", "cD", "aB"]),
+        (["Hello, world!"], "kebab", {"strip_punctuation": False}, ["hello,-world!"]),
+        (["IP Address"], "macro", {"delims_only": True}, ["IP_ADDRESS"]),
+        ([], "title", {}, []),
+        (
+            [bytearray(b"helloWorld"), memoryview(bytearray(b"a b")), b"a b", "a b"],
+            "snake",
+            {},
+            [b"hello_world", b"a_b", b"a_b", "a_b"],
+        ),
+    ],
+)
+def test_convert_many(strings, case, kwargs, output):
+    assert convert_many(strings, case, **kwargs) == output
+
+
+def test_convert_many_converts_duplicates_once(monkeypatch):
+    calls = []
+    converter = case_converter("snake")
+    convert = converter.convert
+    monkeypatch.setattr(converter, "convert", lambda s: calls.append(s) or convert(s))
+
+    assert convert_many(["a", "b", "a", "a"]) == ["a", "b", "a", "a"]
+    assert calls == ["a", "b"]
+
+
+def test_converters_pickle_as_config():
+    macro = Macro(delimiters="|", delims_only=True)
+    restored = pickle.loads(pickle.dumps(macro))
+
+    assert type(restored) is Macro
+    assert restored.config() == macro.config()
+    assert restored.convert("IP|Address") == "IP_ADDRESS"
+
+
+@pytest.mark.parametrize("kwargs", [{"workers": 2}, {"workers": 2, "chunksize": 3}])
+def test_convert_many_parallel(kwargs):
+    strings = ["helloWorld{}".format(i % 20) for i in range(100)]
+
+    assert convert_many(strings, "kebab", **kwargs) == [
+        "hello-world{}".format(i % 20) for i in range(100)
+    ]
+
+
+@pytest.mark.parametrize(
+    "count, workers, chunksize, sizes",
+    [
+        (10, 4, 100, [3, 3, 3, 1]),
+        (100, 8, 50, [13] * 7 + [9]),
+        (10, 2, 3, [3, 3, 3, 1]),
+        (1, 4, 100, []),
+    ],
+)
+def test_convert_many_uses_every_worker(monkeypatch, count, workers, chunksize, sizes):
+    chunked = []
+
+    def convert_chunks(converter, chunks, workers, executor=None):
+        chunked.extend(map(len, chunks))
+        return [batch.convert_chunk(converter, chunk) for chunk in chunks]
+
+    monkeypatch.setattr(batch, "convert_chunks", convert_chunks)
+    strings = ["a{}".format(i) for i in range(count)]
+
+    assert convert_many(strings, workers=workers, chunksize=chunksize) == strings
+    assert chunked == sizes
+
+
+def test_convert_many_with_executor():
+    with ProcessPoolExecutor(max_workers=2) as executor:
+        output = convert_many(
+            ["a b", "c d"] * 5, "macro", chunksize=1, executor=executor
+        )
+
+    assert output == ["A_B", "C_D"] * 5
+
+
+def test_convert_many_invalid_chunksize():
+    with pytest.raises(ValueError):
+        convert_many(["a"], chunksize=0)
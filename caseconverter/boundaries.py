@@ -1,3 +1,23 @@
+from collections import namedtuple
+
+# Kinds of boundary understood by the table engine, see engine.py.
+INIT = "init"
+FIRST = "first"
+DELIMITER = "delimiter"
+LOWER_UPPER = "lower_upper"
+UPPER_UPPER = "upper_upper"
+
+Rule = namedtuple("Rule", ["kind", "join", "transform"])
+Rule.__doc__ = """Description of a boundary for the table engine.
+
+:param kind: One of INIT, FIRST, DELIMITER, LOWER_UPPER or UPPER_UPPER.
+:param join: String written when the boundary is hit.
+:param transform: Callable applied to the boundary character, or None to
+    write it unchanged. For DELIMITER the boundary character is the one
+    following the delimiter.
+"""
+
+
 class BoundaryHandler(object):
     """Detect and handle boundaries in a string.
 
@@ -31,6 +51,16 @@ class BoundaryHandler(object):
         """
         raise NotImplementedError()
 
+    def rule(self):
+        """Describe the boundary for the table engine.
+
+        Handlers that cannot be described return None and force the
+        CaseConverter onto the buffer engine.
+
+        :rtype: Rule
+        """
+        return None
+
 
 class OnDelimeterUppercaseNext(BoundaryHandler):
     def __init__(self, delimiters, join_char=""):
@@ -44,6 +74,9 @@ class OnDelimeterUppercaseNext(BoundaryHandler):
         output_buffer.write(self._join_char)
         output_buffer.write(input_buffer.read(1).upper())
 
+    def rule(self):
+        return Rule(DELIMITER, self._join_char, str.upper)
+
 
 class OnDelimeterLowercaseNext(BoundaryHandler):
     def __init__(self, delimiters, join_char=""):
@@ -57,6 +90,9 @@ class OnDelimeterLowercaseNext(BoundaryHandler):
         output_buffer.write(self._join_char)
         output_buffer.write(input_buffer.read(1).lower())
 
+    def rule(self):
+        return Rule(DELIMITER, self._join_char, str.lower)
+
 
 class OnUpperPrecededByLowerAppendUpper(BoundaryHandler):
     def __init__(self, join_char=""):
@@ -69,6 +105,9 @@ class OnUpperPrecededByLowerAppendUpper(BoundaryHandler):
         output_buffer.write(self._join_char)
         output_buffer.write(cc)
 
+    def rule(self):
+        return Rule(LOWER_UPPER, self._join_char, None)
+
 
 class OnUpperPrecededByLowerAppendLower(BoundaryHandler):
     def __init__(self, join_char=""):
@@ -81,6 +120,9 @@ class OnUpperPrecededByLowerAppendLower(BoundaryHandler):
         output_buffer.write(self._join_char)
         output_buffer.write(cc.lower())
 
+    def rule(self):
+        return Rule(LOWER_UPPER, self._join_char, str.lower)
+
 
 class OnUpperPrecededByUpperAppendJoin(BoundaryHandler):
     def __init__(self, join_char=""):
@@ -93,6 +135,9 @@ class OnUpperPrecededByUpperAppendJoin(BoundaryHandler):
         output_buffer.write(self._join_char)
         output_buffer.write(cc)
 
+    def rule(self):
+        return Rule(UPPER_UPPER, self._join_char, None)
+
 
 class OnUpperPrecededByUpperAppendCurrent(BoundaryHandler):
     def __init__(self, join_char=""):
@@ -103,3 +148,54 @@ class OnUpperPrecededByUpperAppendCurrent(BoundaryHandler):
 
     def handle(self, pc, cc, input_buffer, output_buffer):
         output_buffer.write(cc)
+
+    def rule(self):
+        return Rule(UPPER_UPPER, "", None)
+
+
+class RuleHandler(BoundaryHandler):
+    """Handle the boundary described by any Rule except INIT.
+
+    Lets converters defined by their rules, see specs.py, convert with the
+    buffer engine too.
+
+    :param rule: The rule to handle.
+    :type rule: Rule
+    :param delimiters: The converter delimiters.
+    :type delimiters: str
+    """
+
+    def __init__(self, rule, delimiters):
+        if rule.kind == INIT:
+            raise ValueError("INIT rules are implemented by init()")
+
+        self._rule = rule
+        self._delimiters = delimiters
+
+    def is_boundary(self, pc, c):
+        kind = self._rule.kind
+
+        if kind == FIRST:
+            return pc is None
+
+        if kind == DELIMITER:
+            return c in self._delimiters
+
+        if pc is None or not pc.isalpha() or not c.isupper():
+            return False
+
+        return pc.islower() if kind == LOWER_UPPER else pc.isupper()
+
+    def handle(self, pc, cc, input_buffer, output_buffer):
+        output_buffer.write(self._rule.join)
+
+        if self._rule.kind == DELIMITER:
+            cc = input_buffer.read(1)
+
+        if self._rule.transform is not None:
+            cc = self._rule.transform(cc)
+
+        output_buffer.write(cc)
+
+    def rule(self):
+        return self._rule
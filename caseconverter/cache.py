@@ -0,0 +1,165 @@
+"""Opt-in memoization of the module level case functions.
+
+Caching is disabled by default. It can be enabled for every case function
+with configure_cache() or for a single function with its own
+cache_configure(), e.g. `snakecase.cache_configure(maxsize=4096)`.
+"""
+from collections import OrderedDict, namedtuple
+from functools import wraps
+from threading import Lock
+
+CacheInfo = namedtuple("CacheInfo", ["hits", "misses", "maxsize", "currsize"])
+
+# Strings longer than this are converted but never cached, so a bounded
+# number of entries is also a bounded amount of memory.
+MAX_CACHED_LENGTH = 1024
+
+
+class LRUCache(object):
+    """A thread-safe, size bounded, least recently used cache.
+
+    :param maxsize: The maximum number of entries. A maxsize of 0 disables
+        the cache.
+    :type maxsize: int
+    """
+
+    def __init__(self, maxsize=0):
+        self._maxsize = maxsize
+        self._entries = OrderedDict()
+        self._lock = Lock()
+        self._hits = 0
+        self._misses = 0
+
+    @property
+    def maxsize(self):
+        return self._maxsize
+
+    def get(self, key, default=None):
+        """Retrieve an entry, marking it as most recently used.
+
+        Counts a hit or a miss.
+        """
+        with self._lock:
+            try:
+                value = self._entries[key]
+            except KeyError:
+                self._misses += 1
+                return default
+
+            self._entries.move_to_end(key)
+            self._hits += 1
+            return value
+
+    def set(self, key, value):
+        """Store an entry, evicting the least recently used entry if full."""
+        with self._lock:
+            if self._maxsize <= 0:
+                return
+
+            self._entries[key] = value
+            self._entries.move_to_end(key)
+
+            while len(self._entries) > self._maxsize:
+                self._entries.popitem(last=False)
+
+    def configure(self, maxsize):
+        """Change the maximum number of entries, evicting entries if needed.
+
+        :type maxsize: int
+        """
+        if maxsize < 0:
+            raise ValueError("maxsize must be positive: {}".format(maxsize))
+
+        with self._lock:
+            self._maxsize = maxsize
+
+            while len(self._entries) > maxsize:
+                self._entries.popitem(last=False)
+
+    def info(self):
+        """Report cache statistics.
+
+        :rtype: CacheInfo
+        """
+        with self._lock:
+            return CacheInfo(
+                self._hits, self._misses, self._maxsize, len(self._entries)
+            )
+
+    def clear(self):
+        """Remove every entry and reset the statistics."""
+        with self._lock:
+            self._entries.clear()
+            self._hits = 0
+            self._misses = 0
+
+
+# Every memoized case function, by name.
+FUNCTIONS = {}
+
+
+def memoize(func):
+    """Put an LRUCache in front of a case function.
+
+    The cache is keyed on the string and keyword arguments. Calls with
+    unhashable arguments or strings longer than MAX_CACHED_LENGTH bypass
+    the cache. The returned function has cache_info(), cache_clear() and
+    cache_configure(maxsize) attributes.
+    """
+    cache = LRUCache()
+    missing = object()
+
+    @wraps(func)
+    def wrapper(s, **kwargs):
+        if not cache.maxsize or len(s) > MAX_CACHED_LENGTH:
+            return func(s, **kwargs)
+
+        if kwargs:
+            key = (s, tuple(sorted(kwargs.items())))
+        else:
+            key = s
+
+        try:
+            value = cache.get(key, missing)
+        except TypeError:
+            return func(s, **kwargs)
+
+        if value is missing:
+            value = func(s, **kwargs)
+            cache.set(key, value)
+
+        return value
+
+    wrapper.cache_info = cache.info
+    wrapper.cache_clear = cache.clear
+    wrapper.cache_configure = cache.configure
+
+    FUNCTIONS[func.__name__] = wrapper
+
+    return wrapper
+
+
+def configure_cache(maxsize):
+    """Set the cache size of every case function.
+
+    :param maxsize: The maximum number of entries per function, 0 disables
+        caching.
+    :type maxsize: int
+    """
+    for func in FUNCTIONS.values():
+        func.cache_configure(maxsize)
+
+
+def cache_info():
+    """Report the cache statistics of every case function.
+
+    :return: CacheInfo by function name.
+    :rtype: dict
+    """
+    return {name: func.cache_info() for name, func in FUNCTIONS.items()}
+
+
+def cache_clear():
+    """Clear the cache of every case function."""
+    for func in FUNCTIONS.values():
+        func.cache_clear()
@@ -0,0 +1,101 @@
+import threading
+
+import pytest
+from . import *
+from .cache import LRUCache, CacheInfo, MAX_CACHED_LENGTH
+
+
+@pytest.fixture(autouse=True)
+def reset_cache():
+    yield
+    configure_cache(0)
+    cache_clear()
+
+
+def test_cache_disabled_by_default():
+    snakecase("helloWorld")
+    snakecase("helloWorld")
+
+    assert snakecase.cache_info() == CacheInfo(0, 0, 0, 0)
+
+
+def test_cache_per_function():
+    snakecase.cache_configure(2)
+
+    assert snakecase("helloWorld") == "hello_world"
+    assert snakecase("helloWorld") == "hello_world"
+    assert camelcase("hello world") == "helloWorld"
+
+    assert snakecase.cache_info() == CacheInfo(1, 1, 2, 1)
+    assert camelcase.cache_info() == CacheInfo(0, 0, 0, 0)
+
+
+def test_cache_keyed_on_kwargs():
+    configure_cache(8)
+
+    assert camelcase("Hello, world!") == "helloWorld"
+    assert camelcase("Hello, world!", strip_punctuation=False) == "hello,World!"
+    assert camelcase.cache_info().currsize == 2
+
+
+def test_cache_evicts_least_recently_used():
+    cache = LRUCache(2)
+    cache.set("a", 1)
+    cache.set("b", 2)
+    cache.get("a")
+    cache.set("c", 3)
+
+    assert cache.get("b") is None
+    assert cache.get("a") == 1
+    assert cache.get("c") == 3
+
+
+def test_cache_bounded_on_unique_inputs():
+    kebabcase.cache_configure(16)
+
+    for i in range(1000):
+        kebabcase("key{}".format(i))
+
+    assert kebabcase.cache_info().currsize == 16
+
+
+def test_cache_skips_long_strings():
+    flatcase.cache_configure(16)
+    flatcase("a" * (MAX_CACHED_LENGTH + 1))
+
+    assert flatcase.cache_info().currsize == 0
+
+
+def test_cache_global_info_and_clear():
+    configure_cache(4)
+    macrocase("helloWorld")
+    titlecase("helloWorld")
+
+    info = cache_info()
+    assert info["macrocase"].currsize == 1
+    assert info["titlecase"].currsize == 1
+
+    cache_clear()
+    assert cache_info()["macrocase"] == CacheInfo(0, 0, 4, 0)
+
+
+def test_cache_thread_safe():
+    pascalcase.cache_configure(8)
+    errors = []
+
+    def convert():
+        for i in range(500):
+            n = i % 16
+            if pascalcase("hello world {}".format(n)) != "HelloWorld{}".format(n):
+                errors.append(i)
+
+    threads = [threading.Thread(target=convert) for _ in range(4)]
+    for thread in threads:
+        thread.start()
+    for thread in threads:
+        thread.join()
+
+    info = pascalcase.cache_info()
+    assert errors == []
+    assert info.hits + info.misses == 2000
+    assert info.currsize <= 8
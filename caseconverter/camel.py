@@ -1,4 +1,5 @@
-from .caseconverter import CaseConverter
+from .caseconverter import CaseConverter, get_converter, lower
+from .cache import memoize
 from .boundaries import OnDelimeterUppercaseNext, OnUpperPrecededByLowerAppendUpper
 
 
@@ -13,10 +14,23 @@ class Camel(CaseConverter):
 
         return s
 
+    def prepare_chunk(self, s, upper):
+        return s.lower() if upper else s
+
     def mutate(self, c):
         return c.lower()
 
+    def mutate_string(self, s):
+        return lower(s)
+
+    def fixpoint(self):
+        return r"[a-z0-9]*(?:(?<=[a-z])[A-Z][a-z0-9]*)*"
+
+    def mutation(self):
+        return str.lower
+
 
+@memoize
 def camelcase(s, **kwargs):
     """Convert a string to camel case.
 
@@ -25,4 +39,4 @@ def camelcase(s, **kwargs):
       Hello World => helloWorld
 
     """
-    return Camel(s, **kwargs).convert()
+    return get_converter(Camel, **kwargs).convert(s)
@@ -1,8 +1,13 @@
 import re
 import string
 import logging
+from functools import lru_cache
 from io import StringIO
 
+from .analysis import Profile
+from .engine import TABLE, COMPILED, ENGINES, WORD_RULES, ACRONYM_RULES, Table
+from .engine import supports, word_trie
+
 logger = logging.getLogger(__name__)
 logger.setLevel(logging.INFO)
 
@@ -27,6 +32,101 @@ class StringBuffer(StringIO):
 DELIMITERS = " -_"
 
 
+def lower(s):
+    """Lower case a string one character at a time.
+
+    str.lower() treats a capital sigma at the end of a word differently to
+    a lone capital sigma, so it is only used in bulk when there is none.
+
+    :rtype: str
+    """
+    if "\u03a3" in s:
+        return "".join(map(str.lower, s))
+
+    return s.lower()
+
+
+# The methods a fixpoint() pattern relies on, see trusts_fixpoint().
+CONVERSION_METHODS = (
+    "define_boundaries",
+    "init",
+    "rules",
+    "preprocess",
+    "collapse",
+    "prepare_string",
+    "convert_raw",
+    "convert_upper",
+    "mutate",
+    "mutate_string",
+)
+
+
+def declared_together(cls, method, methods):
+    """Determine if the class declaring a method also declares others.
+
+    :param cls: A CaseConverter or BoundaryHandler subclass.
+    :param method: The name of a method of cls.
+    :type method: str
+    :param methods: The names of the methods it relies on.
+    :rtype: bool
+    """
+    owner = next(c for c in cls.__mro__ if method in vars(c))
+    return all(getattr(cls, name) is getattr(owner, name) for name in methods)
+
+
+def trusts_fixpoint(cls):
+    """Determine if the fixpoint() of a converter class can be relied on.
+
+    It can when the class declaring fixpoint() also declares how strings are
+    converted, so a child class changing a boundary loses the short-circuit.
+
+    :rtype: bool
+    """
+    return declared_together(cls, "fixpoint", CONVERSION_METHODS)
+
+
+def trusts_mutation(cls):
+    """Determine if mutate_string() and mutation() agree with mutate().
+
+    They do when they are the CaseConverter defaults, which defer to
+    mutate(), or when the class declaring them also declares mutate(), so a
+    child class changing mutate() alone is converted with the buffer engine.
+
+    :rtype: bool
+    """
+    return all(
+        getattr(cls, name) is getattr(CaseConverter, name)
+        or declared_together(cls, name, ("mutate",))
+        for name in ("mutate_string", "mutation")
+    )
+
+
+def handler_rule(handler):
+    """Describe a boundary handler for the table engine.
+
+    The rule() of a handler is only used when it is declared alongside
+    is_boundary() and handle(), so a child class changing how a boundary is
+    found or handled is converted with the buffer engine.
+
+    :type handler: BoundaryHandler
+    :return: A Rule, or None.
+    """
+    if not declared_together(type(handler), "rule", ("is_boundary", "handle")):
+        return None
+
+    return handler.rule()
+
+
+def decode(data):
+    """Decode bytes, a bytearray or a memoryview holding UTF-8.
+
+    CPython decodes ASCII with a plain copy, so ASCII needs no separate path.
+
+    :rtype: str
+    """
+    return str(data, "utf-8")
+
+
 def stripable_punctuation(delimiters):
     """Construct a string of stripable punctuation based on delimiters.
 
@@ -36,10 +136,21 @@ def stripable_punctuation(delimiters):
 
 
 class CaseConverter(object):
-    def __init__(self, s, delimiters=DELIMITERS, strip_punctuation=True):
-        """Initialize a case conversion.
-
-        On initialization, punctuation can be optionally stripped. If
+    def __init__(
+        self,
+        delimiters=DELIMITERS,
+        strip_punctuation=True,
+        engine=COMPILED,
+        known_words=None,
+    ):
+        """Initialize a case converter.
+
+        A CaseConverter holds configuration only. The regular expressions
+        used to prepare input strings and the boundary handlers are built
+        once, here, so a single instance can convert any number of strings
+        via convert().
+
+        When converting, punctuation can be optionally stripped. If
         punctuation is not stripped, it will appear in the output at the
         same position as the input.
 
@@ -53,35 +164,114 @@ class CaseConverter(object):
         Delimeters will be reduced to single instances of a delimeter. This
         includes transforming `   -_-__  `  to `-`.
 
-        During initialization, the raw input string will be passed through
-        the prepare_string() method. Child classes should override this
-        method if they wish to perform pre-conversion checks and manipulate
-        the string accordingly.
-
-        :param s: The raw string to convert.
-        :type s: str
         :param delimiters: A set of delimiters used to identify boundaries.
             Defaults to DELIMITERS
         :type delimiters: str
+        :param strip_punctuation: Whether to remove punctuation that is not
+            a delimiter. Defaults to True.
+        :type strip_punctuation: bool
+        :param engine: The conversion engine, one of engine.TABLE,
+            engine.COMPILED or engine.BUFFER. The table and compiled engines
+            are used only when every boundary handler can describe itself
+            with a Rule. Defaults to engine.COMPILED.
+        :type engine: str
+        :param known_words: Words, such as acronyms, that are never split
+            and are followed by a word boundary, e.g. with "HTTP" the string
+            "HTTPServer" has the words "HTTP" and "Server". Words are matched
+            where a word can start. Requires the table or compiled engine.
+        :type known_words: iterable
         """
-        self._delimiters = delimiters
+        if engine not in ENGINES:
+            raise ValueError("unknown engine: {}".format(engine))
 
-        s = s.strip(delimiters)
+        if known_words is not None:
+            known_words = known_word_set(known_words)
 
+        self._delimiters = delimiters
+        self._config = {
+            "delimiters": delimiters,
+            "strip_punctuation": strip_punctuation,
+            "engine": engine,
+            "known_words": known_words,
+        }
+
+        self._known_words = None
+        if known_words:
+            if any(c in delimiters for word in known_words for c in word):
+                raise ValueError("known words must not contain delimiters")
+
+            self._known_words = word_trie(known_words)
+
+        # ASCII strings are preprocessed with a single str.translate() that
+        # removes punctuation and maps every delimiter to the first one.
+        self._ascii_table = [chr(i) for i in range(128)]
+        for c in delimiters:
+            if ord(c) < 128:
+                self._ascii_table[ord(c)] = delimiters[0]
+
+        self._punctuation = ""
+        self._punctuation_re = None
         if strip_punctuation:
-            punctuation = stripable_punctuation(delimiters)
-            s = re.sub("[{}]+".format(re.escape(punctuation)), "", s)
+            punctuation = self._punctuation = stripable_punctuation(delimiters)
+            if punctuation:
+                self._punctuation_re = re.compile(
+                    "[{}]+".format(re.escape(punctuation))
+                )
 
-        # Change recurring delimiters into single delimiters.
-        s = re.sub("[{}]+".format(re.escape(delimiters)), delimiters[0], s)
+            for c in punctuation:
+                self._ascii_table[ord(c)] = None
 
-        self._raw_input = s
-        self._input_buffer = StringBuffer(self.prepare_string(s))
-        self._output_buffer = StringBuffer()
+        self._delimiters_re = re.compile("[{}]+".format(re.escape(delimiters)))
+        self._recurring_re = re.compile("{}{{2,}}".format(re.escape(delimiters[0])))
         self._boundary_handlers = []
 
+        # Profiles record the bounds of the stripped string unless
+        # preprocess() is overridden. prepare_chunk() reads whether a string
+        # is upper case from its Profile, it is used when it agrees with
+        # prepare_string().
+        self._profiled = type(self).preprocess is CaseConverter.preprocess
+        self._prepare_chunk = declared_together(
+            type(self), "prepare_chunk", ("prepare_string",)
+        )
+
         self.define_boundaries()
 
+        self._fixpoint_re = None
+        pattern = self.fixpoint()
+        if (
+            pattern is not None
+            and self._known_words is None
+            and trusts_fixpoint(type(self))
+            and not any(c.isascii() and c.isalnum() for c in delimiters)
+        ):
+            self._fixpoint_re = re.compile(pattern)
+
+        self._words = Table(delimiters, WORD_RULES, None, None, self._known_words)
+        self._acronyms = None
+
+        self._table = self._table_convert = None
+        if (
+            engine in (TABLE, COMPILED)
+            and supports(delimiters)
+            and trusts_mutation(type(self))
+        ):
+            rules = self.rules()
+            if rules is not None:
+                self._table = Table(
+                    delimiters,
+                    rules,
+                    self.mutate_string,
+                    self.mutation(),
+                    self._known_words,
+                )
+
+                self._table_convert = self._table.convert
+                if engine == COMPILED:
+                    self._table_convert = self._table.compiled()
+
+        if self._known_words is not None and self._table is None:
+            raise ValueError("known words require the table or compiled engine")
+
     def add_boundary_handler(self, handler):
         """Add a boundary handler.
 
@@ -101,6 +291,62 @@ class CaseConverter(object):
         logger.warn("No boundaries defined")
         return
 
+    def rules(self):
+        """Describe the boundary handlers for the table engine.
+
+        Returns None if a handler cannot be described, see handler_rule(),
+        or init() has been overridden, in which case conversions use the
+        buffer engine.
+
+        :rtype: list
+        """
+        if type(self).init is not CaseConverter.init:
+            return None
+
+        rules = [handler_rule(bh) for bh in self._boundary_handlers]
+        if None in rules:
+            return None
+
+        return rules
+
+    def fixpoint(self):
+        """Describe strings that are already converted.
+
+        convert() returns strings fully matching the pattern unchanged,
+        without converting them. The pattern must only match strings that
+        convert to themselves with the converter configuration. It is not
+        used when the delimiters include ASCII letters or digits.
+
+        Can be overridden.
+
+        :return: A regular expression, or None.
+        :rtype: str
+        """
+        return None
+
+    def fixpoint_re(self):
+        """Retrieve the compiled fixpoint() in use.
+
+        :return: The compiled pattern, or None if no string is returned
+            unchanged.
+        """
+        return self._fixpoint_re
+
+    def config(self):
+        """Retrieve the configuration the converter was built from.
+
+        `type(converter)(**converter.config())` builds an equivalent
+        converter.
+
+        :rtype: dict
+        """
+        return dict(self._config)
+
+    def __reduce__(self):
+        # Converters are pickled as their configuration only, e.g. to send
+        # them to worker processes.
+        return (restore_converter, (type(self), self._config))
+
     def delimiters(self):
         """Retrieve the delimiters.
 
@@ -108,12 +354,61 @@ class CaseConverter(object):
         """
         return self._delimiters
 
-    def raw(self):
-        """Retrieve the raw string to be converted.
+    def preprocess(self, s):
+        """Strip delimiters and punctuation from a raw input string.
+
+        Leading and trailing delimiters are stripped, stripable punctuation
+        is removed if configured and recurring delimiters are reduced to the
+        first configured delimiter.
+
+        :param s: The raw string to convert.
+        :type s: str
+        :return: The string handed to prepare_string().
+        :rtype: str
+        """
+        return self.collapse(s.strip(self._delimiters))
+
+    def profile(self, s):
+        """Preprocess a raw string and profile it.
+
+        :param s: The raw string to convert.
+        :type s: str
+        :return: The Profile of the preprocessed string.
+        :rtype: analysis.Profile
+        """
+        if not self._profiled:
+            return Profile(self.preprocess(s), self._delimiters)
+
+        return Profile(self.collapse(s.strip(self._delimiters)), self._delimiters, s)
+
+    def collapse(self, s):
+        """Remove stripable punctuation and reduce recurring delimiters.
+
+        The part of preprocess() that does not depend on the ends of the
+        string.
 
         :rtype: str
         """
-        return self._raw_input
+        if s.isascii():
+            s = s.translate(self._ascii_table)
+            if self._delimiters[0] * 2 not in s:
+                return s
+
+            return self._recurring_re.sub(self._delimiters[0], s)
+
+        if self._punctuation_re is not None:
+            s = self._punctuation_re.sub("", s)
+
+        # Change recurring delimiters into single delimiters.
+        return self._delimiters_re.sub(self._delimiters[0], s)
+
+    def table(self):
+        """Retrieve the table engine Table.
+
+        :return: The Table, or None when converting with the buffer engine.
+        :rtype: engine.Table
+        """
+        return self._table
 
     def init(self, input_buffer, output_buffer):
         """Initialize the output buffer.
@@ -133,16 +428,76 @@ class CaseConverter(object):
         """
         return c
 
+    def mutate_string(self, s):
+        """Mutate a run of characters not on a boundary.
+
+        Used by the table engine and must be equivalent to calling mutate()
+        on every character. Child classes overriding mutate() should
+        override mutate_string() with a faster equivalent.
+
+        :rtype: str
+        """
+        return "".join(map(self.mutate, s))
+
+    def mutation(self):
+        """Name the str method mutate() applies to every character.
+
+        Lets the table engine mutate a whole string at once when every
+        boundary rule transforms characters the same way. Child classes
+        overriding mutate() should override mutation() if mutate() is
+        str.lower() or str.upper().
+
+        :return: str.lower, str.upper or None.
+        """
+        return None
+
+    def prepare_chunk(self, s, upper):
+        """Prepare a chunk of a string converted in chunks.
+
+        Must give the same result as prepare_string() on the whole string.
+        Child classes whose prepare_string() looks at the whole string, e.g.
+        to check if it is upper case, should override prepare_chunk().
+
+        :param s: A preprocessed chunk.
+        :type s: str
+        :param upper: Whether the whole preprocessed string is upper case.
+        :type upper: bool
+        :rtype: str
+        """
+        return self.prepare_string(s)
+
+    def chunk_mutator(self):
+        """Build the mutate_string() used for one chunked conversion.
+
+        Runs of characters are mutated in string order. Child classes whose
+        mutation depends on earlier characters should return a function
+        carrying that state between calls.
+
+        :rtype: callable
+        """
+        return self.mutate_string
+
+    def convert_upper(self, s):
+        """Convert a preprocessed string that is upper case.
+
+        Child classes may short-circuit the conversion of upper case
+        strings. The default does not.
+
+        :return: The converted string, or None to convert as usual.
+        :rtype: str
+        """
+        return None
+
     def prepare_string(self, s) -> str:
         """Prepare the raw intput string for conversion.
 
-        Executed during CaseConverter initialization providing an opportunity
+        Executed at the start of every conversion providing an opportunity
         for child classes to manipulate the string. By default, the string
         is not manipulated.
 
         Can be overridden.
 
-        :param s: The raw string supplied to the CaseConverter constructor.
+        :param s: The preprocessed string supplied to convert().
         :type s: str
         :return: A raw string to be used in conversion.
         :rtype: str
@@ -160,43 +515,262 @@ class CaseConverter(object):
 
         return None
 
-    def convert(self) -> str:
-        """Convert the raw string.
+    def convert(self, s) -> str:
+        """Convert a string.
 
         convert() follows a series of steps.
 
-            1. Initialize the output buffer using `init()`.
+            0. Return strings matching `fixpoint()` unchanged.
+            1. Preprocess and profile the string using `profile()`, then
+               convert upper case strings with `convert_upper()` or prepare
+               the string using `prepare_string()`.
+            When using the buffer engine:
+            2. Initialize the output buffer using `init()`.
             For every character in the input buffer:
-            2. Check if the current position lies on a boundary as defined
+            3. Check if the current position lies on a boundary as defined
                by the BoundaryHandler instances.
-            3. If on a boundary, execute the handler.
-            4. Else apply a mutation to the character via `mutate()` and add
+            4. If on a boundary, execute the handler.
+            5. Else apply a mutation to the character via `mutate()` and add
                the mutated character to the output buffer.
 
-        :return: The converted string.
+        The table engine produces the same output from `rules()` and
+        `mutate_string()`, see engine.py.
+
+        Bytes-like input is decoded as UTF-8 and the result is encoded
+        back, giving the same result as converting the decoded string.
+
+        :param s: The raw string to convert.
+        :type s: str or bytes-like
+        :return: The converted string, bytes for bytes-like input.
+        :rtype: str or bytes
+        """
+        if not isinstance(s, str):
+            return self.convert(decode(s)).encode("utf-8")
+
+        if self._fixpoint_re is not None and self._fixpoint_re.fullmatch(s):
+            return s
+
+        profile = self.profile(s)
+
+        return self.convert_raw(profile.string, None, profile)
+
+    def convert_raw(self, s, cache=None, profile=None):
+        """Convert a string that has already been preprocessed.
+
+        Child classes may override convert_raw() to short-circuit a
+        conversion.
+
+        :param s: A string returned by preprocess().
+        :type s: str
+        :param cache: Segmentations shared between converters with the same
+            delimiters, see engine.Table.segment().
+        :type cache: dict
+        :param profile: The Profile of s, if already known.
+        :type profile: analysis.Profile
+        :rtype: str
+        """
+        if profile is None:
+            profile = Profile(s, self._delimiters)
+
+        if profile.upper:
+            converted = self.convert_upper(s)
+            if converted is not None:
+                return converted
+
+        if self._prepare_chunk:
+            s = self.prepare_chunk(s, profile.upper)
+        else:
+            s = self.prepare_string(s)
+
+        return self._convert(s, cache, profile)
+
+    def split(self, s):
+        """Split a string into words.
+
+        Words are separated by delimiters and by upper case letters that
+        follow a lower case letter, the boundaries every case has in
+        common. The words keep their case.
+
+        :param s: The raw string to split.
+        :type s: str or bytes-like
+        :return: The words, as bytes for bytes-like input.
+        :rtype: list
+        """
+        if not isinstance(s, str):
+            return [word.encode("utf-8") for word in self.split(decode(s))]
+
+        return self._words.split(self.preprocess(s))
+
+    def word_spans(self, s, split_acronyms=False):
+        """Yield the bounds of the words of a string within the string.
+
+        Words are found as split() finds them, without copying each word.
+        A word spans any punctuation stripped from inside it.
+
+        Example
+
+            "  helloWorld!" => (2, 7), (7, 12)
+
+        :param s: The raw string to split.
+        :type s: str
+        :param split_acronyms: Also split every upper case letter following
+            an upper case letter off, as macro case does. Known words are
+            still kept whole.
+        :type split_acronyms: bool
+        :return: A generator of (start, end) tuples, s[start:end] being a
+            word.
+        """
+        if not self._profiled:
+            raise ValueError("word spans require the default preprocess()")
+
+        table = self._words
+        if split_acronyms:
+            if self._acronyms is None:
+                self._acronyms = Table(
+                    self._delimiters, ACRONYM_RULES, None, None, self._known_words
+                )
+            table = self._acronyms
+
+        profile = self.profile(s)
+        origin = profile.start
+        end = profile.end
+
+        # Preprocessing only ever removes characters, so a stripped string
+        # of the same length lies unchanged within the raw string.
+        if len(profile.string) == end - origin:
+            for start, stop in table.spans(profile.string):
+                yield origin + start, origin + stop
+            return
+
+        offsets = self._offsets(s, origin, end)
+        for start, stop in table.spans(profile.string):
+            yield offsets[start], offsets[stop - 1] + 1
+
+    def _offsets(self, s, start, end):
+        """Map the characters of a preprocessed string to the raw string.
+
+        :param start: The start of the stripped string, see Profile.start.
+        :param end: The end of the stripped string, see Profile.end.
+        :return: The raw position of every preprocessed character.
+        :rtype: list
+        """
+        punctuation = self._punctuation
+        delimiters = self._delimiters
+        offsets = []
+        delimited = False
+
+        for i in range(start, end):
+            c = s[i]
+            if c in punctuation:
+                continue
+
+            if c in delimiters:
+                # Recurring delimiters are reduced to the first.
+                if delimited:
+                    continue
+                delimited = True
+            else:
+                delimited = False
+
+            offsets.append(i)
+
+        return offsets
+
+    def _convert(self, s, cache=None, profile=None):
+        """Convert a prepared string with the configured engine.
+
         :rtype: str
         """
-        self.init(self._input_buffer, self._output_buffer)
+        if self._table_convert is not None:
+            return self._table_convert(s, cache, profile)
 
-        logger.debug("input_buffer = {}".format(self._input_buffer.getvalue()))
+        return self._convert_buffer(s)
+
+    def _convert_buffer(self, s, hooks=()):
+        """Run the boundary handlers over a prepared string.
+
+        Buffers are allocated per call so a CaseConverter can be shared.
+
+        :param hooks: Trace hooks told about every boundary, see trace.py.
+        :type hooks: tuple
+        :rtype: str
+        """
+        input_buffer = StringBuffer(s)
+        output_buffer = StringBuffer()
+
+        self.init(input_buffer, output_buffer)
 
         # Previous character (pc) and current character (cc)
         pc = None
-        cc = self._input_buffer.read(1)
+        cc = input_buffer.read(1)
 
         while cc:
-            logger.debug(
-                "pc = '{}'; cc = '{}'; input_buffer.tell() = {}; output_buffer = '{}'".format(
-                    pc, cc, self._input_buffer.tell(), self._output_buffer.getvalue()
-                )
-            )
             bh = self._is_boundary(pc, cc)
             if bh:
-                bh.handle(pc, cc, self._input_buffer, self._output_buffer)
+                if hooks:
+                    position = input_buffer.tell() - 1
+                    for hook in hooks:
+                        hook.boundary(self, bh, position)
+
+                bh.handle(pc, cc, input_buffer, output_buffer)
             else:
-                self._output_buffer.write(self.mutate(cc))
+                output_buffer.write(self.mutate(cc))
 
             pc = cc
-            cc = self._input_buffer.read(1)
+            cc = input_buffer.read(1)
 
-        return self._output_buffer.getvalue()
+        return output_buffer.getvalue()
+
+
+def known_word_set(words):
+    """Normalize known words, see CaseConverter.
+
+    :param words: An iterable of strings, such as a set or a list.
+    :rtype: frozenset
+    """
+    if isinstance(words, (str, bytes)):
+        raise ValueError("known words must be a collection of strings")
+
+    return frozenset(words)
+
+
+def cache_config(kwargs):
+    """Normalize a converter configuration so it can key a cache.
+
+    Known words may be given as any collection of strings.
+
+    :param kwargs: Configuration passed to the converter constructor.
+    :type kwargs: dict
+    :rtype: dict
+    """
+    known_words = kwargs.get("known_words")
+    if known_words is not None and type(known_words) is not frozenset:
+        kwargs = dict(kwargs, known_words=known_word_set(known_words))
+
+    return kwargs
+
+
+def get_converter(cls, **kwargs):
+    """Retrieve a shared converter for a configuration.
+
+    Converters are built once per class and keyword arguments and reused
+    by the module level case functions.
+
+    :param cls: A CaseConverter subclass.
+    :param kwargs: Configuration passed to the converter constructor.
+    :rtype: CaseConverter
+    """
+    return _get_converter(cls, **cache_config(kwargs))
+
+
+@lru_cache(maxsize=128)
+def _get_converter(cls, **kwargs):
+    return cls(**kwargs)
+
+
+def restore_converter(cls, config):
+    """Rebuild a pickled converter from its configuration.
+
+    :rtype: CaseConverter
+    """
+    return get_converter(cls, **config)
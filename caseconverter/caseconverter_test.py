@@ -1,5 +1,6 @@
 import pytest
 from . import *
+from .keys import shared_key_cache
 
 
 @pytest.mark.parametrize(
@@ -22,3 +23,151 @@ def test_with_numbers(input, output):
 )
 def test_no_strip_punctuation(input, output):
     assert camelcase(input, strip_punctuation=False) == output
+
+
+@pytest.mark.parametrize(
+    "converter, inputs, outputs",
+    [
+        (Camel(), ["Hello, world!", "HELLO-WORLD"], ["helloWorld", "helloWorld"]),
+        (
+            Macro(delims_only=True),
+            ["IP Address", "helloWorld"],
+            ["IP_ADDRESS", "HELLOWORLD"],
+        ),
+        (Alternating(), ["Hello world", "Hello world"], ["hElLo WoRlD", "hElLo WoRlD"]),
+    ],
+)
+def test_converter_is_reusable(converter, inputs, outputs):
+    assert [converter.convert(s) for s in inputs] == outputs
+
+
+def test_get_converter_is_cached_per_config():
+    assert get_converter(Snake) is get_converter(Snake)
+    assert get_converter(Snake, delimiters="|") is not get_converter(Snake)
+
+
+@pytest.mark.parametrize("case", sorted(CASES))
+@pytest.mark.parametrize("s", ["Hello, world!", "HELLO_WORLD", "héllo wörld", ""])
+@pytest.mark.parametrize("wrap", [bytes, bytearray, memoryview])
+def test_bytes_input(case, s, wrap):
+    converter = case_converter(case)
+    data = wrap(s.encode("utf-8"))
+
+    assert converter.convert(data) == converter.convert(s).encode("utf-8")
+    assert converter.split(data) == [w.encode("utf-8") for w in converter.split(s)]
+
+
+def test_bytes_input_module_function():
+    assert snakecase(b"helloWorld") == b"hello_world"
+    assert camelcase(bytearray(b"hello_world")) == b"helloWorld"
+
+
+@pytest.mark.parametrize(
+    "case, s",
+    [
+        ("snake", "hello_world"),
+        ("kebab", "hello-world"),
+        ("macro", "HELLO_WORLD"),
+        ("cobol", "HELLO-WORLD"),
+        ("flat", "helloworld"),
+        ("camel", "helloWorld"),
+        ("pascal", "HelloWorld"),
+        ("title", "Hello World"),
+    ],
+)
+def test_fixpoint_is_not_converted(case, s, monkeypatch):
+    converter = CASES[case]()
+    monkeypatch.setattr(converter, "convert_raw", None)
+
+    assert converter.convert(s) == s
+    assert converter.convert(s.encode("utf-8")) == s.encode("utf-8")
+
+
+@pytest.mark.parametrize(
+    "converter",
+    [Snake(delimiters="-"), Snake(delimiters="_a"), Alternating()],
+)
+def test_fixpoint_unused(converter):
+    assert converter.fixpoint_re() is None
+
+
+class Greeting(Snake):
+    def preprocess(self, s):
+        return super(Greeting, self).preprocess(s).replace("world", "there")
+
+
+def test_fixpoint_unused_by_subclass():
+    assert Greeting().fixpoint_re() is None
+    assert Greeting().convert("hello_world") == "hello_there"
+
+
+def test_word_spans_require_default_preprocess():
+    with pytest.raises(ValueError):
+        list(Greeting().word_spans("hello_world"))
+
+
+class Reversed(Camel):
+    def prepare_string(self, s):
+        return s[::-1]
+
+
+def test_prepare_string_override_is_used():
+    assert Reversed().convert("hello world") == "dlrowOlleh"
+    assert Reversed().convert("HELLO WORLD") == "dlrowOlleh"
+
+
+KNOWN_WORDS = frozenset({"HTTP", "ID", "URL", "OAuth", "IPv6", "XML"})
+
+
+@pytest.mark.parametrize(
+    "case, input, output",
+    [
+        ("snake", "HTTPServer", "http_server"),
+        ("snake", "XMLHTTPRequest", "xml_http_request"),
+        ("snake", "IPv6Address", "ipv6_address"),
+        ("snake", "IDentity", "identity"),
+        ("camel", "getURLForID", "getUrlForId"),
+        ("pascal", "OAuthToken", "OauthToken"),
+        ("macro", "HTTPServer", "HTTP_SERVER"),
+        ("macro", "OAuthToken", "OAUTH_TOKEN"),
+        ("title", "myHTTPServer", "My Http Server"),
+    ],
+)
+def test_known_words(case, input, output):
+    assert case_converter(case, known_words=KNOWN_WORDS).convert(input) == output
+
+
+@pytest.mark.parametrize(
+    "known_words", [KNOWN_WORDS, set(KNOWN_WORDS), list(KNOWN_WORDS)]
+)
+def test_known_words_collections(known_words):
+    converter = get_converter(Snake, known_words=known_words)
+
+    assert converter is get_converter(Snake, known_words=KNOWN_WORDS)
+    assert snakecase("HTTPServer", known_words=known_words) == "http_server"
+    assert convert_keys({"userID": 1}, "snake", known_words=known_words) == {
+        "user_id": 1
+    }
+    assert shared_key_cache("snake", known_words=known_words)["userID"] == "user_id"
+
+
+def test_known_words_split():
+    assert split_words("XMLHTTPRequest", known_words=KNOWN_WORDS) == [
+        "XML",
+        "HTTP",
+        "Request",
+    ]
+
+
+@pytest.mark.parametrize(
+    "kwargs",
+    [
+        {"known_words": frozenset({"A"})},
+        {"known_words": frozenset({"A_B"})},
+        {"known_words": "HTTP"},
+        {"known_words": KNOWN_WORDS, "engine": "buffer"},
+    ],
+)
+def test_known_words_invalid(kwargs):
+    with pytest.raises(ValueError):
+        Snake(**kwargs)
@@ -0,0 +1,176 @@
+import re
+from functools import lru_cache
+
+from .caseconverter import cache_config, get_converter
+from .alternating import Alternating
+from .camel import Camel
+from .cobol import Cobol
+from .flat import Flat
+from .kebab import Kebab
+from .macro import Macro
+from .pascal import Pascal
+from .snake import Snake
+from .title import Title
+from .specs import spec_converter
+
+CASES = {
+    "alternating": Alternating,
+    "camel": Camel,
+    "cobol": Cobol,
+    "flat": Flat,
+    "kebab": Kebab,
+    "macro": Macro,
+    "pascal": Pascal,
+    "snake": Snake,
+    "title": Title,
+}
+
+# The cases detect_case() reports, in order of precedence for strings in
+# several cases, e.g. "hello" is flat, snake, kebab and camel case.
+DETECTED_CASES = (
+    "flat",
+    "snake",
+    "kebab",
+    "camel",
+    "pascal",
+    "macro",
+    "cobol",
+    "title",
+)
+
+
+def case_converter(case, **kwargs):
+    """Retrieve the shared converter for a case name.
+
+    :param case: A key of CASES, e.g. "snake", or the name of a registered
+        CaseSpec, see specs.py.
+    :type case: str
+    :param kwargs: Configuration passed to the converter constructor.
+    :rtype: CaseConverter
+    """
+    cls = CASES.get(case)
+    if cls is None:
+        return spec_converter(case, **kwargs)
+
+    return get_converter(cls, **kwargs)
+
+
+def split_words(s, **kwargs):
+    """Split a string into words.
+
+    Example
+
+        Hello, world! => ["Hello", "world"]
+        helloWorld => ["hello", "World"]
+
+    """
+    # Every converter splits strings the same way.
+    return get_converter(Snake, **kwargs).split(s)
+
+
+def iter_word_spans(s, split_acronyms=False, **kwargs):
+    """Yield the bounds of the words of a string within the string.
+
+    Example
+
+        "Hello, world!" => (0, 5), (7, 12)
+        "helloWorld" => (0, 5), (5, 10)
+
+    :param split_acronyms: See CaseConverter.word_spans().
+    :return: A generator of (start, end) tuples.
+    """
+    return get_converter(Snake, **kwargs).word_spans(s, split_acronyms)
+
+
+def convert_all(s, cases=tuple(CASES), **kwargs):
+    """Convert a string to several cases at once.
+
+    The string is preprocessed, profiled and segmented once and every case
+    is rendered from the same segmentation.
+
+    Example
+
+        convert_all("Hello world", ["snake", "camel"])
+            => {"snake": "hello_world", "camel": "helloWorld"}
+
+    :param cases: Case names, see CASES. Defaults to every case.
+    :param kwargs: Configuration shared by every converter.
+    :rtype: dict
+    """
+    converters = [(case, case_converter(case, **kwargs)) for case in cases]
+    if not converters:
+        return {}
+
+    profile = converters[0][1].profile(s)
+    raw = profile.string
+    cache = {}
+
+    return {
+        case: converter.convert_raw(raw, cache, profile)
+        for case, converter in converters
+    }
+
+
+def case_detector(**kwargs):
+    """Compile one pattern matching every detected case.
+
+    Each case is a named group holding the fixpoint() of its converter.
+
+    :param kwargs: Configuration passed to the converter constructors.
+    :return: A compiled regular expression, or None if no case has a fixpoint.
+    """
+    return _case_detector(**cache_config(kwargs))
+
+
+@lru_cache(maxsize=32)
+def _case_detector(**kwargs):
+    groups = []
+
+    for case in DETECTED_CASES:
+        fixpoint_re = case_converter(case, **kwargs).fixpoint_re()
+        if fixpoint_re is not None:
+            groups.append("(?P<{}>{})".format(case, fixpoint_re.pattern))
+
+    if not groups:
+        return None
+
+    return re.compile("|".join(groups))
+
+
+def detect_case(s, **kwargs):
+    """Detect the case a string is written in.
+
+    A string is in a case when converting it to that case returns it
+    unchanged. ASCII strings are matched against every case at once, other
+    strings are converted to each case in turn. Strings in several cases are
+    reported as the first of DETECTED_CASES.
+
+    Example
+
+        detect_case("hello_world") => "snake"
+        detect_case("HelloWorld") => "pascal"
+        detect_case("héllo_wörld") => "snake"
+        detect_case("hello_World") => None
+
+    :param s: The string to detect.
+    :type s: str
+    :param kwargs: Configuration passed to the converter constructors.
+    :return: A case name, or None for empty, mixed or unknown strings.
+    :rtype: str
+    """
+    detector = case_detector(**kwargs)
+    if not s or detector is None:
+        return None
+
+    # Fixpoint patterns only describe ASCII letters.
+    if not s.isascii():
+        for case in DETECTED_CASES:
+            converter = case_converter(case, **kwargs)
+            if converter.fixpoint_re() is not None and converter.convert(s) == s:
+                return case
+
+        return None
+
+    m = detector.fullmatch(s)
+
+    return None if m is None else m.lastgroup
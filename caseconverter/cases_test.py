@@ -0,0 +1,134 @@
+import pytest
+from . import *
+
+
+@pytest.mark.parametrize(
+    "input, output",
+    [
+        ("Hello, world!", ["Hello", "world"]),
+        ("helloWorld", ["hello", "World"]),
+        ("HELLO-WORLD", ["HELLO", "WORLD"]),
+        ("HTTPServer", ["HTTPServer"]),
+        (" hello -__ world ", ["hello", "world"]),
+        ("heLlo WoRld", ["he", "Llo", "Wo", "Rld"]),
+        ("", []),
+    ],
+)
+def test_split_words(input, output):
+    assert split_words(input) == output
+
+
+@pytest.mark.parametrize(
+    "input, split_acronyms, output",
+    [
+        ("Hello, world!", False, [(0, 5), (7, 12)]),
+        ("  helloWorld!", False, [(2, 7), (7, 12)]),
+        (" hello -__ world ", False, [(1, 6), (11, 16)]),
+        ("hel,lo--World", False, [(0, 6), (8, 13)]),
+        ("HTTPServer", False, [(0, 10)]),
+        ("HTTPServer", True, [(0, 1), (1, 2), (2, 3), (3, 4), (4, 10)]),
+        ("éCole", False, [(0, 1), (1, 5)]),
+        ("", False, []),
+        ("-_-", False, []),
+    ],
+)
+def test_iter_word_spans(input, split_acronyms, output):
+    assert list(iter_word_spans(input, split_acronyms)) == output
+
+
+@pytest.mark.parametrize(
+    "input",
+    ["Hello, world!", " hello -__ world ", "HELLOWorld", "heLlo WoRld", "a_,_b"],
+)
+@pytest.mark.parametrize("kwargs", [{}, {"delimiters": " _"}])
+def test_iter_word_spans_matches_split_words(input, kwargs):
+    words = [input[start:end] for start, end in iter_word_spans(input, **kwargs)]
+
+    assert [word.replace(",", "") for word in words] == split_words(input, **kwargs)
+
+
+def test_iter_word_spans_known_words():
+    spans = iter_word_spans("XMLHttp", True, known_words=frozenset({"XML"}))
+
+    assert list(spans) == [(0, 3), (3, 7)]
+
+
+@pytest.mark.parametrize(
+    "input",
+    [
+        "Hello, world!",
+        "helloWorld",
+        "HELLO-WORLD",
+        "HELLOWorld",
+        "heLlo WoRld",
+        r"the quick !b@rown fo%x jumped over the laZy Do'G",
+    ],
+)
+@pytest.mark.parametrize("kwargs", [{}, {"strip_punctuation": False}])
+def test_convert_all_matches_case_functions(input, kwargs):
+    converted = convert_all(input, **kwargs)
+
+    assert list(converted) == list(CASES)
+    for case, output in converted.items():
+        assert output == case_converter(case, **kwargs).convert(input)
+
+
+def test_convert_all_with_cases():
+    assert convert_all("Hello world", ["snake", "camel"]) == {
+        "snake": "hello_world",
+        "camel": "helloWorld",
+    }
+
+
+def test_unknown_case():
+    with pytest.raises(ValueError):
+        case_converter("unknown")
+
+
+@pytest.mark.parametrize(
+    "input, output",
+    [
+        ("hello", "flat"),
+        ("hello_world", "snake"),
+        ("hello-world2", "kebab"),
+        ("helloWorld", "camel"),
+        ("HelloWorld", "pascal"),
+        ("HELLO_WORLD", "macro"),
+        ("HELLO-WORLD", "cobol"),
+        ("Hello World", "title"),
+        ("hello_World", None),
+        ("hello world", None),
+        ("T", "pascal"),
+        ("T1", "pascal"),
+        ("AB", "macro"),
+        ("héllo_wörld", "snake"),
+        ("HÉLLO_WORLD", "macro"),
+        ("Über", "pascal"),
+        ("héllo_World", None),
+        ("", None),
+    ],
+)
+def test_detect_case(input, output):
+    assert detect_case(input) == output
+
+
+@pytest.mark.parametrize(
+    "input",
+    [
+        "hello",
+        "hello_world",
+        "helloWorld",
+        "HELLO-WORLD",
+        "Hello World",
+        "T",
+        "héllo_wörld",
+    ],
+)
+def test_detected_case_is_unchanged(input):
+    assert case_converter(detect_case(input)).convert(input) == input
+
+
+def test_detect_case_with_config():
+    assert detect_case("hello_world", delimiters="|") is None
+    assert detect_case("hello|world", delimiters="|") is None
+    assert detect_case("Hello World", delimiters="-") is None
@@ -0,0 +1,251 @@
+"""Conversion of very large strings in fixed size windows.
+
+A string is fed to a ChunkedConversion one window at a time and the output
+is produced window by window. Everything a whole string conversion looks
+at beyond the current window is carried over as state: delimiters that may
+turn out to be trailing, the last character converted, a delimiter waiting
+for the character it writes and the letter count of alternating case.
+
+Two properties of the whole string are needed up front, whether it is upper
+case and whether it contains a capital sigma, so a file is read twice.
+"""
+from .cases import case_converter
+from .engine import ChunkState
+
+# Characters per window.
+DEFAULT_WINDOW = 1 << 16
+
+SIGMA = "Σ"
+
+
+class ChunkedConversion(object):
+    """Convert a string fed in consecutive windows.
+
+    Concatenating the output of every feed() gives the same result as
+    converting the whole string.
+
+    Example
+
+        conversion = ChunkedConversion(Snake(), upper=False)
+        conversion.feed("Hello wo") => "hello_wo"
+        conversion.feed("rldFoo! ") => "rld_foo"
+        conversion.feed("", final=True) => ""
+
+    :param converter: A converter using the table engine.
+    :type converter: CaseConverter
+    :param upper: Whether the whole string is upper case, see str.isupper().
+    :type upper: bool
+    """
+
+    def __init__(self, converter, upper):
+        table = converter.table()
+        if table is None:
+            raise ValueError("chunked conversion requires the table engine")
+
+        # A known word may span two windows.
+        if converter.config().get("known_words"):
+            raise ValueError("chunked conversion does not support known words")
+
+        self._converter = converter
+        self._table = table
+        self._upper = upper
+        self._delimiters = converter.delimiters()
+        self._state = ChunkState(converter.chunk_mutator())
+
+        # Delimiters at the end of the last window, stripped if nothing
+        # follows them.
+        self._held = ""
+        self._started = False
+        self._after_delimiter = False
+
+    def feed(self, s, final=False):
+        """Convert the next window of the string.
+
+        :param s: The window, following the windows already fed.
+        :type s: str
+        :param final: Whether s is the last window. The last window may be
+            empty.
+        :type final: bool
+        :return: The output for the window.
+        :rtype: str
+        """
+        s = self._preprocess(s, final)
+
+        if self._upper:
+            converted = self._converter.convert_upper(s)
+            if converted is not None:
+                return converted
+
+        s = self._converter.prepare_chunk(s, self._upper)
+
+        return self._table.convert_chunk(s, self._state, final)
+
+    def _preprocess(self, s, final):
+        """Preprocess a window as part of the whole string.
+
+        :rtype: str
+        """
+        delimiters = self._delimiters
+        s = self._held + s
+
+        if not self._started:
+            s = s.lstrip(delimiters)
+            if not s:
+                self._held = ""
+                return ""
+
+            self._started = True
+
+        body = s.rstrip(delimiters)
+        self._held = "" if final else s[len(body) :]
+
+        s = self._converter.collapse(body)
+
+        # Recurring delimiters may span windows.
+        if self._after_delimiter and s[:1] == delimiters[0]:
+            s = s[1:]
+
+        if s:
+            self._after_delimiter = s[-1] == delimiters[0]
+
+        return s
+
+
+def windows(s, size=DEFAULT_WINDOW):
+    """Cut a string into windows.
+
+    :rtype: generator
+    """
+    for i in range(0, len(s), size):
+        yield s[i : i + size]
+
+
+def recut(pieces, delimiters):
+    """Cut pieces of a string containing a capital sigma after delimiters.
+
+    Lower casing a capital sigma depends on the characters around it, so a
+    string containing one is only cut after a delimiter. Pieces without a
+    delimiter are joined to the next.
+
+    :param pieces: The string, in consecutive pieces.
+    :type delimiters: str
+    :rtype: generator
+    """
+    # Only a delimiter that is neither cased nor ignored by str.lower()
+    # separates a capital sigma from what follows.
+    if ("A" + SIGMA + delimiters[0] + "A").lower()[1] != "ς":
+        yield "".join(pieces)
+        return
+
+    carry = ""
+
+    for piece in pieces:
+        s = carry + piece
+        cut = max(s.rfind(c) for c in delimiters) + 1
+        carry = s[cut:]
+
+        if cut:
+            yield s[:cut]
+
+    yield carry
+
+
+def scan(pieces):
+    """Find whether a string fed in pieces is upper case and has a sigma.
+
+    :param pieces: The string, in consecutive pieces.
+    :return: A tuple of str.isupper() on the whole string and whether it
+        contains a capital sigma.
+    :rtype: tuple
+    """
+    lower = upper = sigma = False
+
+    for piece in pieces:
+        # A trailing capital letter makes isupper() False only when the
+        # piece has a lower case character.
+        lower = lower or not (piece + "A").isupper()
+        upper = upper or piece.isupper()
+        sigma = sigma or SIGMA in piece
+
+    return upper and not lower, sigma
+
+
+def feed(conversion, pieces):
+    """Feed every piece of a string to a ChunkedConversion.
+
+    :return: A generator of converted pieces, without empty pieces.
+    :rtype: generator
+    """
+    for piece in pieces:
+        converted = conversion.feed(piece)
+        if converted:
+            yield converted
+
+    converted = conversion.feed("", final=True)
+    if converted:
+        yield converted
+
+
+def convert_large(s, case="snake", window=DEFAULT_WINDOW, **kwargs):
+    """Convert a long string one window at a time.
+
+    The output is produced in pieces of about one window, so only the input
+    and a window of output need to be held in memory.
+
+    Example
+
+        with open("out.txt", "w") as f:
+            f.writelines(convert_large(document, "snake"))
+
+    :param s: The string to convert.
+    :type s: str
+    :param case: A case name, see CASES. Defaults to "snake".
+    :type case: str
+    :param window: Characters per window.
+    :type window: int
+    :param kwargs: Configuration passed to the converter constructor.
+    :return: A generator of converted pieces.
+    :rtype: generator
+    """
+    converter = case_converter(case, **kwargs)
+    conversion = ChunkedConversion(converter, s.isupper())
+
+    pieces = windows(s, window)
+    if SIGMA in s:
+        pieces = recut(pieces, converter.delimiters())
+
+    return feed(conversion, pieces)
+
+
+def convert_file(source, target, case="snake", window=DEFAULT_WINDOW, **kwargs):
+    """Convert a text file one window at a time.
+
+    The whole file is converted as a single string, delimiters at its ends
+    are stripped. Memory use does not depend on the size of the file, unless
+    it contains a capital sigma and long runs without delimiters, see
+    recut(). The source is read twice and must be seekable.
+
+    :param source: A text file open for reading.
+    :param target: A text file open for writing.
+    :param case: A case name, see CASES. Defaults to "snake".
+    :type case: str
+    :param window: Characters per window.
+    :type window: int
+    :param kwargs: Configuration passed to the converter constructor.
+    """
+    converter = case_converter(case, **kwargs)
+    start = source.tell()
+
+    def read():
+        source.seek(start)
+        return iter(lambda: source.read(window), "")
+
+    upper, sigma = scan(read())
+    conversion = ChunkedConversion(converter, upper)
+
+    pieces = read()
+    if sigma:
+        pieces = recut(pieces, converter.delimiters())
+
+    for converted in feed(conversion, pieces):
+        target.write(converted)
@@ -0,0 +1,83 @@
+import io
+
+import pytest
+from .cases import CASES, case_converter
+from .chunked import ChunkedConversion, convert_file, convert_large, scan
+from .snake import Snake
+
+STRINGS = [
+    "",
+    "  Hello, world!  ",
+    "helloWorld fooBar BAZQux",
+    "HELLO_WORLD -- FOO",
+    "hello !",
+    "!! hello",
+    "ΑΣ ΣΑΣ ΑΣ.",
+    "Hello wörld, ÉCOLE ß",
+    "a-_-b__C  d",
+]
+
+
+@pytest.mark.parametrize("case", sorted(CASES))
+@pytest.mark.parametrize("s", STRINGS)
+@pytest.mark.parametrize("window", [1, 2, 5, 1000])
+def test_convert_large(case, s, window):
+    expected = case_converter(case).convert(s)
+
+    assert "".join(convert_large(s, case, window)) == expected
+
+
+@pytest.mark.parametrize("case", sorted(CASES))
+@pytest.mark.parametrize(
+    "kwargs",
+    [
+        {"strip_punctuation": False},
+        {"delimiters": "|"},
+        {"delimiters": "."},
+    ],
+)
+@pytest.mark.parametrize("window", [1, 3])
+def test_convert_large_config(case, kwargs, window):
+    s = "..Hello|wORLD, foo.BarΣ ΑΣ|"
+    expected = case_converter(case, **kwargs).convert(s)
+
+    assert "".join(convert_large(s, case, window, **kwargs)) == expected
+
+
+@pytest.mark.parametrize("case", ["alternating", "camel", "macro", "title"])
+@pytest.mark.parametrize("window", [1, 4, 7])
+def test_convert_file(case, window):
+    s = "hello World\nFOO bar\n" * 5
+    target = io.StringIO()
+
+    convert_file(io.StringIO(s), target, case, window)
+
+    assert target.getvalue() == case_converter(case).convert(s)
+
+
+def test_feed():
+    conversion = ChunkedConversion(Snake(), upper=False)
+
+    assert conversion.feed("Hello wo") == "hello_wo"
+    assert conversion.feed("rldFoo! ") == "rld_foo"
+    assert conversion.feed("", final=True) == ""
+
+
+def test_buffer_engine():
+    with pytest.raises(ValueError):
+        ChunkedConversion(Snake(engine="buffer"), upper=False)
+
+
+@pytest.mark.parametrize(
+    "pieces, output",
+    [
+        ([], (False, False)),
+        (["ABC", "123"], (True, False)),
+        (["123", "ABC"], (True, False)),
+        (["ABC", "d"], (False, False)),
+        (["123"], (False, False)),
+        (["ΑΣ"], (True, True)),
+    ],
+)
+def test_scan(pieces, output):
+    assert scan(pieces) == output
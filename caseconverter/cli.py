@@ -0,0 +1,135 @@
+import argparse
+import sys
+
+from .batch import DEFAULT_CHUNKSIZE
+from .caseconverter import DELIMITERS
+from .cases import CASES
+from .specs import SPECS
+from .scanner import MIXED_CASE, Rewriter
+from .stream import convert_lines
+
+
+def parser():
+    p = argparse.ArgumentParser(
+        prog="caseconverter",
+        description="Convert every line of a file, or stdin, to a case.",
+    )
+    p.add_argument("input", nargs="?", help="Input file. Defaults to stdin.")
+    p.add_argument("output", nargs="?", help="Output file. Defaults to stdout.")
+    p.add_argument(
+        "-c", "--case", choices=sorted(set(CASES) | set(SPECS)), default="snake"
+    )
+    p.add_argument(
+        "-d",
+        "--delimiters",
+        default=DELIMITERS,
+        help="Characters separating words. Defaults to space, dash and underscore.",
+    )
+    p.add_argument(
+        "--no-strip-punctuation",
+        dest="strip_punctuation",
+        action="store_false",
+        help="Keep punctuation in the output.",
+    )
+    p.add_argument(
+        "-t",
+        "--tokens",
+        action="store_true",
+        help="Only convert the tokens matching --pattern, leaving the rest of "
+        "the text untouched.",
+    )
+    p.add_argument(
+        "-p",
+        "--pattern",
+        default=MIXED_CASE,
+        help="A regular expression matching the tokens converted with --tokens. "
+        "Defaults to camelCase and PascalCase identifiers.",
+    )
+    p.add_argument(
+        "-w",
+        "--workers",
+        type=int,
+        default=1,
+        help="Number of worker processes. Defaults to 1.",
+    )
+    p.add_argument(
+        "--chunksize",
+        type=int,
+        default=DEFAULT_CHUNKSIZE,
+        help="Number of lines sent to a worker at a time.",
+    )
+    return p
+
+
+def main(argv=None):
+    """Run the caseconverter command line interface.
+
+    :param argv: Arguments, defaults to sys.argv[1:].
+    :return: The exit status.
+    :rtype: int
+    """
+    args = parser().parse_args(argv)
+
+    if args.tokens:
+        return rewrite(args)
+
+    source = sys.stdin
+    if args.input not in (None, "-"):
+        source = open(args.input, encoding="utf-8", newline="")
+
+    target = sys.stdout
+    if args.output not in (None, "-"):
+        target = open(args.output, "w", encoding="utf-8", newline="")
+
+    try:
+        target.writelines(
+            convert_lines(
+                source,
+                args.case,
+                workers=args.workers,
+                chunksize=args.chunksize,
+                delimiters=args.delimiters,
+                strip_punctuation=args.strip_punctuation,
+            )
+        )
+    finally:
+        if source is not sys.stdin:
+            source.close()
+        if target is not sys.stdout:
+            target.close()
+
+    return 0
+
+
+def rewrite(args):
+    """Rewrite the tokens of the input. Files are read through mmap.
+
+    :rtype: int
+    """
+    rewriter = Rewriter(
+        args.case,
+        args.pattern,
+        delimiters=args.delimiters,
+        strip_punctuation=args.strip_punctuation,
+    )
+
+    stdin = args.input in (None, "-")
+    stdout = args.output in (None, "-")
+
+    if stdin:
+        target = sys.stdout
+        if not stdout:
+            target = open(args.output, "w", encoding="utf-8", newline="")
+    else:
+        target = sys.stdout.buffer if stdout else open(args.output, "wb")
+
+    try:
+        if stdin:
+            rewriter.rewrite_stream(sys.stdin, target)
+        else:
+            rewriter.rewrite_file(args.input, target)
+    finally:
+        if not stdout:
+            target.close()
+
+    return 0
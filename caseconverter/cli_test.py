@@ -0,0 +1,51 @@
+import io
+import sys
+
+import pytest
+from .cli import main
+
+
+def test_stdin_to_stdout(monkeypatch, capsys):
+    monkeypatch.setattr(sys, "stdin", io.StringIO("Hello, world!\nfooBar\n"))
+
+    assert main(["--case", "camel", "--no-strip-punctuation"]) == 0
+    assert capsys.readouterr().out == "hello,World!\nfooBar\n"
+
+
+def test_file_to_file(tmp_path):
+    source = tmp_path / "input.txt"
+    target = tmp_path / "output.txt"
+    source.write_bytes(b"hello|world\r\nfoo bar\n")
+
+    assert main([str(source), str(target), "-c", "macro", "-d", "|", "-w", "2"]) == 0
+    assert target.read_bytes() == b"HELLO_WORLD\r\nFOO BAR\n"
+
+
+def test_unknown_case():
+    with pytest.raises(SystemExit):
+        main(["--case", "unknown"])
+
+
+def test_tokens_file(tmp_path, monkeypatch):
+    source = tmp_path / "input.sql"
+    target = tmp_path / "output.sql"
+    source.write_bytes(b"SELECT userId\r\nFROM userAccounts\n")
+
+    assert main([str(source), str(target), "--tokens"]) == 0
+    assert target.read_bytes() == b"SELECT user_id\r\nFROM user_accounts\n"
+
+
+def test_tokens_stdin(monkeypatch, capsys):
+    monkeypatch.setattr(sys, "stdin", io.StringIO("let user_id = userId;\n"))
+
+    assert main(["--case", "camel", "--tokens", "--pattern", "[a-z]+_[a-z]+"]) == 0
+    assert capsys.readouterr().out == "let userId = userId;\n"
+
+
+def test_tokens_before_files(tmp_path):
+    source = tmp_path / "dump.sql"
+    target = tmp_path / "dump_snake.sql"
+    source.write_bytes(b"SELECT userId FROM userAccounts\n")
+
+    assert main(["--case", "snake", "--tokens", str(source), str(target)]) == 0
+    assert target.read_bytes() == b"SELECT user_id FROM user_accounts\n"
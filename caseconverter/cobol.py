@@ -1,5 +1,7 @@
 import re
-from .caseconverter import CaseConverter
+
+from .caseconverter import CaseConverter, get_converter
+from .cache import memoize
 from .boundaries import OnDelimeterUppercaseNext, OnUpperPrecededByLowerAppendUpper
 
 
@@ -13,20 +15,26 @@ class Cobol(CaseConverter):
         )
         self.add_boundary_handler(OnUpperPrecededByLowerAppendUpper(self.JOIN_CHAR))
 
-    def convert(self):
-        if self.raw().isupper():
-            return re.sub(
-                "[{}]+".format(re.escape(self.delimiters())),
-                self.JOIN_CHAR,
-                self.raw(),
-            )
-
-        return super(Cobol, self).convert()
+    def convert_upper(self, s):
+        return self._delimiters_re.sub(self.JOIN_CHAR, s)
 
     def mutate(self, c):
         return c.upper()
 
+    def mutate_string(self, s):
+        return s.upper()
+
+    def fixpoint(self):
+        if self.JOIN_CHAR not in self.delimiters():
+            return None
+
+        return r"[A-Z0-9]+(?:{0}[A-Z0-9]+)*".format(re.escape(self.JOIN_CHAR))
+
+    def mutation(self):
+        return str.upper
+
 
+@memoize
 def cobolcase(s, **kwargs):
     """Convert a string to cobol case
 
@@ -35,4 +43,4 @@ def cobolcase(s, **kwargs):
       Hello World => HELLO-WORLD
 
     """
-    return Cobol(s, **kwargs).convert()
+    return get_converter(Cobol, **kwargs).convert(s)
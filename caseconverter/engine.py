@@ -0,0 +1,788 @@
+"""Table driven conversion engine.
+
+The buffer engine in CaseConverter walks a string one character at a time,
+asking every BoundaryHandler whether it applies. The table engine produces
+identical output from the Rule descriptions of those handlers instead:
+
+    1. Every character is mapped to a single letter class with
+       str.translate().
+    2. One regular expression over the class string finds every candidate
+       boundary.
+    3. The text between boundaries is mutated in bulk and the pieces are
+       joined once.
+
+Steps 1 and 2 do not depend on the case being converted to, so their
+result, a Segmentation, can be shared when converting one string to
+several cases.
+
+The compiled engine runs the same steps in a Python function generated for
+each Table, with its rules written out as code, see Table.compiled().
+"""
+import re
+from functools import lru_cache
+
+from .boundaries import Rule, INIT, FIRST, DELIMITER, LOWER_UPPER, UPPER_UPPER
+
+TABLE = "table"
+COMPILED = "compiled"
+BUFFER = "buffer"
+ENGINES = (TABLE, COMPILED, BUFFER)
+
+# Character classes:
+#   d - delimiter
+#   l - lower case letter
+#   U - upper case letter
+#   V - upper case character that is not a letter, e.g. roman numerals
+#   o - anything else
+#
+# A boundary is a delimiter, or an upper case character following a lower
+# or upper case letter.
+BOUNDARY_RE = re.compile("d|(?<=[lU])[UV]")
+
+# Limits how many non-ASCII characters a CharacterClasses table remembers.
+MAX_CACHED_CLASSES = 4096
+
+# Where a known word may start: at a character not following a letter, or
+# at an upper case character following a lower case letter.
+WORD_START_RE = re.compile("(?<![lUV])[lUVo]|(?<=l)[UV]")
+
+# Marks the end of a word in a trie.
+WORD_END = None
+
+
+def classify(c, delimiters):
+    """Classify a single character.
+
+    :rtype: str
+    """
+    if c in delimiters:
+        return "d"
+
+    if c.isupper():
+        return "U" if c.isalpha() else "V"
+
+    if c.isalpha() and c.islower():
+        return "l"
+
+    return "o"
+
+
+class CharacterClasses(dict):
+    """A str.translate() table mapping characters to their class.
+
+    ASCII characters are classified up front, anything else is classified
+    on first sight. ASCII strings are classified with bytes.translate() and
+    the `ascii` table instead, which is several times faster.
+    """
+
+    def __init__(self, delimiters):
+        super(CharacterClasses, self).__init__(
+            (i, classify(chr(i), delimiters)) for i in range(128)
+        )
+        self._delimiters = delimiters
+        self.ascii = bytes(ord(self[i]) for i in range(128)) + b"o" * 128
+
+    def classify(self, s):
+        """Map every character of a string to its class.
+
+        :rtype: str
+        """
+        if s.isascii():
+            return s.encode("ascii").translate(self.ascii).decode("ascii")
+
+        return s.translate(self)
+
+    def __missing__(self, key):
+        cls = classify(chr(key), self._delimiters)
+
+        if len(self) < MAX_CACHED_CLASSES:
+            self[key] = cls
+
+        return cls
+
+
+@lru_cache(maxsize=32)
+def character_classes(delimiters):
+    """Retrieve the shared CharacterClasses for a set of delimiters.
+
+    :rtype: CharacterClasses
+    """
+    return CharacterClasses(delimiters)
+
+
+def supports(delimiters):
+    """Determine if the table engine can convert with the given delimiters.
+
+    Delimiters with a case can change class when a string is lower or upper
+    cased in prepare_string(), which the table engine does not model.
+
+    :rtype: bool
+    """
+    return not any(c.isupper() or c.islower() for c in delimiters)
+
+
+@lru_cache(maxsize=32)
+def word_trie(words):
+    """Build a trie of known words, shared by every Table using them.
+
+    The trie is a dict per node mapping characters to nodes. Nodes ending a
+    word hold WORD_END. It is never modified once built.
+
+    :param words: Words of at least two characters.
+    :type words: frozenset
+    :rtype: dict
+    """
+    trie = {}
+
+    for word in words:
+        if len(word) < 2:
+            raise ValueError("known words need two characters: {}".format(word))
+
+        node = trie
+        for c in word:
+            node = node.setdefault(c, {})
+        node[WORD_END] = True
+
+    return trie
+
+
+def match_word(s, classes, start, trie):
+    """Find the longest known word at a position.
+
+    A word must not be followed by a lower case letter.
+
+    :return: The end of the word, or None.
+    :rtype: int
+    """
+    node = trie
+    end = None
+
+    for i in range(start, len(s)):
+        node = node.get(s[i])
+        if node is None:
+            break
+
+        if WORD_END in node and classes[i + 1 : i + 2] != "l":
+            end = i + 1
+
+    return end
+
+
+def mark_words(s, classes, trie):
+    """Reclassify the known words in a string so each is one word.
+
+    Every character of a word but the first becomes "o", so none is a
+    boundary, and the last becomes "l" when an upper case character
+    follows, so it starts a new word. Characters are only looked up in the
+    trie where a word may start, so the cost does not depend on the number
+    of known words.
+
+    :param classes: The classes of s.
+    :type classes: str
+    :rtype: str
+    """
+    marked = None
+    end = 0
+
+    for m in WORD_START_RE.finditer(classes):
+        start = m.start()
+        if start < end or s[start] not in trie:
+            continue
+
+        # Known words may follow each other, e.g. XMLHTTP.
+        while start < len(s):
+            end = match_word(s, classes, start, trie)
+            if end is None:
+                end = start
+                break
+
+            if marked is None:
+                marked = list(classes)
+
+            marked[start + 1 : end] = "o" * (end - start - 1)
+            if classes[end : end + 1] in ("U", "V"):
+                marked[end - 1] = "l"
+
+            start = end
+
+    return classes if marked is None else "".join(marked)
+
+
+class Segmentation(object):
+    """The candidate boundaries of a string.
+
+    A Segmentation does not depend on any Rule so it can be shared by every
+    Table using the same delimiters and known words.
+
+    :param s: The string to segment.
+    :type s: str
+    :param classes: The CharacterClasses for the delimiters in use.
+    :type classes: CharacterClasses
+    :param words: A trie of known words, see word_trie().
+    :type words: dict
+    """
+
+    __slots__ = ("string", "classes", "positions")
+
+    def __init__(self, s, classes, words=None):
+        self.string = s
+        self.classes = classes.classify(s)
+        if words:
+            self.classes = mark_words(s, self.classes, words)
+
+        self.positions = [m.start() for m in BOUNDARY_RE.finditer(self.classes)]
+
+
+class Table(object):
+    """Convert prepared strings using a set of Rules.
+
+    :param delimiters: The converter delimiters.
+    :type delimiters: str
+    :param rules: Rules in boundary handler order. When two rules share a
+        kind the first takes precedence.
+    :type rules: list
+    :param mutate: Applied to every run of characters between boundaries.
+    :type mutate: callable
+    :param mutation: The str method mutate applies to every character, if
+        any, see CaseConverter.mutation().
+    :param words: A trie of known words never split, see word_trie().
+    :type words: dict
+    """
+
+    def __init__(self, delimiters, rules, mutate, mutation=None, words=None):
+        self._classes = character_classes(delimiters)
+        self._mutate = mutate
+        self._words = words
+
+        kinds = {}
+        for rule in rules:
+            kinds.setdefault(rule.kind, rule)
+
+        self._has_rules = bool(kinds)
+        self._init = kinds.get(INIT)
+        self._head = self._init or kinds.get(FIRST)
+        self._delimiter = kinds.get(DELIMITER)
+        self._lower_upper = kinds.get(LOWER_UPPER)
+        self._upper_upper = kinds.get(UPPER_UPPER)
+
+        # When every rule transforms characters as mutate does, the output
+        # can be mutated once after joining, see convert().
+        self._fused = (
+            mutation is not None
+            and self._head is None
+            and all(_fuses(rule, mutation) for rule in kinds.values())
+        )
+
+        self._translation = self._ascii_translation = None
+        self._upper_re = self._upper_join = None
+        if self._fused:
+            self._fuse(delimiters, mutation)
+
+        self._compiled = None
+
+    def _fuse(self, delimiters, mutation):
+        """Build the translations used by fused conversions of ASCII strings.
+
+        Delimiters are replaced and every character is mutated by a single
+        str.translate(). Joins before upper case boundaries are inserted
+        beforehand with a regular expression. Fused upper case boundaries
+        joining nothing change nothing, so if only delimiters are left the
+        conversion of any string is a translation.
+        """
+        table = {}
+        if self._delimiter is not None:
+            join = self._delimiter.join or None
+            table = {ord(c): join for c in delimiters}
+
+        ascii_translation = [table.get(i, mutation(chr(i))) for i in range(128)]
+
+        uppers = [
+            rule
+            for rule in (self._lower_upper, self._upper_upper)
+            if rule is not None and rule.join
+        ]
+        if not uppers:
+            self._translation = table
+            self._ascii_translation = ascii_translation
+            return
+
+        join = uppers[0].join
+        if any(rule.join != join for rule in uppers):
+            return
+
+        # The regular expression below does not know about known words.
+        if self._words:
+            return
+
+        # Inserted joins must survive the translation.
+        if join.translate(ascii_translation) != join:
+            return
+
+        def chars(*names):
+            return re.escape(
+                "".join(chr(i) for i in range(128) if self._classes[i] in names)
+            )
+
+        previous = [{LOWER_UPPER: "l", UPPER_UPPER: "U"}[rule.kind] for rule in uppers]
+        pattern = "(?<=[{}])".format(chars(*previous))
+        if self._delimiter is not None:
+            # See boundaries(), the character after a delimiter is consumed.
+            pattern += "(?<![{}].)".format(chars("d"))
+        pattern += "(?=[{}])".format(chars("U", "V"))
+
+        self._upper_re = re.compile(pattern)
+        self._upper_join = join
+        self._ascii_translation = ascii_translation
+
+    def segment(self, s, cache=None):
+        """Segment a string, reusing a cached Segmentation if possible.
+
+        :param cache: A dict mapping strings to their Segmentation, shared
+            between Tables with the same delimiters and known words.
+        :type cache: dict
+        :rtype: Segmentation
+        """
+        if cache is None:
+            return Segmentation(s, self._classes, self._words)
+
+        segmentation = cache.get(s)
+        if segmentation is None:
+            segmentation = cache[s] = Segmentation(s, self._classes, self._words)
+
+        return segmentation
+
+    def boundaries(self, segmentation, start=0, consumed=-1, origin=0):
+        """Yield the position and Rule of every boundary in a Segmentation.
+
+        A DELIMITER boundary covers the delimiter and the character after
+        it, any other boundary covers a single character.
+
+        :param start: The first position that may be a boundary.
+        :param consumed: The position of a character already written by a
+            delimiter rule, if any.
+        :param origin: The position of the segmented string within the whole
+            string, when converting in chunks.
+        """
+        classes = segmentation.classes
+        delimiter = self._delimiter
+        init = self._init is not None
+
+        # The character following a delimiter is written by the delimiter
+        # rule, so the character after it never sees an upper case boundary.
+
+        for i in segmentation.positions:
+            if i < start:
+                continue
+
+            if classes[i] == "d":
+                if delimiter is not None:
+                    consumed = i + 1
+                    yield i, delimiter
+
+                continue
+
+            if i - 1 == consumed or (init and origin + i == 1):
+                continue
+
+            if classes[i - 1] == "l":
+                rule = self._lower_upper
+            else:
+                rule = self._upper_upper
+
+            if rule is not None:
+                yield i, rule
+
+    def convert(self, s, cache=None, profile=None):
+        """Convert a prepared string.
+
+        :param cache: See segment().
+        :param profile: The analysis.Profile of s before it was prepared, if
+            known.
+        :rtype: str
+        """
+        mutate = self._mutate
+
+        if not self._has_rules:
+            return mutate(s)
+
+        # Without upper case characters only delimiters are boundaries.
+        lower = s.islower()
+
+        if profile is None:
+            ascii = s.isascii()
+        else:
+            ascii = profile.ascii
+
+            if lower and not profile.delimited:
+                if self._head is None:
+                    return mutate(s)
+
+                return self._head.join + _apply(self._head, s[0]) + mutate(s[1:])
+
+        if self._fused:
+            if self._ascii_translation is not None and ascii:
+                if self._upper_re is not None and not lower:
+                    s = self._upper_re.sub(self._upper_join, s)
+
+                return s.translate(self._ascii_translation)
+
+            if self._translation is not None:
+                return mutate(s.translate(self._translation))
+
+            return mutate(self._join(s, cache))
+
+        parts = []
+        start = 0
+
+        if self._head is not None and s:
+            parts.append(self._head.join)
+            parts.append(_apply(self._head, s[0]))
+            start = 1
+
+        for i, rule in self.boundaries(self.segment(s, cache), start):
+            parts.append(mutate(s[start:i]))
+            parts.append(rule.join)
+
+            if rule.kind == DELIMITER:
+                parts.append(_apply(rule, s[i + 1 : i + 2]))
+                start = i + 2
+            else:
+                parts.append(_apply(rule, s[i]))
+                start = i + 1
+
+        parts.append(mutate(s[start:]))
+
+        return "".join(parts)
+
+    def compiled(self):
+        """Generate a function equivalent to convert().
+
+        The rules are written out as code: joins become constants, known
+        transforms become str method calls and branches for missing rules
+        are left out, so no Rule is looked up while converting. The source
+        of the function is available as its `source` attribute.
+
+        :return: A function taking the arguments of convert().
+        """
+        if self._compiled is None:
+            self._compiled = self._compile()
+
+        return self._compiled
+
+    def _compile(self):
+        """Generate and compile the source of compiled().
+
+        :rtype: function
+        """
+        namespace = {
+            "mutate": self._mutate,
+            "segment": self.segment,
+            "join": self._join,
+            "translation": self._translation,
+            "ascii_translation": self._ascii_translation,
+            "upper_sub": self._upper_re and self._upper_re.sub,
+        }
+        lines = ["def convert(s, cache=None, profile=None):"]
+
+        def emit(depth, line):
+            lines.append("    " * (depth + 1) + line)
+
+        def apply(rule, c):
+            # The source of a rule transforming the character c.
+            if rule.transform is None:
+                return c
+
+            if rule.transform in (str.upper, str.lower):
+                return "{}.{}()".format(c, rule.transform.__name__)
+
+            name = "transform_" + rule.kind
+            namespace[name] = rule.transform
+            return "{}({})".format(name, c)
+
+        def write(depth, rule, c):
+            emit(depth, "parts.append(mutate(s[start:i]))")
+            if rule.join:
+                emit(depth, "parts.append({!r})".format(rule.join))
+            emit(depth, "parts.append({})".format(apply(rule, c)))
+
+        if not self._has_rules:
+            emit(0, "return mutate(s)")
+            return _build(lines, namespace)
+
+        emit(0, "lower = s.islower()")
+        emit(0, "if lower and profile is not None and not profile.delimited:")
+        if self._head is None:
+            emit(1, "return mutate(s)")
+        else:
+            head = repr(self._head.join) + " + " if self._head.join else ""
+            head += apply(self._head, "s[0]")
+            emit(1, "return {} + mutate(s[1:])".format(head))
+
+        if self._fused:
+            if self._ascii_translation is not None:
+                emit(0, "if s.isascii() if profile is None else profile.ascii:")
+                if self._upper_re is not None:
+                    emit(1, "if not lower:")
+                    emit(2, "s = upper_sub({!r}, s)".format(self._upper_join))
+                emit(1, "return s.translate(ascii_translation)")
+
+            if self._translation is not None:
+                emit(0, "return mutate(s.translate(translation))")
+            else:
+                emit(0, "return mutate(join(s, cache))")
+
+            return _build(lines, namespace)
+
+        emit(0, "segmentation = segment(s, cache)")
+        emit(0, "classes = segmentation.classes")
+        emit(0, "parts = []")
+        emit(0, "start = 0")
+        if self._head is not None:
+            emit(0, "if s:")
+            if self._head.join:
+                emit(1, "parts.append({!r})".format(self._head.join))
+            emit(1, "parts.append({})".format(apply(self._head, "s[0]")))
+            emit(1, "start = 1")
+        if self._delimiter is not None:
+            emit(0, "consumed = -1")
+
+        emit(0, "for i in segmentation.positions:")
+        if self._head is not None:
+            emit(1, "if not i:")
+            emit(2, "continue")
+        emit(1, 'if classes[i] == "d":')
+        if self._delimiter is not None:
+            write(2, self._delimiter, "s[i + 1 : i + 2]")
+            emit(2, "start = i + 2")
+            emit(2, "consumed = i + 1")
+        emit(2, "continue")
+
+        # See boundaries().
+        skips = []
+        if self._delimiter is not None:
+            skips.append("i - 1 == consumed")
+        if self._init is not None:
+            skips.append("i == 1")
+        if skips:
+            emit(1, "if {}:".format(" or ".join(skips)))
+            emit(2, "continue")
+
+        lower_upper, upper_upper = self._lower_upper, self._upper_upper
+        if lower_upper is not None and upper_upper is not None:
+            if lower_upper[1:] == upper_upper[1:]:
+                # Any upper case boundary is handled the same way.
+                write(1, lower_upper, "s[i]")
+                emit(1, "start = i + 1")
+            else:
+                emit(1, 'if classes[i - 1] == "l":')
+                write(2, lower_upper, "s[i]")
+                emit(2, "start = i + 1")
+                emit(1, "else:")
+                write(2, upper_upper, "s[i]")
+                emit(2, "start = i + 1")
+        elif lower_upper is not None:
+            emit(1, 'if classes[i - 1] == "l":')
+            write(2, lower_upper, "s[i]")
+            emit(2, "start = i + 1")
+        elif upper_upper is not None:
+            emit(1, 'if classes[i - 1] != "l":')
+            write(2, upper_upper, "s[i]")
+            emit(2, "start = i + 1")
+
+        emit(0, "parts.append(mutate(s[start:]))")
+        emit(0, 'return "".join(parts)')
+
+        return _build(lines, namespace)
+
+    def _join(self, s, cache=None):
+        """Replace delimiters and insert joins without mutating.
+
+        :rtype: str
+        """
+        parts = []
+        start = 0
+
+        for i, rule in self.boundaries(self.segment(s, cache)):
+            parts.append(s[start:i])
+            parts.append(rule.join)
+            # A delimiter is replaced, the character after it is kept.
+            start = i + 1 if rule.kind == DELIMITER else i
+
+        parts.append(s[start:])
+
+        return "".join(parts)
+
+    def convert_chunk(self, s, state, final=False):
+        """Convert the next chunk of a prepared string.
+
+        Concatenating the output for every chunk of a string gives the same
+        result as convert() on the whole string. A delimiter at the end of a
+        chunk is left pending until the character it writes is seen.
+
+        :param s: The chunk, following the chunks already converted.
+        :type s: str
+        :param state: The state of the conversion, updated in place.
+        :type state: ChunkState
+        :param final: Whether s is the last chunk.
+        :type final: bool
+        :rtype: str
+        """
+        mutate = state.mutate
+        state.position += len(s)
+
+        if not self._has_rules:
+            return mutate(s)
+
+        if not s:
+            return ""
+
+        # The last character converted is segmented again so an upper case
+        # boundary at the start of the chunk is found.
+        tail = state.tail
+        s = tail + s
+        origin = state.position - len(s)
+        start = len(tail)
+        parts = []
+
+        if state.pending is not None:
+            parts.append(_apply(state.pending, s[start]))
+            state.pending = None
+            start += 1
+        elif not tail and self._head is not None:
+            parts.append(self._head.join)
+            parts.append(_apply(self._head, s[0]))
+            start = 1
+
+        segmentation = Segmentation(s, self._classes)
+        consumed = state.consumed - origin
+
+        for i, rule in self.boundaries(segmentation, start, consumed, origin):
+            parts.append(mutate(s[start:i]))
+            parts.append(rule.join)
+
+            if rule.kind != DELIMITER:
+                parts.append(_apply(rule, s[i]))
+                start = i + 1
+            elif i + 1 < len(s) or final:
+                parts.append(_apply(rule, s[i + 1 : i + 2]))
+                start = i + 2
+                state.consumed = origin + i + 1
+            else:
+                state.pending = rule
+                start = i + 1
+                state.consumed = origin + i + 1
+
+        parts.append(mutate(s[start:]))
+        state.tail = s[-1:]
+
+        return "".join(parts)
+
+    def spans(self, s, cache=None):
+        """Yield the start and end of every word of a string.
+
+        Delimiters are not part of any word, empty words are not yielded.
+
+        :param cache: See segment().
+        :return: A generator of (start, end) tuples.
+        """
+        start = 0
+
+        for i, rule in self.boundaries(self.segment(s, cache)):
+            if i > start:
+                yield start, i
+
+            start = i + 1 if rule.kind == DELIMITER else i
+
+        if len(s) > start:
+            yield start, len(s)
+
+    def split(self, s, cache=None):
+        """Split a string into words at its boundaries.
+
+        Delimiters are dropped, empty words are not returned.
+
+        :param cache: See segment().
+        :rtype: list
+        """
+        return [s[start:end] for start, end in self.spans(s, cache)]
+
+
+class ChunkState(object):
+    """The state carried between the chunks of a chunked conversion.
+
+    :param mutate: Applied to every run of characters between boundaries,
+        in string order.
+    :type mutate: callable
+    """
+
+    __slots__ = ("mutate", "position", "tail", "consumed", "pending")
+
+    def __init__(self, mutate):
+        self.mutate = mutate
+        # Characters converted so far.
+        self.position = 0
+        # The last character converted.
+        self.tail = ""
+        # The position of the last character written by a delimiter rule.
+        self.consumed = -1
+        # A delimiter rule waiting for the first character of the next chunk.
+        self.pending = None
+
+
+# Boundaries shared by every case, used to split strings into words.
+WORD_RULES = [Rule(DELIMITER, "", None), Rule(LOWER_UPPER, "", None)]
+
+# Also splits every upper case letter following an upper case letter off,
+# as macro case does.
+ACRONYM_RULES = WORD_RULES + [Rule(UPPER_UPPER, "", None)]
+
+
+def _fuses(rule, mutation):
+    """Determine if a rule transforms characters as mutation does.
+
+    Upper case boundaries are always on upper case characters, which
+    str.upper() leaves unchanged.
+
+    :rtype: bool
+    """
+    if mutation(rule.join) != rule.join:
+        return False
+
+    if rule.transform is None:
+        return mutation is str.upper and rule.kind in (LOWER_UPPER, UPPER_UPPER)
+
+    return rule.transform is mutation
+
+
+@lru_cache(maxsize=64)
+def _compile_source(source):
+    """Compile generated source, once per distinct source.
+
+    :rtype: code
+    """
+    return compile(source, "<compiled table>", "exec")
+
+
+def _build(lines, namespace):
+    """Build the function generated by Table.compiled().
+
+    :param lines: The lines of the function definition.
+    :type lines: list
+    :param namespace: The globals of the function.
+    :type namespace: dict
+    :rtype: function
+    """
+    source = "\n".join(lines) + "\n"
+    exec(_compile_source(source), namespace)
+
+    convert = namespace["convert"]
+    convert.source = source
+
+    return convert
+
+
+def _apply(rule, c):
+    if rule.transform is None:
+        return c
+
+    return rule.transform(c)
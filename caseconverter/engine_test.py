@@ -0,0 +1,195 @@
+import pytest
+from . import *
+from .boundaries import BoundaryHandler, OnDelimeterLowercaseNext
+from .boundaries import Rule, FIRST, DELIMITER, LOWER_UPPER, UPPER_UPPER
+from .engine import TABLE, COMPILED, BUFFER, Table, character_classes
+from .engine import WORD_END, mark_words, word_trie
+
+CONVERTERS = [Alternating, Camel, Cobol, Flat, Kebab, Macro, Pascal, Snake, Title]
+
+
+@pytest.mark.parametrize("converter", CONVERTERS)
+@pytest.mark.parametrize(
+    "input",
+    [
+        "",
+        "Hello, world!",
+        "helloWORLD",
+        "HELLOWorld",
+        "a bCd",
+        "aB",
+        "! aB",
+        "hello !",
+        "- hello",
+        "ΣΑΣ ΟΔΟΣ",
+        "straße Ⅷx",
+        "İstanbul",
+    ],
+)
+@pytest.mark.parametrize(
+    "kwargs", [{}, {"strip_punctuation": False}, {"delimiters": "|"}]
+)
+def test_table_engine_matches_buffer_engine(converter, input, kwargs):
+    table = converter(engine=TABLE, **kwargs)
+    buffer = converter(engine=BUFFER, **kwargs)
+
+    assert table.convert(input) == buffer.convert(input)
+
+
+@pytest.mark.parametrize("converter", CONVERTERS)
+@pytest.mark.parametrize(
+    "input",
+    ["", "a bCd", "helloWORLD xY-z", "aB_cD", "aBC dEF", "a-B c_D", "x1Y 2Z"],
+)
+@pytest.mark.parametrize(
+    "kwargs", [{}, {"delimiters": "|"}, {"delimiters": "-_"}, {"delimiters": "1"}]
+)
+def test_ascii_fast_path_matches_segmentation(converter, input, kwargs):
+    c = converter(**kwargs)
+    segmented = Table(c.delimiters(), c.rules(), c.mutate_string)
+    fused = Table(c.delimiters(), c.rules(), c.mutate_string, c.mutation())
+    s = c.prepare_string(c.preprocess(input))
+
+    assert fused.convert(s) == segmented.convert(s)
+
+
+@pytest.mark.parametrize("input", ["", "Hello, World_42", "Héllo wörld Ⅷ"])
+def test_ascii_classes(input):
+    classes = character_classes(" -_")
+
+    assert classes.classify(input) == input.translate(classes)
+
+
+def test_unknown_engine():
+    with pytest.raises(ValueError):
+        Snake(engine="unknown")
+
+
+class OnDigitStar(BoundaryHandler):
+    def is_boundary(self, pc, c):
+        return c.isdigit()
+
+    def handle(self, pc, cc, input_buffer, output_buffer):
+        output_buffer.write("*")
+
+
+class Starred(Snake):
+    def define_boundaries(self):
+        super(Starred, self).define_boundaries()
+        self.add_boundary_handler(OnDigitStar())
+
+
+def test_undescribed_handler_uses_buffer_engine():
+    assert Starred().convert("helloWorld 42") == "hello_world_4*"
+
+
+class StarredO(Snake):
+    def mutate(self, c):
+        return "*" if c == "o" else c.lower()
+
+
+class OnDelimeterBang(OnDelimeterLowercaseNext):
+    def handle(self, pc, cc, input_buffer, output_buffer):
+        output_buffer.write("!")
+        output_buffer.write(input_buffer.read(1).lower())
+
+
+class Banged(Snake):
+    def define_boundaries(self):
+        self.add_boundary_handler(OnDelimeterBang(self.delimiters()))
+
+
+@pytest.mark.parametrize(
+    "converter, output", [(StarredO, "hell*_w*rld"), (Banged, "hello!world")]
+)
+@pytest.mark.parametrize("engine", [TABLE, BUFFER])
+def test_overridden_behavior_uses_buffer_engine(converter, output, engine):
+    assert converter(engine=engine).table() is None
+    assert converter(engine=engine).convert("Hello World") == output
+
+
+class OnDelimeterDot(OnDelimeterLowercaseNext):
+    def handle(self, pc, cc, input_buffer, output_buffer):
+        output_buffer.write(".")
+        output_buffer.write(input_buffer.read(1).lower())
+
+    def rule(self):
+        return Rule(DELIMITER, ".", str.lower)
+
+
+class Dotted(Snake):
+    def define_boundaries(self):
+        self.add_boundary_handler(OnDelimeterDot(self.delimiters()))
+
+
+def test_compiled_engine_with_handler_subclasses():
+    # Overriding handle() alone falls back to the buffer engine, overriding
+    # rule() with it keeps the compiled engine.
+    assert Banged(engine=COMPILED).table() is None
+    assert Banged(engine=COMPILED).convert("Hello World") == "hello!world"
+
+    assert Dotted(engine=COMPILED).table() is not None
+    for engine in (COMPILED, BUFFER):
+        assert Dotted(engine=engine).convert("Hello World") == "hello.world"
+
+
+@pytest.mark.parametrize("converter", CONVERTERS)
+@pytest.mark.parametrize(
+    "input", ["", "a bCd", "helloWORLD xY-z", "aB_cD", "x1Y 2Z", "ΣΑΣ ΟΔΟΣ", "İx"]
+)
+@pytest.mark.parametrize("kwargs", [{}, {"delimiters": "|"}, {"delimiters": "-_"}])
+def test_compiled_engine_matches_table_engine(converter, input, kwargs):
+    table = converter(engine=TABLE, **kwargs)
+    compiled = converter(engine=COMPILED, **kwargs)
+
+    assert compiled.convert(input) == table.convert(input)
+
+
+def test_compiled_source():
+    table = Camel().table()
+    convert = table.compiled()
+
+    assert convert is table.compiled()
+    assert convert.source.startswith("def convert(s, cache=None, profile=None):")
+    assert ".upper()" in convert.source
+    assert convert("hello world") == "helloWorld"
+
+
+@pytest.mark.parametrize(
+    "rules, output",
+    [
+        ([], "hello woRld"),
+        ([Rule(FIRST, "<", str.upper)], "<Hello woRld"),
+        ([Rule(DELIMITER, "", lambda c: c + c)], "hellowwoRld"),
+        ([Rule(UPPER_UPPER, "_", None)], "hello woRld"),
+        ([Rule(LOWER_UPPER, "_", str.lower)], "hello wo_rld"),
+    ],
+)
+def test_compiled_rules(rules, output):
+    table = Table(" ", rules, str)
+
+    assert table.compiled()("hello woRld") == table.convert("hello woRld") == output
+
+
+@pytest.mark.parametrize(
+    "input, output",
+    [
+        ("HTTPServer", "UoolUlllll"),
+        ("XMLHTTP", "UolUooo"),
+        ("aHTTPb", "lUolUl"),
+        ("HTTPs", "UolUl"),
+        ("a HTTP2", "ldUoooo"),
+    ],
+)
+def test_mark_words(input, output):
+    trie = word_trie(frozenset({"HTTP", "XML", "HTT"}))
+    classes = character_classes(" -_").classify(input)
+
+    assert mark_words(input, classes, trie) == output
+
+
+def test_word_trie_is_shared():
+    words = frozenset({"HTTP", "HTTPS"})
+
+    assert word_trie(words) is word_trie(frozenset(["HTTPS", "HTTP"]))
+    assert word_trie(words)["H"]["T"]["T"]["P"]["S"] == {WORD_END: True}
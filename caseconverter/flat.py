@@ -1,4 +1,5 @@
-from .caseconverter import CaseConverter
+from .caseconverter import CaseConverter, get_converter, lower
+from .cache import memoize
 from .boundaries import OnDelimeterLowercaseNext, OnUpperPrecededByLowerAppendLower
 
 
@@ -13,10 +14,23 @@ class Flat(CaseConverter):
 
         return s
 
+    def prepare_chunk(self, s, upper):
+        return s.lower() if upper else s
+
     def mutate(self, c):
         return c.lower()
 
+    def mutate_string(self, s):
+        return lower(s)
+
+    def fixpoint(self):
+        return r"[a-z0-9]*"
+
+    def mutation(self):
+        return str.lower
+
 
+@memoize
 def flatcase(s, **kwargs):
     """Convert a string to flat case
 
@@ -25,4 +39,4 @@ def flatcase(s, **kwargs):
         Hello World => helloworld
 
     """
-    return Flat(s, **kwargs).convert()
+    return get_converter(Flat, **kwargs).convert(s)
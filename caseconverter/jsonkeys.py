@@ -0,0 +1,134 @@
+"""Convert keys while decoding or encoding JSON.
+
+Keys are converted as JSON is parsed or serialized, without a separate pass
+over the document. Both directions use shared_key_cache() so a key seen
+once is never converted again.
+"""
+import json
+
+from .keys import shared_key_cache
+
+
+def object_pairs_hook(case="snake", **kwargs):
+    """Build an object_pairs_hook that converts keys while decoding.
+
+    Example
+
+        json.loads('{"userId": 1}', object_pairs_hook=object_pairs_hook("snake"))
+            => {"user_id": 1}
+
+    :param case: A case name, see CASES. Defaults to "snake".
+    :type case: str
+    :param kwargs: Configuration passed to the converter constructor.
+    :rtype: callable
+    """
+    converted = shared_key_cache(case, **kwargs)
+
+    def hook(pairs):
+        return {converted[key]: value for key, value in pairs}
+
+    return hook
+
+
+class Pending(object):
+    """A dict, list or tuple whose keys are converted when it is encoded."""
+
+    __slots__ = ("value",)
+
+    def __init__(self, value):
+        self.value = value
+
+
+CONTAINERS = (dict, list, tuple)
+
+
+class CaseConvertingEncoder(json.JSONEncoder):
+    """A JSONEncoder that converts dict keys while encoding.
+
+    Containers are handed to the encoder as Pending placeholders. When the
+    encoder reaches one it asks default() for a replacement, which renames
+    that container's keys only, so each container is copied shallowly just
+    before it is written and released afterwards.
+
+    With check_circular, the same container is always handed over as the
+    same placeholder, so the encoder detects circular references.
+
+    Example
+
+        json.dumps({"user_id": 1}, cls=CaseConvertingEncoder, case="camel")
+            => '{"userId": 1}'
+
+    :param case: A case name, see CASES. Defaults to "camel".
+    :type case: str
+    :param case_options: Configuration passed to the converter constructor.
+    :type case_options: dict
+    :param kwargs: Passed to json.JSONEncoder.
+    """
+
+    def __init__(self, *args, case="camel", case_options=None, **kwargs):
+        super(CaseConvertingEncoder, self).__init__(*args, **kwargs)
+        self._converted = shared_key_cache(case, **(case_options or {}))
+        self._placeholders = None
+
+    def iterencode(self, o, _one_shot=False):
+        if self.check_circular:
+            self._placeholders = {}
+
+        return super(CaseConvertingEncoder, self).iterencode(
+            self.pending(o), _one_shot
+        )
+
+    def pending(self, value):
+        """Wrap a container in a Pending placeholder.
+
+        :return: The placeholder, or the value if it is not a container.
+        """
+        if not isinstance(value, CONTAINERS):
+            return value
+
+        placeholders = self._placeholders
+        if placeholders is None:
+            return Pending(value)
+
+        # Placeholders keep their value alive, so ids are not reused.
+        try:
+            return placeholders[id(value)]
+        except KeyError:
+            placeholder = placeholders[id(value)] = Pending(value)
+            return placeholder
+
+    def default(self, o):
+        if not isinstance(o, Pending):
+            return super(CaseConvertingEncoder, self).default(o)
+
+        pending = self.pending
+        value = o.value
+        if isinstance(value, dict):
+            converted = self._converted
+            return {converted[k]: pending(v) for k, v in value.items()}
+
+        return [pending(v) for v in value]
+
+
+def loads(s, case="snake", case_options=None, **kwargs):
+    """Decode JSON, converting keys.
+
+    :param case_options: Configuration passed to the converter constructor.
+    :type case_options: dict
+    :param kwargs: Passed to json.loads().
+    """
+    hook = object_pairs_hook(case, **(case_options or {}))
+    return json.loads(s, object_pairs_hook=hook, **kwargs)
+
+
+def dumps(obj, case="camel", case_options=None, **kwargs):
+    """Encode JSON, converting keys.
+
+    :param case_options: Configuration passed to the converter constructor.
+    :type case_options: dict
+    :param kwargs: Passed to json.dumps().
+    :rtype: str
+    """
+    return json.dumps(
+        obj, cls=CaseConvertingEncoder, case=case, case_options=case_options, **kwargs
+    )
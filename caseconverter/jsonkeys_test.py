@@ -0,0 +1,100 @@
+import json
+from datetime import date
+
+import pytest
+from . import *
+from . import jsonkeys
+from .keys import KeyCache, shared_key_cache
+
+DOCUMENT = {"userId": 1, "orderItems": [{"itemName": "a"}, ({"unitPrice": 2},)]}
+
+
+def test_object_pairs_hook():
+    text = json.dumps(DOCUMENT)
+
+    assert json.loads(text, object_pairs_hook=object_pairs_hook("snake")) == {
+        "user_id": 1,
+        "order_items": [{"item_name": "a"}, [{"unit_price": 2}]],
+    }
+    assert jsonkeys.loads(text) == json.loads(
+        text, object_pairs_hook=object_pairs_hook("snake")
+    )
+
+
+@pytest.mark.parametrize(
+    "kwargs", [{}, {"indent": 2}, {"sort_keys": True}, {"separators": (",", ":")}]
+)
+def test_encoder_matches_convert_keys(kwargs):
+    assert json.dumps(
+        DOCUMENT, cls=CaseConvertingEncoder, case="macro", **kwargs
+    ) == json.dumps(convert_keys(DOCUMENT, "macro"), **kwargs)
+
+
+def test_encoder_case_options():
+    assert (
+        json.dumps(
+            {"IP Address": 1},
+            cls=CaseConvertingEncoder,
+            case="macro",
+            case_options={"delims_only": True},
+        )
+        == '{"IP_ADDRESS": 1}'
+    )
+
+
+def test_encoder_default():
+    class Encoder(CaseConvertingEncoder):
+        def default(self, o):
+            if isinstance(o, date):
+                return o.isoformat()
+
+            return super(Encoder, self).default(o)
+
+    assert (
+        json.dumps({"created_at": date(2020, 1, 2)}, cls=Encoder)
+        == '{"createdAt": "2020-01-02"}'
+    )
+
+    with pytest.raises(TypeError):
+        jsonkeys.dumps({"created_at": date(2020, 1, 2)})
+
+
+def test_encoder_scalars():
+    assert jsonkeys.dumps("user_id") == '"user_id"'
+    assert jsonkeys.dumps([1, None]) == "[1, null]"
+
+
+def test_shared_key_cache():
+    assert shared_key_cache("snake") is shared_key_cache("snake")
+    assert shared_key_cache("snake")["userId"] == "user_id"
+
+
+def test_key_cache_bounded():
+    cache = KeyCache(str.upper, maxsize=2)
+    for key in "abcde":
+        assert cache[key] == key.upper()
+
+    assert len(cache) <= 2
+
+
+@pytest.mark.parametrize("kwargs", [{}, {"indent": 2}])
+def test_encoder_circular(kwargs):
+    items = [{"item_name": "a"}]
+    items.append(items)
+
+    with pytest.raises(ValueError, match="Circular reference detected"):
+        jsonkeys.dumps({"order_items": items}, **kwargs)
+
+    shared = {"item_name": "a"}
+    assert jsonkeys.dumps([shared, shared], **kwargs) == json.dumps(
+        [{"itemName": "a"}] * 2, **kwargs
+    )
+
+
+def test_case_options():
+    assert jsonkeys.dumps({"IP Address": 1}, "macro", {"delims_only": True}) == (
+        '{"IP_ADDRESS": 1}'
+    )
+    assert jsonkeys.loads('{"IP Address": 1}', "macro", {"delims_only": True}) == {
+        "IP_ADDRESS": 1
+    }
@@ -1,4 +1,7 @@
-from .caseconverter import CaseConverter
+import re
+
+from .caseconverter import CaseConverter, get_converter, lower
+from .cache import memoize
 from .boundaries import OnDelimeterLowercaseNext, OnUpperPrecededByLowerAppendLower
 
 
@@ -18,10 +21,26 @@ class Kebab(CaseConverter):
 
         return s
 
+    def prepare_chunk(self, s, upper):
+        return s.lower() if upper else s
+
     def mutate(self, c):
         return c.lower()
 
+    def mutate_string(self, s):
+        return lower(s)
+
+    def fixpoint(self):
+        if self.JOIN_CHAR not in self.delimiters():
+            return None
+
+        return r"[a-z0-9]+(?:{0}[a-z0-9]+)*".format(re.escape(self.JOIN_CHAR))
+
+    def mutation(self):
+        return str.lower
+
 
+@memoize
 def kebabcase(s, **kwargs):
     """Convert a string to kebab case
 
@@ -30,4 +49,4 @@ def kebabcase(s, **kwargs):
         Hello World => hello-world
 
     """
-    return Kebab(s, **kwargs).convert()
+    return get_converter(Kebab, **kwargs).convert(s)
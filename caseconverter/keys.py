@@ -0,0 +1,240 @@
+from functools import lru_cache
+
+from .caseconverter import cache_config
+from .cases import case_converter
+
+# Maximum number of keys remembered by a shared KeyCache.
+SHARED_KEY_CACHE_SIZE = 65536
+
+
+class KeyCache(dict):
+    """Memoize key conversions.
+
+    Looking up a key returns its conversion. Keys that are not strings, or
+    of the configured types, are returned unchanged.
+
+    :param convert: Converts a single key.
+    :type convert: callable
+    :param maxsize: The maximum number of keys remembered. A full cache is
+        emptied before remembering another key. Defaults to no limit.
+    :type maxsize: int
+    :param types: The type, or tuple of types, of keys that are converted.
+        Defaults to str.
+    :param maxlength: Keys longer than this are converted but not
+        remembered, so a bounded number of keys is a bounded amount of
+        memory. Defaults to no limit.
+    :type maxlength: int
+    """
+
+    def __init__(self, convert, maxsize=None, types=str, maxlength=None):
+        self._convert = convert
+        self._maxsize = maxsize
+        self._types = types
+        self._maxlength = maxlength
+
+    def __missing__(self, key):
+        if not isinstance(key, self._types):
+            value = key
+        else:
+            value = self._convert(key)
+            if self._maxlength is not None and len(key) > self._maxlength:
+                return value
+
+        if self._maxsize is not None and len(self) >= self._maxsize:
+            self.clear()
+
+        self[key] = value
+        return value
+
+
+def shared_key_cache(case="camel", **kwargs):
+    """Retrieve the KeyCache shared by everything converting keys to a case.
+
+    Shared caches are bounded by SHARED_KEY_CACHE_SIZE.
+
+    :param case: A case name, see CASES.
+    :type case: str
+    :param kwargs: Configuration passed to the converter constructor.
+    :rtype: KeyCache
+    """
+    return _shared_key_cache(case, **cache_config(kwargs))
+
+
+@lru_cache(maxsize=128)
+def _shared_key_cache(case, **kwargs):
+    return KeyCache(case_converter(case, **kwargs).convert, SHARED_KEY_CACHE_SIZE)
+
+
+class KeyRenamer(object):
+    """Rename the keys of records that share a few shapes.
+
+    The first record with a given sequence of keys compiles a rename plan,
+    the tuple of converted keys. Later records with the same keys in the
+    same order are renamed by zipping the plan with their values, without
+    looking at individual keys. Records with new keys compile a new plan,
+    converting only keys that have not been seen before.
+
+    Only the top level keys of a record are renamed, see convert_keys() for
+    nested structures.
+
+    Example
+
+        renamer = KeyRenamer("camel")
+        renamer.rename({"user_id": 1, "created_at": 2})
+            => {"userId": 1, "createdAt": 2}
+
+    :param case: A case name, see CASES. Defaults to "camel".
+    :type case: str
+    :param max_plans: The maximum number of plans kept. Records of further
+        shapes are renamed key by key.
+    :type max_plans: int
+    :param max_keys: The maximum number of converted keys remembered.
+        Defaults to SHARED_KEY_CACHE_SIZE.
+    :type max_keys: int
+    :param kwargs: Configuration passed to the converter constructor.
+    """
+
+    def __init__(
+        self, case="camel", max_plans=1024, max_keys=SHARED_KEY_CACHE_SIZE, **kwargs
+    ):
+        self._converted = KeyCache(case_converter(case, **kwargs).convert, max_keys)
+        self._max_plans = max_plans
+        self._plans = {}
+
+    def plan(self, keys):
+        """Retrieve the rename plan for a sequence of keys.
+
+        :param keys: A tuple of record keys.
+        :type keys: tuple
+        :return: The converted keys, in the same order.
+        :rtype: tuple
+        """
+        try:
+            return self._plans[keys]
+        except KeyError:
+            pass
+
+        plan = tuple(map(self._converted.__getitem__, keys))
+        if len(self._plans) < self._max_plans:
+            self._plans[keys] = plan
+
+        return plan
+
+    def rename(self, record):
+        """Rename the keys of a record.
+
+        :type record: dict
+        :return: A new dict with converted keys.
+        :rtype: dict
+        """
+        return dict(zip(self.plan(tuple(record)), record.values()))
+
+    def rename_many(self, records):
+        """Rename the keys of every record in an iterable.
+
+        Consecutive records with the same keys reuse the last plan without a
+        lookup.
+
+        :return: A generator of renamed records.
+        """
+        keys = plan = None
+
+        for record in records:
+            record_keys = tuple(record)
+            if record_keys != keys:
+                keys = record_keys
+                plan = self.plan(keys)
+
+            yield dict(zip(plan, record.values()))
+
+
+def convert_keys(obj, case="camel", recursive=True, skip=(), **kwargs):
+    """Convert the keys of every dict in a nested structure.
+
+    Dicts, lists and tuples are walked with an explicit stack rather than
+    recursion, so deeply nested payloads cannot hit the recursion limit.
+    Every container is copied once. Each distinct key is converted once per
+    call. Keys that are not strings and values that are not containers are
+    left untouched. Containers holding themselves raise ValueError.
+
+    Example
+
+        convert_keys({"user_id": 1, "tags": [{"tag_name": "a"}]}, "camel")
+            => {"userId": 1, "tags": [{"tagName": "a"}]}
+
+    :param obj: A dict, list or tuple, e.g. a decoded JSON document.
+    :param case: A case name, see CASES. Defaults to "camel".
+    :type case: str
+    :param recursive: Convert the keys of nested dicts. If False only the
+        keys of obj are converted and values are left untouched.
+    :type recursive: bool
+    :param skip: Keys, before conversion, whose values are left untouched.
+    :param kwargs: Configuration passed to the converter constructor.
+    :return: A copy of obj with converted keys.
+    """
+    converted = KeyCache(case_converter(case, **kwargs).convert)
+    skip = frozenset(skip)
+
+    if not recursive:
+        if isinstance(obj, dict):
+            return {converted[k]: v for k, v in obj.items()}
+
+        return obj
+
+    root = [obj]
+    stack = [(obj, root, 0)]
+    # Tuples are built as lists and frozen once their items are converted.
+    tuples = []
+    # The ids of the containers being converted. A container is left when
+    # its (container, None, None) entry is popped, after its items.
+    path = set()
+
+    while stack:
+        source, parent, slot = stack.pop()
+
+        if parent is None:
+            path.remove(id(source))
+            continue
+
+        # When two keys convert to the same key the last one wins, so the
+        # value of an earlier key is no longer in its slot.
+        if parent[slot] is not source:
+            continue
+
+        if isinstance(source, (dict, list, tuple)):
+            if id(source) in path:
+                raise ValueError("Circular reference detected")
+
+            path.add(id(source))
+            stack.append((source, None, None))
+
+        if isinstance(source, dict):
+            target = parent[slot] = {}
+
+            for key, value in source.items():
+                new_key = converted[key]
+                target[new_key] = value
+
+                if isinstance(value, (dict, list, tuple)) and key not in skip:
+                    stack.append((value, target, new_key))
+
+        elif isinstance(source, (list, tuple)):
+            target = parent[slot] = []
+
+            if isinstance(source, tuple):
+                tuples.append((parent, slot))
+
+            for value in source:
+                if isinstance(value, (dict, list, tuple)):
+                    stack.append((value, target, len(target)))
+
+                target.append(value)
+
+        else:
+            parent[slot] = source
+
+    # Inner tuples were created after their parents, freeze them first.
+    for parent, slot in reversed(tuples):
+        parent[slot] = tuple(parent[slot])
+
+    return root[0]
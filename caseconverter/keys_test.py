@@ -0,0 +1,127 @@
+import sys
+
+import pytest
+from . import *
+
+
+@pytest.mark.parametrize(
+    "obj, case, kwargs, output",
+    [
+        (
+            {"user_id": 1, "tags": [{"tag_name": "a"}, "b_c"]},
+            "camel",
+            {},
+            {"userId": 1, "tags": [{"tagName": "a"}, "b_c"]},
+        ),
+        (
+            [{"userId": 1}, ({"createdAt": (1, {"fooBar": 2})},)],
+            "snake",
+            {},
+            [{"user_id": 1}, ({"created_at": (1, {"foo_bar": 2})},)],
+        ),
+        ({1: {"a b": 2}}, "macro", {}, {1: {"A_B": 2}}),
+        ({"a b": {"c d": 1}}, "kebab", {"recursive": False}, {"a-b": {"c d": 1}}),
+        (
+            {"a b": {"c d": 1}, "e f": {"g h": 2}},
+            "pascal",
+            {"skip": ["e f"]},
+            {"AB": {"CD": 1}, "EF": {"g h": 2}},
+        ),
+        (
+            {"Hello, world!": 1},
+            "camel",
+            {"strip_punctuation": False},
+            {"hello,World!": 1},
+        ),
+        ({"user_id": {"a_b": 1}, "userId": 5}, "camel", {}, {"userId": 5}),
+        ({"user_id": 5, "userId": {"a_b": 1}}, "camel", {}, {"userId": {"aB": 1}}),
+        (
+            {"user_id": {"a_b": 1}, "userId": {"c_d": 2}},
+            "camel",
+            {},
+            {"userId": {"cD": 2}},
+        ),
+        ("helloWorld", "snake", {}, "helloWorld"),
+        ([], "snake", {}, []),
+    ],
+)
+def test_convert_keys(obj, case, kwargs, output):
+    assert convert_keys(obj, case, **kwargs) == output
+
+
+def test_convert_keys_does_not_modify_input():
+    obj = {"user_id": [{"tag_name": 1}]}
+    convert_keys(obj)
+
+    assert obj == {"user_id": [{"tag_name": 1}]}
+
+
+def test_convert_keys_deeply_nested():
+    depth = sys.getrecursionlimit() * 2
+    obj = {}
+    inner = obj
+    for _ in range(depth):
+        inner["child_node"] = inner = {}
+
+    converted = convert_keys(obj)
+    for _ in range(depth):
+        converted = converted["childNode"]
+
+    assert converted == {}
+
+
+def test_convert_keys_circular():
+    obj = {"user_id": 1}
+    obj["self_ref"] = obj
+    items = [obj]
+
+    for circular in (obj, {"order_items": (items,)}, items):
+        with pytest.raises(ValueError, match="Circular reference detected"):
+            convert_keys(circular)
+
+    shared = {"tag_name": 1}
+    assert convert_keys([shared, (shared, [shared])]) == [
+        {"tagName": 1},
+        ({"tagName": 1}, [{"tagName": 1}]),
+    ]
+
+
+def test_key_renamer():
+    renamer = KeyRenamer("snake")
+    records = [
+        {"userId": 1, "createdAt": 2},
+        {"userId": 3, "createdAt": 4},
+        {"createdAt": 5, "userId": 6},
+        {"userId": 7, "orderTotal": 8},
+    ]
+
+    assert list(renamer.rename_many(records)) == [
+        {"user_id": 1, "created_at": 2},
+        {"user_id": 3, "created_at": 4},
+        {"created_at": 5, "user_id": 6},
+        {"user_id": 7, "order_total": 8},
+    ]
+    assert renamer.rename({"userId": 9}) == {"user_id": 9}
+
+
+def test_key_renamer_reuses_plans():
+    renamer = KeyRenamer("kebab")
+
+    assert renamer.plan(("a b", 1)) == ("a-b", 1)
+    assert renamer.plan(("a b", 1)) is renamer.plan(("a b", 1))
+
+
+def test_key_renamer_bounds_plans():
+    renamer = KeyRenamer("macro", max_plans=2)
+    for i in range(10):
+        assert renamer.rename({"key {}".format(i): i}) == {"KEY_{}".format(i): i}
+
+    assert len(renamer._plans) == 2
+
+
+def test_key_renamer_bounds_keys():
+    renamer = KeyRenamer("macro", max_plans=0, max_keys=3)
+    for i in range(10):
+        assert renamer.rename({"key {}".format(i): i}) == {"KEY_{}".format(i): i}
+
+    assert len(renamer._converted) <= 3
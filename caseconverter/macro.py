@@ -1,5 +1,7 @@
 import re
-from .caseconverter import CaseConverter
+
+from .caseconverter import CaseConverter, get_converter
+from .cache import memoize
 from .boundaries import (
     OnDelimeterUppercaseNext,
     OnUpperPrecededByLowerAppendUpper,
@@ -14,6 +16,7 @@ class Macro(CaseConverter):
     def __init__(self, *args, delims_only=False, **kwargs):
         self._delims_only = delims_only
         super(Macro, self).__init__(*args, **kwargs)
+        self._config["delims_only"] = delims_only
 
     def define_boundaries(self):
         self.add_boundary_handler(
@@ -24,20 +27,26 @@ class Macro(CaseConverter):
             self.add_boundary_handler(OnUpperPrecededByLowerAppendUpper(self.JOIN_CHAR))
             self.add_boundary_handler(OnUpperPrecededByUpperAppendJoin(self.JOIN_CHAR))
 
-    def convert(self):
-        if self.raw().isupper():
-            return re.sub(
-                "[{}]+".format(re.escape(self.delimiters())),
-                self.JOIN_CHAR,
-                self.raw(),
-            )
-
-        return super(Macro, self).convert()
+    def convert_upper(self, s):
+        return self._delimiters_re.sub(self.JOIN_CHAR, s)
 
     def mutate(self, c):
         return c.upper()
 
+    def mutate_string(self, s):
+        return s.upper()
+
+    def fixpoint(self):
+        if self.JOIN_CHAR not in self.delimiters():
+            return None
+
+        return r"[A-Z0-9]+(?:{0}[A-Z0-9]+)*".format(re.escape(self.JOIN_CHAR))
+
+    def mutation(self):
+        return str.upper
+
 
+@memoize
 def macrocase(s, **kwargs):
     """Convert a string to macro case
 
@@ -46,4 +55,4 @@ def macrocase(s, **kwargs):
         Hello World => HELLO_WORLD
 
     """
-    return Macro(s, **kwargs).convert()
+    return get_converter(Macro, **kwargs).convert(s)
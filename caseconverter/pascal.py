@@ -1,6 +1,9 @@
-from .caseconverter import CaseConverter
+from .caseconverter import CaseConverter, get_converter, lower
+from .cache import memoize
 from .boundaries import (
     BoundaryHandler,
+    Rule,
+    FIRST,
     OnDelimeterUppercaseNext,
     OnUpperPrecededByLowerAppendUpper,
     OnUpperPrecededByUpperAppendCurrent,
@@ -15,6 +18,9 @@ class OnFirstCharUpper(BoundaryHandler):
     def handle(self, pc, cc, input_buffer, output_buffer):
         output_buffer.write(cc.upper())
 
+    def rule(self):
+        return Rule(FIRST, "", str.upper)
+
 
 class Pascal(CaseConverter):
 
@@ -30,10 +36,23 @@ class Pascal(CaseConverter):
 
         return s
 
+    def prepare_chunk(self, s, upper):
+        return s.lower() if upper else s
+
     def mutate(self, c):
         return c.lower()
 
+    def mutate_string(self, s):
+        return lower(s)
+
+    def fixpoint(self):
+        return r"(?=.*[a-z])[A-Z0-9](?:[a-z0-9]|(?<=[A-Za-z])[A-Z])*|[A-Z][0-9]*"
+
+    def mutation(self):
+        return str.lower
+
 
+@memoize
 def pascalcase(s, **kwargs):
     """Convert a string to pascal case
 
@@ -43,4 +62,4 @@ def pascalcase(s, **kwargs):
         hello world => HelloWorld
 
     """
-    return Pascal(s, **kwargs).convert()
+    return get_converter(Pascal, **kwargs).convert(s)
@@ -0,0 +1,164 @@
+"""Rewrite the identifiers inside free text, such as source files or dumps.
+
+A Rewriter finds tokens with a regular expression, converts each distinct
+token once and leaves the text between tokens untouched. Text can be
+rewritten in memory, from a stream one window at a time or, for files on
+disk, through mmap without reading the file into memory.
+"""
+import mmap
+import re
+
+from .cache import MAX_CACHED_LENGTH
+from .cases import case_converter
+from .keys import KeyCache
+
+# An ASCII word character or any character outside ASCII. Used in place of
+# \b so a pattern finds the same tokens in text and in UTF-8 bytes.
+WORD = r"[^\x00-\x2f\x3a-\x40\x5b-\x5e\x60\x7b-\x7f]"
+
+# Every ASCII identifier.
+IDENTIFIERS = r"(?<!{0})[A-Za-z_][0-9A-Za-z_]*(?!{0})".format(WORD)
+
+# Identifiers with an upper case letter following a lower case letter and no
+# underscore, e.g. camelCase and PascalCase.
+MIXED_CASE = r"(?<!{0})[0-9A-Za-z]*[a-z][A-Z][0-9A-Za-z]*(?!{0})".format(WORD)
+
+# Number of distinct tokens remembered.
+TOKEN_CACHE_SIZE = 65536
+
+# Characters read from a stream, or bytes written, at a time.
+DEFAULT_WINDOW = 1 << 20
+
+# Tokens are assumed not to contain these, streams are cut after them.
+SEPARATORS = " \t\r\n"
+
+
+class Rewriter(object):
+    """Convert the tokens matching a pattern inside a larger text.
+
+    Example
+
+        rewriter = Rewriter("snake")
+        rewriter.rewrite("SELECT userId FROM userAccounts")
+            => "SELECT user_id FROM user_accounts"
+
+    :param case: A case name, see CASES. Defaults to "snake".
+    :type case: str
+    :param pattern: A regular expression matching the tokens to convert.
+        Tokens must not contain whitespace. Bytes are searched with the same
+        pattern, which must then be ASCII. Defaults to MIXED_CASE.
+    :type pattern: str
+    :param encoding: The encoding of bytes and files. Defaults to "utf-8".
+    :type encoding: str
+    :param kwargs: Configuration passed to the converter constructor.
+    """
+
+    def __init__(self, case="snake", pattern=MIXED_CASE, encoding="utf-8", **kwargs):
+        convert = case_converter(case, **kwargs).convert
+
+        def convert_bytes(token):
+            return convert(token.decode(encoding)).encode(encoding)
+
+        self._pattern = pattern
+        self._re = re.compile(pattern)
+        self._bytes_re = None
+        self._tokens = KeyCache(convert, TOKEN_CACHE_SIZE, str, MAX_CACHED_LENGTH)
+        self._bytes_tokens = KeyCache(
+            convert_bytes, TOKEN_CACHE_SIZE, bytes, MAX_CACHED_LENGTH
+        )
+
+    def rewrite(self, s):
+        """Rewrite every token in a string.
+
+        :type s: str
+        :rtype: str
+        """
+        tokens = self._tokens
+        return self._re.sub(lambda m: tokens[m[0]], s)
+
+    def rewrite_stream(self, source, target, window=DEFAULT_WINDOW):
+        """Rewrite a text stream one window at a time.
+
+        Windows are cut after whitespace so no token spans two windows.
+
+        :param source: A text file open for reading.
+        :param target: A text file open for writing.
+        :param window: Characters read at a time.
+        :type window: int
+        """
+        carry = ""
+
+        for s in iter(lambda: source.read(window), ""):
+            s = carry + s
+            cut = max(s.rfind(c) for c in SEPARATORS) + 1
+            carry = s[cut:]
+
+            if cut:
+                target.write(self.rewrite(s[:cut]))
+
+        target.write(self.rewrite(carry))
+
+    def rewrite_bytes(self, data, window=DEFAULT_WINDOW):
+        """Rewrite every token in bytes, an mmap or another buffer.
+
+        The buffer is searched in place and the output is produced in pieces
+        of about one window.
+
+        :param data: A bytes-like object.
+        :param window: Approximate bytes per output piece.
+        :type window: int
+        :return: A generator of bytes.
+        """
+        if self._bytes_re is None:
+            self._bytes_re = re.compile(self._pattern.encode("ascii"))
+
+        tokens = self._bytes_tokens
+        parts = []
+        flushed = last = 0
+
+        for m in self._bytes_re.finditer(data):
+            start, end = m.span()
+
+            # Long runs without tokens are copied a window at a time.
+            while start - last >= window:
+                parts.append(data[last : last + window])
+                last += window
+                yield b"".join(parts)
+                parts = []
+                flushed = last
+
+            parts.append(data[last:start])
+            parts.append(tokens[m[0]])
+            last = end
+
+            if last - flushed >= window:
+                yield b"".join(parts)
+                parts = []
+                flushed = last
+
+        end = len(data)
+        while last < end:
+            parts.append(data[last : last + window])
+            last += window
+            yield b"".join(parts)
+            parts = []
+
+        if parts:
+            yield b"".join(parts)
+
+    def rewrite_file(self, path, target, window=DEFAULT_WINDOW):
+        """Rewrite a file, reading it through mmap.
+
+        :param path: The file to rewrite.
+        :param target: A binary file open for writing.
+        :param window: Approximate bytes written at a time.
+        :type window: int
+        """
+        with open(path, "rb") as f:
+            # Empty files cannot be mapped.
+            if not f.seek(0, 2):
+                return
+
+            with mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ) as data:
+                for piece in self.rewrite_bytes(data, window):
+                    target.write(piece)
@@ -0,0 +1,75 @@
+import io
+
+import pytest
+from .cache import MAX_CACHED_LENGTH
+from .scanner import IDENTIFIERS, MIXED_CASE, Rewriter
+
+TEXTS = [
+    ("", ""),
+    ("SELECT userId FROM userAccounts;", "SELECT user_id FROM user_accounts;"),
+    ("x = fooBar(baz) + FooBar.quxQuux", "x = foo_bar(baz) + foo_bar.qux_quux"),
+    ("user_id = userId", "user_id = user_id"),
+    ("écoleFoo fooÉcole fooBar2", "écoleFoo fooÉcole foo_bar2"),
+    ("getHTTPServer HTTPServer ALLCAPS", "get_httpserver HTTPServer ALLCAPS"),
+]
+
+
+@pytest.mark.parametrize("s, output", TEXTS)
+def test_rewrite(s, output):
+    assert Rewriter("snake").rewrite(s) == output
+
+
+@pytest.mark.parametrize("s, output", TEXTS)
+@pytest.mark.parametrize("window", [1, 4, 1000])
+def test_rewrite_bytes(s, output, window):
+    pieces = list(Rewriter("snake").rewrite_bytes(s.encode("utf-8"), window))
+
+    assert b"".join(pieces) == output.encode("utf-8")
+    assert all(pieces)
+
+
+@pytest.mark.parametrize("window", [1, 3, 1000])
+def test_rewrite_stream(window):
+    s = "\n".join(text for text, _ in TEXTS)
+    target = io.StringIO()
+
+    Rewriter("snake").rewrite_stream(io.StringIO(s), target, window)
+
+    assert target.getvalue() == "\n".join(output for _, output in TEXTS)
+
+
+@pytest.mark.parametrize("content", [b"", b"SELECT userId FROM userAccounts\n" * 50])
+def test_rewrite_file(tmp_path, content):
+    path = tmp_path / "dump.sql"
+    path.write_bytes(content)
+    target = io.BytesIO()
+
+    Rewriter("snake").rewrite_file(str(path), target, window=64)
+
+    assert target.getvalue() == content.replace(b"userId", b"user_id").replace(
+        b"userAccounts", b"user_accounts"
+    )
+
+
+@pytest.mark.parametrize(
+    "case, pattern, s, output",
+    [
+        ("camel", IDENTIFIERS, "user_id, created_at", "userId, createdAt"),
+        ("macro", MIXED_CASE, "maxSize = 1", "MAX_SIZE = 1"),
+        ("kebab", r"\$\w+", "$fooBar fooBar", "foo-bar fooBar"),
+    ],
+)
+def test_pattern(case, pattern, s, output):
+    assert Rewriter(case, pattern).rewrite(s) == output
+
+
+def test_long_tokens_are_not_cached():
+    rewriter = Rewriter("snake", IDENTIFIERS)
+    long = "fooBar" * MAX_CACHED_LENGTH
+
+    assert rewriter.rewrite("fooBar " + long) == "foo_bar " + long.replace("B", "_b")
+    assert b"".join(rewriter.rewrite_bytes(long.encode())) == b"foo_bar" * (
+        MAX_CACHED_LENGTH
+    )
+    assert list(rewriter._tokens) == ["fooBar"]
+    assert not rewriter._bytes_tokens
@@ -0,0 +1,217 @@
+"""Cases defined by a declarative CaseSpec instead of a converter class.
+
+A CaseSpec names the join written between words, how letters are cased and
+what happens to runs of capitals. SpecConverter turns a spec into boundary
+rules, so a spec converts with the compiled engine like the built-in cases.
+
+Specs are registered by name and every function taking a case name accepts
+a registered name.
+
+Example
+
+    register("dot", CaseSpec("."))
+    case_converter("dot").convert("helloWorld") => "hello.world"
+
+"""
+from collections import namedtuple
+
+from .caseconverter import CaseConverter, get_converter, lower
+from .boundaries import (
+    Rule,
+    RuleHandler,
+    INIT,
+    FIRST,
+    DELIMITER,
+    LOWER_UPPER,
+    UPPER_UPPER,
+)
+
+# Casings of letters.
+LOWER = "lower"
+UPPER = "upper"
+
+# What happens to an upper case letter following an upper case letter.
+MERGE = "merge"  # It is part of the word, cased like the rest of it.
+KEEP = "keep"  # It is written as it is, without a join.
+SPLIT = "split"  # It starts a new word.
+ACRONYMS = (MERGE, KEEP, SPLIT)
+
+TRANSFORMS = {None: None, LOWER: str.lower, UPPER: str.upper}
+
+CaseSpec = namedtuple(
+    "CaseSpec",
+    ["join", "case", "word", "first", "acronyms", "camel", "init"],
+    defaults=("", LOWER, None, None, MERGE, True, False),
+)
+CaseSpec.__doc__ = """Declarative definition of a case.
+
+:param join: String written between words. Defaults to "".
+:param case: Casing of letters, LOWER, UPPER or None to keep them as they
+    are. Defaults to LOWER.
+:param word: Casing of the first letter of every word but the first, or
+    None to case it like the other letters.
+:param first: Casing of the first letter of the string, or None to case it
+    like the first letter of any other word.
+:param acronyms: What happens to an upper case letter following an upper
+    case letter, one of MERGE, KEEP or SPLIT. Defaults to MERGE.
+:param camel: Whether an upper case letter following a lower case letter
+    starts a new word. Defaults to True.
+:param init: Whether the first letter is written before boundaries are
+    looked for, as Title does, so the second letter never starts a word.
+    Defaults to False.
+"""
+
+
+def spec_rules(spec):
+    """Describe the boundaries of a spec.
+
+    :type spec: CaseSpec
+    :rtype: list
+    """
+    for casing in (spec.case, spec.word, spec.first):
+        if casing not in TRANSFORMS:
+            raise ValueError("unknown casing: {}".format(casing))
+
+    if spec.acronyms not in ACRONYMS:
+        raise ValueError("unknown acronyms: {}".format(spec.acronyms))
+
+    word = TRANSFORMS[spec.case if spec.word is None else spec.word]
+    # Upper case letters are left unchanged by str.upper().
+    capital = None if word is str.upper else word
+
+    rules = []
+    if spec.init:
+        first = spec.case if spec.first is None else spec.first
+        rules.append(Rule(INIT, "", TRANSFORMS[first]))
+    elif spec.first is not None:
+        rules.append(Rule(FIRST, "", TRANSFORMS[spec.first]))
+
+    rules.append(Rule(DELIMITER, spec.join, word))
+
+    if spec.camel:
+        rules.append(Rule(LOWER_UPPER, spec.join, capital))
+
+    if spec.acronyms == KEEP:
+        rules.append(Rule(UPPER_UPPER, "", None))
+    elif spec.acronyms == SPLIT:
+        rules.append(Rule(UPPER_UPPER, spec.join, capital))
+
+    return rules
+
+
+class SpecConverter(CaseConverter):
+    """Convert strings to the case described by a CaseSpec.
+
+    Strings that are all upper case are lower cased first, or only have
+    their delimiters replaced for specs with upper case letters, as the
+    built-in cases do.
+
+    :param spec: The case to convert to.
+    :type spec: CaseSpec
+    """
+
+    def __init__(self, *args, spec=CaseSpec(), **kwargs):
+        self._spec = spec
+        self._rules = spec_rules(spec)
+        super(SpecConverter, self).__init__(*args, **kwargs)
+        self._config["spec"] = spec
+
+    def spec(self):
+        """Retrieve the spec.
+
+        :rtype: CaseSpec
+        """
+        return self._spec
+
+    def init(self, input_buffer, output_buffer):
+        rule = self._rules[0]
+        if rule.kind != INIT:
+            return
+
+        c = input_buffer.read(1)
+        output_buffer.write(c if rule.transform is None else rule.transform(c))
+
+    def define_boundaries(self):
+        for rule in self._rules:
+            if rule.kind != INIT:
+                self.add_boundary_handler(RuleHandler(rule, self.delimiters()))
+
+    def rules(self):
+        return list(self._rules)
+
+    def prepare_string(self, s):
+        return self.prepare_chunk(s, s.isupper())
+
+    def prepare_chunk(self, s, upper):
+        if upper and self._spec.case == LOWER:
+            return s.lower()
+
+        return s
+
+    def convert_upper(self, s):
+        spec = self._spec
+        if spec.case != UPPER or LOWER in (spec.word, spec.first):
+            return None
+
+        return self._delimiters_re.sub(spec.join, s)
+
+    def mutate(self, c):
+        return self.mutate_string(c)
+
+    def mutate_string(self, s):
+        if self._spec.case == LOWER:
+            return lower(s)
+
+        if self._spec.case == UPPER:
+            return s.upper()
+
+        return s
+
+    def mutation(self):
+        return TRANSFORMS[self._spec.case]
+
+
+# Cases registered out of the box. The built-in cases are converter
+# classes, see CASES in cases.py.
+SPECS = {
+    "dot": CaseSpec("."),
+    "path": CaseSpec("/"),
+    "train": CaseSpec("-", word=UPPER, first=UPPER),
+}
+
+# Built-in specs that cannot be replaced.
+BUILTIN_SPECS = frozenset(SPECS)
+
+
+def register(name, spec):
+    """Register a case spec by name.
+
+    Built-in cases and specs cannot be replaced.
+
+    :type name: str
+    :type spec: CaseSpec
+    """
+    # cases.py imports this module.
+    from .cases import CASES
+
+    if name in BUILTIN_SPECS or name in CASES:
+        raise ValueError("cannot replace built-in case: {}".format(name))
+
+    spec_rules(spec)
+    SPECS[name] = spec
+
+
+def spec_converter(spec, **kwargs):
+    """Retrieve the shared converter for a spec.
+
+    :param spec: A CaseSpec or the name of a registered spec.
+    :param kwargs: Configuration passed to the converter constructor.
+    :rtype: SpecConverter
+    """
+    if isinstance(spec, str):
+        try:
+            spec = SPECS[spec]
+        except KeyError:
+            raise ValueError("unknown case: {}".format(spec)) from None
+
+    return get_converter(SpecConverter, spec=spec, **kwargs)
@@ -0,0 +1,112 @@
+import pickle
+
+import pytest
+from . import *
+from .engine import BUFFER
+from .specs import SPECS, UPPER, KEEP, SPLIT, register, spec_converter
+
+INPUTS = [
+    "",
+    "Hello, world!",
+    "helloWorld",
+    "HTTPServer error",
+    "HELLO_WORLD",
+    " hello -__ world ",
+    "ΣΑΣ ΟΔΟΣ",
+    "straße Ⅷx",
+]
+
+
+# Specs describing the built-in cases, but alternating case.
+CASE_SPECS = {
+    "camel": CaseSpec("", word=UPPER),
+    "cobol": CaseSpec("-", UPPER),
+    "flat": CaseSpec(""),
+    "kebab": CaseSpec("-"),
+    "macro": CaseSpec("_", UPPER, acronyms=SPLIT),
+    "pascal": CaseSpec("", word=UPPER, first=UPPER, acronyms=KEEP),
+    "snake": CaseSpec("_"),
+    "title": CaseSpec(" ", word=UPPER, first=UPPER, init=True),
+}
+
+
+@pytest.mark.parametrize("case", sorted(CASE_SPECS))
+@pytest.mark.parametrize("input", INPUTS)
+@pytest.mark.parametrize("kwargs", [{}, {"delimiters": "|"}, {"engine": BUFFER}])
+def test_specs_match_cases(case, input, kwargs):
+    expected = get_converter(CASES[case], **kwargs).convert(input)
+
+    assert spec_converter(CASE_SPECS[case], **kwargs).convert(input) == expected
+
+
+@pytest.mark.parametrize(
+    "case, input, output",
+    [
+        ("dot", "Hello, world!", "hello.world"),
+        ("path", "helloWorld", "hello/world"),
+        ("train", "hello_world", "Hello-World"),
+        (CASE_SPECS["title"], "aB", "Ab"),
+        (CASE_SPECS["title"], " ,aBİ", "Abi̇"),
+    ],
+)
+def test_specs(case, input, output):
+    assert spec_converter(case).convert(input) == output
+
+
+@pytest.mark.parametrize(
+    "spec, output",
+    [
+        (CaseSpec("::"), "httpserver::error"),
+        (CaseSpec("_", UPPER, acronyms=KEEP), "HTTPSERVER_ERROR"),
+        (CaseSpec("_", acronyms=SPLIT), "h_t_t_p_server_error"),
+        (CaseSpec("-", None), "HTTPServer-error"),
+        (CaseSpec("-", None, word=UPPER), "HTTPServer-Error"),
+        (CaseSpec(" ", camel=False), "httpserver error"),
+        (CaseSpec("_", acronyms=SPLIT, init=True), "ht_t_p_server_error"),
+    ],
+)
+@pytest.mark.parametrize("engine", ["compiled", "table", "buffer"])
+def test_spec_options(spec, output, engine):
+    assert SpecConverter(spec=spec, engine=engine).convert("HTTPServer error") == output
+
+
+def test_register():
+    spec = CaseSpec("__", first=UPPER)
+    register("test_dunder", spec)
+
+    try:
+        assert case_converter("test_dunder").convert("helloWorld") == "Hello__world"
+        assert convert_many(["fooBar"], "test_dunder") == ["Foo__bar"]
+    finally:
+        del SPECS["test_dunder"]
+
+
+@pytest.mark.parametrize(
+    "name, spec",
+    [
+        ("snake", CaseSpec("_")),
+        ("alternating", CaseSpec("_")),
+        ("dot", CaseSpec("_")),
+        ("x", CaseSpec("_", "title")),
+        ("x", CaseSpec("_", acronyms="drop")),
+    ],
+)
+def test_register_invalid(name, spec):
+    with pytest.raises(ValueError):
+        register(name, spec)
+
+
+def test_unknown_spec():
+    with pytest.raises(ValueError):
+        case_converter("unknown")
+
+    with pytest.raises(ValueError):
+        spec_converter("snake")
+
+
+def test_spec_converter_pickles():
+    converter = spec_converter("train", delimiters="|")
+    restored = pickle.loads(pickle.dumps(converter))
+
+    assert restored.config() == converter.config()
+    assert restored.convert("hello|world") == "Hello-World"
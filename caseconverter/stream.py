@@ -0,0 +1,84 @@
+from collections import deque
+from concurrent.futures import ProcessPoolExecutor
+from itertools import islice
+
+from .batch import DEFAULT_CHUNKSIZE
+from .cache import MAX_CACHED_LENGTH
+from .cases import case_converter
+from .keys import KeyCache
+
+# Number of distinct lines remembered while converting a stream.
+LINE_CACHE_SIZE = 65536
+
+
+def convert_lines(
+    lines, case="snake", workers=1, chunksize=DEFAULT_CHUNKSIZE, **kwargs
+):
+    """Lazily convert every line of an iterable, such as a file object.
+
+    Line endings are preserved. Lines are read as they are needed so memory
+    use does not depend on the number of lines. Lines longer than
+    MAX_CACHED_LENGTH are not remembered between repeats.
+
+    With more than one worker, chunks of `chunksize` lines are converted in
+    worker processes. At most two chunks per worker are in flight at a time
+    and lines are yielded in input order.
+
+    Example
+
+        list(convert_lines(["Hello World\\n", "fooBar"], "snake"))
+            => ["hello_world\\n", "foo_bar"]
+
+    :param lines: An iterable of strings.
+    :param case: A case name, see CASES. Defaults to "snake".
+    :type case: str
+    :param workers: Number of worker processes. Defaults to 1, converting
+        in the calling process.
+    :type workers: int
+    :param chunksize: Number of lines per worker task.
+    :type chunksize: int
+    :param kwargs: Configuration passed to the converter constructor.
+    :return: A generator of converted lines.
+    """
+    converter = case_converter(case, **kwargs)
+
+    if workers <= 1:
+        return convert_line_iter(converter, lines)
+
+    return convert_line_chunks(converter, lines, workers, chunksize)
+
+
+def convert_line_iter(converter, lines):
+    converted = KeyCache(
+        converter.convert, LINE_CACHE_SIZE, maxlength=MAX_CACHED_LENGTH
+    )
+
+    for line in lines:
+        body = line.rstrip("\r\n")
+        if len(body) == len(line):
+            yield converted[line]
+        else:
+            yield converted[body] + line[len(body) :]
+
+
+def convert_line_chunks(converter, lines, workers, chunksize):
+    lines = iter(lines)
+    pending = deque()
+
+    with ProcessPoolExecutor(max_workers=workers) as executor:
+        for chunk in iter(lambda: list(islice(lines, chunksize)), []):
+            pending.append(executor.submit(convert_line_chunk, converter, chunk))
+
+            if len(pending) >= workers * 2:
+                yield from pending.popleft().result()
+
+        while pending:
+            yield from pending.popleft().result()
+
+
+def convert_line_chunk(converter, lines):
+    """Convert a chunk of lines, run by worker processes.
+
+    :rtype: list
+    """
+    return list(convert_line_iter(converter, lines))
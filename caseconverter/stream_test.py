@@ -0,0 +1,64 @@
+import io
+
+import pytest
+from .cache import MAX_CACHED_LENGTH
+from .stream import convert_line_iter, convert_lines
+
+
+@pytest.mark.parametrize(
+    "lines, case, kwargs, output",
+    [
+        (["Hello World\n", "fooBar"], "snake", {}, ["hello_world\n", "foo_bar"]),
+        (["a b\r\n", "\n", "a b\r\n"], "macro", {}, ["A_B\r\n", "\n", "A_B\r\n"]),
+        (
+            io.StringIO("helloWorld\nfoo-bar\n"),
+            "title",
+            {},
+            ["Hello World\n", "Foo Bar\n"],
+        ),
+        (
+            ["Hello, world!\n"],
+            "camel",
+            {"strip_punctuation": False},
+            ["hello,World!\n"],
+        ),
+        ([], "snake", {}, []),
+    ],
+)
+def test_convert_lines(lines, case, kwargs, output):
+    assert list(convert_lines(lines, case, **kwargs)) == output
+
+
+def test_convert_lines_is_lazy():
+    lines = convert_lines(iter(["a b\n", None]))
+
+    assert next(lines) == "a_b\n"
+
+
+@pytest.mark.parametrize("chunksize", [1, 3, 100])
+def test_convert_lines_parallel(chunksize):
+    lines = ["helloWorld {}\n".format(i) for i in range(50)]
+
+    assert list(convert_lines(lines, "kebab", workers=2, chunksize=chunksize)) == [
+        "hello-world-{}\n".format(i) for i in range(50)
+    ]
+
+
+def test_long_lines_are_not_cached():
+    calls = []
+
+    class Converter(object):
+        def convert(self, s):
+            calls.append(s)
+            return s.upper()
+
+    long = "a" * (MAX_CACHED_LENGTH + 1)
+    lines = ["a\n", long + "\n", "a\n", long]
+
+    assert list(convert_line_iter(Converter(), lines)) == [
+        "A\n",
+        long.upper() + "\n",
+        "A\n",
+        long.upper(),
+    ]
+    assert calls == ["a", long, long]
@@ -1,5 +1,13 @@
-from .caseconverter import CaseConverter
-from .boundaries import OnDelimeterUppercaseNext, BoundaryHandler
+from .caseconverter import CaseConverter, get_converter, handler_rule, lower
+from .cache import memoize
+from .boundaries import (
+    OnDelimeterUppercaseNext,
+    BoundaryHandler,
+    Rule,
+    INIT,
+    DELIMITER,
+    LOWER_UPPER,
+)
 
 
 class Title(CaseConverter):
@@ -13,14 +21,37 @@ class Title(CaseConverter):
         # Handle camelCase -> Title Case
         self.add_boundary_handler(OnUpperPrecededByLowerAddSpace())
 
+    def rules(self):
+        rules = [handler_rule(bh) for bh in self._boundary_handlers]
+        if None in rules:
+            return None
+
+        # init() capitalizes the first character.
+        return [Rule(INIT, "", str.upper)] + rules
+
     def prepare_string(self, s):
         if s.isupper():
             return s.lower()
         return s
 
+    def prepare_chunk(self, s, upper):
+        return s.lower() if upper else s
+
     def mutate(self, c):
         return c.lower()
 
+    def mutate_string(self, s):
+        return lower(s)
+
+    def fixpoint(self):
+        if " " not in self.delimiters():
+            return None
+
+        return r"[A-Z0-9][a-z0-9]*(?: [A-Z0-9][a-z0-9]*)*"
+
+    def mutation(self):
+        return str.lower
+
 
 # Boundary handler that preserves spaces
 class OnDelimeterPreserveAndUpperNext(OnDelimeterUppercaseNext):
@@ -34,6 +65,9 @@ class OnDelimeterPreserveAndUpperNext(OnDelimeterUppercaseNext):
         # Get and capitalize the next character
         output_buffer.write(input_buffer.read(1).upper())
 
+    def rule(self):
+        return Rule(DELIMITER, " ", str.upper)
+
 
 # New boundary handler for camelCase
 class OnUpperPrecededByLowerAddSpace(BoundaryHandler):
@@ -44,7 +78,11 @@ class OnUpperPrecededByLowerAddSpace(BoundaryHandler):
         output_buffer.write(" ")
         output_buffer.write(cc)
 
+    def rule(self):
+        return Rule(LOWER_UPPER, " ", None)
+
 
+@memoize
 def titlecase(s, **kwargs):
     """Convert a string to title case.
 
@@ -53,4 +91,4 @@ def titlecase(s, **kwargs):
         hello-world => Hello World
         helloWorld => Hello World
     """
-    return Title(s, **kwargs).convert()
+    return get_converter(Title, **kwargs).convert(s)
@@ -0,0 +1,234 @@
+"""Trace hooks observing conversions.
+
+A hook is told about every boundary a converter handles and about every
+conversion done with CaseConverter.convert(), or a case function, with its
+duration.
+
+Conversions pay nothing for tracing while no hook is registered: adding the
+first hook replaces CaseConverter.convert() and the engine dispatch with
+traced versions, removing the last hook restores them.
+
+Example
+
+    with traced(Statistics()) as statistics:
+        snakecase("helloWorld")
+
+    statistics.hits() => {"OnUpperPrecededByLowerAppendLower": 1}
+    statistics.histogram("Snake") => [(16384, 1)]
+
+"""
+from collections import Counter, defaultdict
+from contextlib import contextmanager
+from threading import Lock
+from time import perf_counter
+
+from .boundaries import INIT, FIRST
+from .caseconverter import CaseConverter, decode
+
+_lock = Lock()
+
+# The registered hooks, replaced rather than mutated so conversions running
+# in other threads iterate a consistent tuple.
+_hooks = ()
+
+_convert = CaseConverter.convert
+_dispatch = CaseConverter._convert
+
+
+class TraceHook(object):
+    """Base class of trace hooks, ignoring every event.
+
+    Hooks are called from the converting thread, possibly from several
+    threads at once.
+    """
+
+    def boundary(self, converter, handler, position):
+        """A boundary has been handled.
+
+        With the table engines, the boundaries of a string are found again
+        after converting it, so they are reported once the conversion is
+        done.
+
+        :param converter: The converter.
+        :type converter: CaseConverter
+        :param handler: The handler of the boundary.
+        :type handler: BoundaryHandler
+        :param position: The position of the boundary in the prepared
+            string.
+        :type position: int
+        """
+
+    def conversion(self, converter, s, result, seconds):
+        """A string has been converted.
+
+        :param converter: The converter.
+        :type converter: CaseConverter
+        :param s: The raw string.
+        :type s: str
+        :param result: The converted string.
+        :type result: str
+        :param seconds: The duration of the conversion.
+        :type seconds: float
+        """
+
+
+class Statistics(TraceHook):
+    """Count the boundaries of each handler and time each case.
+
+    Durations are counted in buckets of powers of two nanoseconds, for each
+    converter class.
+    """
+
+    def __init__(self):
+        self._lock = Lock()
+        self._hits = Counter()
+        self._timings = defaultdict(Counter)
+
+    def boundary(self, converter, handler, position):
+        with self._lock:
+            self._hits[type(handler).__name__] += 1
+
+    def conversion(self, converter, s, result, seconds):
+        bucket = 1 << int(seconds * 1e9).bit_length()
+
+        with self._lock:
+            self._timings[type(converter).__name__][bucket] += 1
+
+    def hits(self):
+        """Count the boundaries handled by each handler class.
+
+        :rtype: dict
+        """
+        with self._lock:
+            return dict(self._hits)
+
+    def histogram(self, case):
+        """Count the conversions of a converter class by duration.
+
+        :param case: The converter class name, e.g. "Snake".
+        :type case: str
+        :return: (nanoseconds, count) tuples in increasing order, counting
+            the conversions shorter than the nanoseconds and at least half
+            as long.
+        :rtype: list
+        """
+        with self._lock:
+            return sorted(self._timings.get(case, {}).items())
+
+    def cases(self):
+        """List the converter classes with timed conversions.
+
+        :rtype: list
+        """
+        with self._lock:
+            return sorted(self._timings)
+
+    def reset(self):
+        """Forget every count."""
+        with self._lock:
+            self._hits.clear()
+            self._timings.clear()
+
+
+def _traced_convert(self, s):
+    if not isinstance(s, str):
+        return self.convert(decode(s)).encode("utf-8")
+
+    start = perf_counter()
+    result = _convert(self, s)
+    seconds = perf_counter() - start
+
+    for hook in _hooks:
+        hook.conversion(self, s, result, seconds)
+
+    return result
+
+
+def _traced_dispatch(self, s, cache=None, profile=None):
+    hooks = _hooks
+    if self._table_convert is None:
+        return self._convert_buffer(s, hooks)
+
+    result = self._table_convert(s, cache, profile)
+
+    # Tables keep the first rule of each kind, as do the handlers here.
+    # Converters describing their rules without handlers have no boundary.
+    handlers = {}
+    for handler in self._boundary_handlers:
+        rule = handler.rule()
+        if rule is not None:
+            handlers.setdefault(rule.kind, handler)
+
+    # The first character is converted by an INIT or FIRST rule, if any,
+    # see Table.convert(). init() is not a boundary handler.
+    kinds = {rule.kind for rule in self.rules()}
+    start = 0
+    if s and (INIT in kinds or FIRST in kinds):
+        start = 1
+        if INIT not in kinds and FIRST in handlers:
+            for hook in hooks:
+                hook.boundary(self, handlers[FIRST], 0)
+
+    table = self._table
+    for position, rule in table.boundaries(table.segment(s, cache), start):
+        for hook in hooks:
+            hook.boundary(self, handlers[rule.kind], position)
+
+    return result
+
+
+def add_hook(hook):
+    """Register a trace hook.
+
+    :type hook: TraceHook
+    """
+    global _hooks
+
+    with _lock:
+        if not _hooks:
+            CaseConverter.convert = _traced_convert
+            CaseConverter._convert = _traced_dispatch
+
+        _hooks += (hook,)
+
+
+def remove_hook(hook):
+    """Unregister a trace hook.
+
+    :type hook: TraceHook
+    """
+    global _hooks
+
+    with _lock:
+        if hook not in _hooks:
+            raise ValueError("hook not registered: {!r}".format(hook))
+
+        hooks = list(_hooks)
+        hooks.remove(hook)
+        _hooks = tuple(hooks)
+
+        if not _hooks:
+            CaseConverter.convert = _convert
+            CaseConverter._convert = _dispatch
+
+
+def hooks():
+    """List the registered trace hooks.
+
+    :rtype: tuple
+    """
+    return _hooks
+
+
+@contextmanager
+def traced(hook):
+    """Register a trace hook for the duration of a with block.
+
+    :type hook: TraceHook
+    :return: The hook.
+    """
+    add_hook(hook)
+    try:
+        yield hook
+    finally:
+        remove_hook(hook)
@@ -0,0 +1,82 @@
+import pytest
+from . import *
+from .caseconverter import CaseConverter
+from .trace import TraceHook, Statistics, add_hook, remove_hook, hooks, traced
+
+
+class Recorder(TraceHook):
+    def __init__(self):
+        self.events = []
+
+    def boundary(self, converter, handler, position):
+        self.events.append((type(handler).__name__, position))
+
+    def conversion(self, converter, s, result, seconds):
+        self.events.append((s, result))
+
+
+@pytest.mark.parametrize(
+    "case, s",
+    [
+        ("snake", "helloWorld foo"),
+        ("pascal", "HTTPServer foo_bar"),
+        ("title", "hello_World"),
+        ("flat", "_a-A"),
+        ("alternating", "hello world"),
+    ],
+)
+def test_engines_report_the_same_boundaries(case, s):
+    events = []
+    for engine in ("table", "compiled", "buffer"):
+        with traced(Recorder()) as recorder:
+            case_converter(case, engine=engine).convert(s)
+        events.append(recorder.events)
+
+    assert events[0] == events[1] == events[2]
+
+
+def test_recorder():
+    with traced(Recorder()) as recorder:
+        Snake().convert("helloWorld foo")
+
+    assert recorder.events == [
+        ("OnUpperPrecededByLowerAppendLower", 5),
+        ("OnDelimeterLowercaseNext", 10),
+        ("helloWorld foo", "hello_world_foo"),
+    ]
+
+
+def test_statistics():
+    with traced(Statistics()) as statistics:
+        Snake().convert("helloWorld")
+        Snake().convert(b"fooBar")
+        Camel().convert("foo_bar")
+
+    assert statistics.hits() == {
+        "OnUpperPrecededByLowerAppendLower": 2,
+        "OnDelimeterUppercaseNext": 1,
+    }
+    assert statistics.cases() == ["Camel", "Snake"]
+    assert sum(count for _, count in statistics.histogram("Snake")) == 2
+    assert statistics.histogram("Kebab") == []
+
+    statistics.reset()
+    assert statistics.hits() == {}
+
+
+def test_hooks_are_removed():
+    convert = CaseConverter.convert
+    first, second = TraceHook(), TraceHook()
+
+    add_hook(first)
+    add_hook(second)
+    assert hooks() == (first, second)
+    assert CaseConverter.convert is not convert
+
+    remove_hook(first)
+    remove_hook(second)
+    assert hooks() == ()
+    assert CaseConverter.convert is convert
+
+    with pytest.raises(ValueError):
+        remove_hook(first)
@@ -0,0 +1,141 @@
+from collections.abc import Mapping, Sequence
+
+from .cases import case_converter
+from .keys import KeyCache
+
+
+class CaseMappingView(Mapping):
+    """A read-only view of a dict with converted keys.
+
+    Nothing is copied. The keys are converted and an index from converted to
+    original keys is built on first access, after which lookups are a pair
+    of dict lookups. Nested dicts, lists and tuples are wrapped in views when
+    they are first accessed. If two keys convert to the same key the last
+    one wins, as with convert_keys().
+
+    Example
+
+        view = CaseMappingView({"user_id": 1, "tags": [{"tag_name": "a"}]})
+        view["userId"] => 1
+        view["tags"][0]["tagName"] => "a"
+
+    :param mapping: The dict to view.
+    :type mapping: dict
+    :param case: A case name, see CASES. Defaults to "camel".
+    :type case: str
+    :param key_cache: A KeyCache shared with other views. Overrides case and
+        kwargs.
+    :type key_cache: KeyCache
+    :param kwargs: Configuration passed to the converter constructor.
+    """
+
+    def __init__(self, mapping, case="camel", key_cache=None, **kwargs):
+        if key_cache is None:
+            key_cache = KeyCache(case_converter(case, **kwargs).convert)
+
+        self._mapping = mapping
+        self._key_cache = key_cache
+        self._index = None
+        self._views = {}
+
+    def index(self):
+        """Retrieve the index from converted to original keys.
+
+        :rtype: dict
+        """
+        if self._index is None:
+            converted = self._key_cache
+            self._index = {converted[key]: key for key in self._mapping}
+
+        return self._index
+
+    def __getitem__(self, key):
+        original = self.index()[key]
+
+        try:
+            return self._views[original]
+        except KeyError:
+            pass
+
+        value = self._mapping[original]
+        view = wrap(value, self._key_cache)
+        if view is not value:
+            self._views[original] = view
+
+        return view
+
+    def __iter__(self):
+        return iter(self.index())
+
+    def __len__(self):
+        return len(self.index())
+
+    def __contains__(self, key):
+        return key in self.index()
+
+    def __repr__(self):
+        return "{}({!r})".format(type(self).__name__, dict(self))
+
+
+class CaseSequenceView(Sequence):
+    """A read-only view of a list or tuple whose dicts have converted keys.
+
+    Items are wrapped in views when they are first accessed.
+
+    :param sequence: The list or tuple to view.
+    :param key_cache: The KeyCache of the parent view.
+    :type key_cache: KeyCache
+    """
+
+    def __init__(self, sequence, key_cache):
+        self._sequence = sequence
+        self._key_cache = key_cache
+        self._views = {}
+
+    def __getitem__(self, index):
+        if isinstance(index, slice):
+            return [self[i] for i in range(*index.indices(len(self._sequence)))]
+
+        if index < 0:
+            index += len(self._sequence)
+
+        try:
+            return self._views[index]
+        except KeyError:
+            pass
+
+        value = self._sequence[index]
+        view = wrap(value, self._key_cache)
+        if view is not value:
+            self._views[index] = view
+
+        return view
+
+    def __len__(self):
+        return len(self._sequence)
+
+    def __eq__(self, other):
+        if not isinstance(other, Sequence) or isinstance(other, (str, bytes)):
+            return NotImplemented
+
+        return len(self) == len(other) and all(a == b for a, b in zip(self, other))
+
+    __hash__ = None
+
+    def __repr__(self):
+        return "{}({!r})".format(type(self).__name__, list(self))
+
+
+def wrap(value, key_cache):
+    """Wrap dicts, lists and tuples in views, return anything else unchanged.
+
+    :param key_cache: Converts keys for the views.
+    :type key_cache: KeyCache
+    """
+    if isinstance(value, dict):
+        return CaseMappingView(value, key_cache=key_cache)
+
+    if isinstance(value, (list, tuple)):
+        return CaseSequenceView(value, key_cache)
+
+    return value
@@ -0,0 +1,41 @@
+import pytest
+from . import *
+
+PAYLOAD = {
+    "user_id": 1,
+    "tags": [{"tag_name": "a"}, ({"tag_name": "b"},)],
+    "address": {"post_code": "x"},
+}
+
+
+def test_mapping_view():
+    view = CaseMappingView(PAYLOAD)
+
+    assert len(view) == 3
+    assert list(view) == ["userId", "tags", "address"]
+    assert "userId" in view
+    assert "user_id" not in view
+    assert view["userId"] == 1
+    assert view["address"]["postCode"] == "x"
+    assert view["tags"][0]["tagName"] == "a"
+    assert view["tags"][-1][0]["tagName"] == "b"
+    assert [tag["tagName"] for tag in view["tags"][:1]] == ["a"]
+    assert view.get("missing") is None
+
+
+@pytest.mark.parametrize("case", ["camel", "macro", "kebab"])
+def test_mapping_view_equals_convert_keys(case):
+    assert CaseMappingView(PAYLOAD, case) == convert_keys(PAYLOAD, case)
+
+
+def test_mapping_view_is_lazy():
+    view = CaseMappingView(PAYLOAD, "snake")
+
+    assert view.index() is view.index()
+    assert view["address"] is view["address"]
+    assert view["tags"][0] is view["tags"][0]
+
+
+def test_mapping_view_missing_key():
+    with pytest.raises(KeyError):
+        CaseMappingView(PAYLOAD)["user_id"]
@@ -11,6 +11,9 @@ setup(
     version="1.0.5-rc",
     url="https://github.com/chrisdoherty4/python-case-converter",
     packages=find_packages(exclude=["*_test.py"]),
+    entry_points={
+        "console_scripts": ["caseconverter=caseconverter.cli:main"],
+    },
     author="Chris Doherty",
     author_email="chris@chrisdoherty.io",
     description="A string case conversion package.",